@@ -2,9 +2,14 @@
 API routers for the Expert Networks application.
 
 Each module contains related endpoints organized by domain:
+- auth: Session logout and session cache stats
+- admin: Query statistics and slow-query introspection
 - vendors: Vendor platform management
 - projects: Project CRUD operations
 - campaigns: Campaign management and vendor enrollment
-- experts: Expert proposal and screening
-- interviews: Interview scheduling and notes
+- experts: Expert proposal, screening, ranked shortlists and similar experts
+- interviews: Interview scheduling, notes, double-booking checks and slot suggestions
+- sync: Campaign delta-sync feed (changes since a cursor, with tombstones)
+- events: Server-Sent Events stream of live campaign change hints
+- dedup: Cross-vendor duplicate expert groups
 """
@@ -0,0 +1,74 @@
+"""
+Admin API endpoints.
+
+Operational introspection for this worker process: per-statement query
+statistics collected by query_stats.py. The statements and timings describe
+every tenant's traffic, so the endpoints answer 404 unless
+QUERY_STATS_ADMIN_ENABLED=true.
+"""
+
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from auth.better_auth import get_current_user, User
+from models.common import SuccessResponse
+from query_stats import get_query_stats
+
+# Expose the admin endpoints (off by default: they are not tenant-scoped)
+QUERY_STATS_ADMIN_ENABLED = os.getenv('QUERY_STATS_ADMIN_ENABLED', 'false').lower() == 'true'
+
+
+def require_admin_enabled():
+    """Hide the admin endpoints unless QUERY_STATS_ADMIN_ENABLED is set."""
+    if not QUERY_STATS_ADMIN_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin_enabled)],
+)
+
+
+@router.get(
+    "/query-stats",
+    summary="Query statistics",
+    description="Per-fingerprint latency histograms, rows returned and pool-wait time for this worker."
+)
+async def query_stats(
+    sort: str = Query("total_ms", pattern="^(total_ms|mean_ms|max_ms|calls|slow_calls|errors)$", description="Sort key"),
+    limit: int = Query(50, ge=1, le=500, description="Number of statements to return"),
+    user: User = Depends(get_current_user)
+):
+    """
+    Get query statistics for this worker.
+
+    Collection is off unless QUERY_STATS_SAMPLE_RATE or SLOW_QUERY_MS is set;
+    `enabled` in the response says which.
+
+    Args:
+        sort: Field to sort statements by (descending)
+        limit: Maximum statements to return
+
+    Returns:
+        Sampling settings, pool-wait histogram and the top statements
+    """
+    return get_query_stats().snapshot(sort=sort, limit=limit)
+
+
+@router.post(
+    "/query-stats/reset",
+    response_model=SuccessResponse,
+    summary="Reset query statistics",
+    description="Clear the query statistics collected by this worker."
+)
+async def reset_query_stats(user: User = Depends(get_current_user)):
+    """
+    Reset query statistics for this worker.
+
+    Returns:
+        Success message
+    """
+    get_query_stats().reset()
+    return SuccessResponse(success=True, message="Query statistics reset")
@@ -0,0 +1,76 @@
+"""
+Auth API endpoints.
+
+Session lifecycle hooks for the Better Auth integration. Sign-in and sign-up
+are handled by Better Auth on the frontend; the backend only needs to know
+about logouts so its session cache does not keep serving a revoked token.
+"""
+
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Header
+from auth.better_auth import (
+    get_current_user,
+    User,
+    invalidate_session,
+    parse_bearer_token,
+)
+from auth.session_cache import get_session_cache
+from models.common import SuccessResponse
+from db import get_db
+from api.admin import require_admin_enabled
+
+router = APIRouter(prefix="/api/auth", tags=["Auth"])
+
+
+@router.post(
+    "/logout",
+    response_model=SuccessResponse,
+    summary="Log out the current session",
+    description="Revoke the bearer token's session and drop it from the backend session cache."
+)
+async def logout(authorization: Optional[str] = Header(None)):
+    """
+    Log out the current session.
+
+    Deletes the Better Auth session row and invalidates the cached lookup, so
+    the token stops working immediately on this worker (other workers follow
+    within the session cache TTL).
+
+    Raises:
+        401: Missing or malformed bearer token
+    """
+    token = parse_bearer_token(authorization)
+    if not token:
+        raise HTTPException(status_code=401, detail="Missing or invalid authorization header")
+
+    try:
+        async with get_db() as conn:
+            await conn.execute("DELETE FROM public.session WHERE token = $1", token)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to log out: {str(e)}")
+    finally:
+        invalidate_session(token)
+
+    return SuccessResponse(success=True, message="Logged out successfully")
+
+
+@router.get(
+    "/session-cache",
+    summary="Session cache statistics",
+    description="Hit/miss counters for the in-process Better Auth session cache.",
+    # Per-worker internals: served only with the admin endpoints enabled
+    dependencies=[Depends(require_admin_enabled)]
+)
+async def session_cache_stats(user: User = Depends(get_current_user)):
+    """
+    Get session cache statistics for this worker.
+
+    Answers 404 unless QUERY_STATS_ADMIN_ENABLED=true, like /api/admin.
+
+    Returns:
+        Cache size and hit/miss/eviction counters, or enabled=false
+    """
+    cache = get_session_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
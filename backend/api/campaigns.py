@@ -6,7 +6,8 @@ and vendor enrollments. All operations require authentication and are scoped to
 """
 
 from typing import List
-from fastapi import APIRouter, HTTPException, Depends
+import asyncpg
+from fastapi import APIRouter, HTTPException, Depends, Request
 from auth.better_auth import get_current_user, User
 from models.campaign import (
     CampaignCreate,
@@ -18,55 +19,78 @@ from models.campaign import (
 )
 from models.common import SuccessResponse, ErrorResponse
 from db import (
-    get_campaign,
     get_user_campaigns,
     insert_and_return,
     update_and_return,
     enroll_vendor,
     execute_query,
-    get_db,
+    user_owns_campaign,
+    request_connection,
+    register_warmup_statement,
+    user_campaigns_validator,
 )
+from fast_json import dumps
+from http_cache import LIST_CACHE_CONTROL, conditional_response, not_modified, request_matches, validator_etag
+from vendor_cache import get_vendor_catalog
 
 router = APIRouter(prefix="/api/campaigns", tags=["Campaigns"])
 
 
+# The campaign list is the first call the frontend makes; prepared at startup
+LIST_CAMPAIGNS_QUERY = """
+    SELECT
+        c.*,
+        p.project_name,
+        p.project_code,
+        COALESCE(cc.expert_count, 0) as expert_count,
+        COALESCE(cc.interview_count, 0) as interview_count,
+        COALESCE(cc.vendor_enrollment_count, 0) as vendor_enrollment_count
+    FROM expert_network.campaigns c
+    LEFT JOIN expert_network.projects p ON c.project_id = p.id
+    LEFT JOIN expert_network.campaign_counters cc ON c.id = cc.campaign_id
+    WHERE c.user_id = $1
+    ORDER BY c.display_order, c.created_at DESC
+"""
+register_warmup_statement(LIST_CAMPAIGNS_QUERY)
+
+
 @router.get(
     "",
     response_model=CampaignListResponse,
     summary="List user's campaigns",
-    description="Get all campaigns for the authenticated user with aggregated counts."
+    description="Get all campaigns for the authenticated user with aggregated counts.",
+    responses={304: {"description": "Not modified (If-None-Match matched the current ETag)"}}
 )
-async def list_campaigns(user: User = Depends(get_current_user)):
+async def list_campaigns(
+    request: Request,
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
+):
     """
     List all campaigns for the authenticated user.
 
     Returns campaigns with expert counts, interview counts, and vendor enrollment
-    counts, sorted by display order and creation date.
+    counts, sorted by display order and creation date. Counts come from the
+    trigger-maintained campaign_counters table (migration 005).
+
+    Supports conditional GET: the ETag is derived from a cheap change
+    validator, so a poll with a current If-None-Match gets a 304 without
+    running the list query.
     """
     try:
-        campaigns = await execute_query(
-            """
-            SELECT
-                c.*,
-                p.project_name,
-                p.project_code,
-                COUNT(DISTINCT e.id) as expert_count,
-                COUNT(DISTINCT i.id) as interview_count,
-                COUNT(DISTINCT cve.id) as vendor_enrollment_count
-            FROM expert_network.campaigns c
-            LEFT JOIN expert_network.projects p ON c.project_id = p.id
-            LEFT JOIN expert_network.experts e ON c.id = e.campaign_id
-            LEFT JOIN expert_network.interviews i ON c.id = i.campaign_id
-            LEFT JOIN expert_network.campaign_vendor_enrollments cve ON c.id = cve.campaign_id
-            WHERE c.user_id = $1
-            GROUP BY c.id, p.project_name, p.project_code
-            ORDER BY c.display_order, c.created_at DESC
-            """,
-            user.user_id,
-            fetch_all=True
+        validator = await user_campaigns_validator(user.user_id, conn=conn)
+        etag = validator_etag(request, user.user_id, validator)
+        if request_matches(request, etag):
+            return not_modified(etag, LIST_CACHE_CONTROL)
+
+        campaigns = await execute_query(LIST_CAMPAIGNS_QUERY, user.user_id, fetch_all=True, conn=conn)
+
+        return conditional_response(
+            request,
+            dumps(CampaignListResponse(campaigns=campaigns, total=len(campaigns))),
+            etag=etag,
+            cache_control=LIST_CACHE_CONTROL,
         )
-
-        return CampaignListResponse(campaigns=campaigns, total=len(campaigns))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch campaigns: {str(e)}")
 
@@ -78,7 +102,11 @@ async def list_campaigns(user: User = Depends(get_current_user)):
     description="Get detailed information about a specific campaign.",
     responses={404: {"description": "Campaign not found", "model": ErrorResponse}}
 )
-async def get_campaign_detail(campaign_id: str, user: User = Depends(get_current_user)):
+async def get_campaign_detail(
+    campaign_id: str,
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
+):
     """
     Get details for a specific campaign.
 
@@ -98,20 +126,18 @@ async def get_campaign_detail(campaign_id: str, user: User = Depends(get_current
                 c.*,
                 p.project_name,
                 p.project_code,
-                COUNT(DISTINCT e.id) as expert_count,
-                COUNT(DISTINCT i.id) as interview_count,
-                COUNT(DISTINCT cve.id) as vendor_enrollment_count
+                COALESCE(cc.expert_count, 0) as expert_count,
+                COALESCE(cc.interview_count, 0) as interview_count,
+                COALESCE(cc.vendor_enrollment_count, 0) as vendor_enrollment_count
             FROM expert_network.campaigns c
             LEFT JOIN expert_network.projects p ON c.project_id = p.id
-            LEFT JOIN expert_network.experts e ON c.id = e.campaign_id
-            LEFT JOIN expert_network.interviews i ON c.id = i.campaign_id
-            LEFT JOIN expert_network.campaign_vendor_enrollments cve ON c.id = cve.campaign_id
+            LEFT JOIN expert_network.campaign_counters cc ON c.id = cc.campaign_id
             WHERE c.id = $1 AND c.user_id = $2
-            GROUP BY c.id, p.project_name, p.project_code
             """,
             campaign_id,
             user.user_id,
-            fetch_one=True
+            fetch_one=True,
+            conn=conn
         )
 
         if not campaign:
@@ -133,7 +159,8 @@ async def get_campaign_detail(campaign_id: str, user: User = Depends(get_current
 )
 async def create_campaign(
     campaign_data: CampaignCreate,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
     Create a new campaign.
@@ -155,7 +182,8 @@ async def create_campaign(
                 "SELECT id FROM expert_network.projects WHERE id = $1 AND user_id = $2",
                 campaign_data.project_id,
                 user.user_id,
-                fetch_one=True
+                fetch_one=True,
+                conn=conn
             )
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
@@ -164,7 +192,8 @@ async def create_campaign(
         max_order = await execute_query(
             "SELECT COALESCE(MAX(display_order), 0) as max_order FROM expert_network.campaigns WHERE user_id = $1",
             user.user_id,
-            fetch_one=True
+            fetch_one=True,
+            conn=conn
         )
 
         # Create campaign
@@ -184,7 +213,8 @@ async def create_campaign(
                 "min_calls": campaign_data.min_calls,
                 "max_calls": campaign_data.max_calls,
                 "display_order": max_order["max_order"] + 1
-            }
+            },
+            conn=conn
         )
 
         # Add zero counts for new campaign
@@ -211,7 +241,8 @@ async def create_campaign(
 async def update_campaign(
     campaign_id: str,
     campaign_data: CampaignUpdate,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
     Update a campaign.
@@ -247,7 +278,8 @@ async def update_campaign(
                 "SELECT id FROM expert_network.projects WHERE id = $1 AND user_id = $2",
                 update_fields["project_id"],
                 user.user_id,
-                fetch_one=True
+                fetch_one=True,
+                conn=conn
             )
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
@@ -259,14 +291,15 @@ async def update_campaign(
             "campaigns",
             update_fields,
             where="id = $1::uuid AND user_id = $2::text",
-            where_params=[campaign_id, user.user_id]
+            where_params=[campaign_id, user.user_id],
+            conn=conn
         )
 
         if not updated:
             raise HTTPException(status_code=404, detail="Campaign not found")
 
-        # Fetch with aggregated counts
-        campaign = await get_campaign_detail(campaign_id, user)
+        # Fetch with aggregated counts (same connection)
+        campaign = await get_campaign_detail(campaign_id, user, conn)
         return campaign
     except HTTPException:
         raise
@@ -298,23 +331,16 @@ async def delete_campaign(campaign_id: str, user: User = Depends(get_current_use
         404: Campaign not found or not owned by user
     """
     try:
-        async with get_db() as conn:
-            async with conn.transaction():
-                # Verify campaign exists and belongs to user
-                campaign = await conn.fetchrow(
-                    "SELECT id FROM expert_network.campaigns WHERE id = $1 AND user_id = $2",
-                    campaign_id,
-                    user.user_id
-                )
-
-                if not campaign:
-                    raise HTTPException(status_code=404, detail="Campaign not found")
-
-                # Delete campaign (cascades to related tables via FK constraints)
-                await conn.execute(
-                    "DELETE FROM expert_network.campaigns WHERE id = $1",
-                    campaign_id
-                )
+        # Delete campaign if owned by user (cascades to related tables via FK constraints)
+        deleted = await execute_query(
+            "DELETE FROM expert_network.campaigns WHERE id = $1 AND user_id = $2 RETURNING id",
+            campaign_id,
+            user.user_id,
+            fetch_one=True
+        )
+
+        if not deleted:
+            raise HTTPException(status_code=404, detail="Campaign not found")
 
         return SuccessResponse(
             success=True,
@@ -336,7 +362,11 @@ async def delete_campaign(campaign_id: str, user: User = Depends(get_current_use
     summary="List enrolled vendors for campaign",
     description="Get all vendor platforms enrolled in a specific campaign."
 )
-async def list_campaign_vendors(campaign_id: str, user: User = Depends(get_current_user)):
+async def list_campaign_vendors(
+    campaign_id: str,
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
+):
     """
     List all vendor enrollments for a campaign.
 
@@ -353,8 +383,7 @@ async def list_campaign_vendors(campaign_id: str, user: User = Depends(get_curre
     """
     try:
         # Verify campaign ownership
-        campaign = await get_campaign(campaign_id, user.user_id)
-        if not campaign:
+        if not await user_owns_campaign(campaign_id, user.user_id, conn=conn):
             raise HTTPException(status_code=404, detail="Campaign not found")
 
         # Get vendor enrollments with counts
@@ -376,7 +405,8 @@ async def list_campaign_vendors(campaign_id: str, user: User = Depends(get_curre
             ORDER BY cve.created_at ASC
             """,
             campaign_id,
-            fetch_all=True
+            fetch_all=True,
+            conn=conn
         )
 
         return enrollments
@@ -396,7 +426,8 @@ async def list_campaign_vendors(campaign_id: str, user: User = Depends(get_curre
 async def enroll_campaign_vendor(
     campaign_id: str,
     enrollment_data: VendorEnrollmentCreate,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
     Enroll a vendor platform in a campaign.
@@ -415,18 +446,16 @@ async def enroll_campaign_vendor(
         409: Vendor already enrolled
     """
     try:
-        # Use helper function to enroll vendor (verifies campaign ownership)
-        enrollment = await enroll_vendor(campaign_id, enrollment_data.vendor_platform_id, user.user_id)
+        # Use helper function to enroll vendor (ownership checked in the insert)
+        enrollment = await enroll_vendor(campaign_id, enrollment_data.vendor_platform_id, user.user_id, conn=conn)
 
         if not enrollment:
             raise HTTPException(status_code=404, detail="Campaign not found")
 
-        # Get vendor details
-        vendor = await execute_query(
-            "SELECT name, logo_url FROM expert_network.vendor_platforms WHERE id = $1",
-            enrollment_data.vendor_platform_id,
-            fetch_one=True
-        )
+        # Get vendor details from the in-memory catalog
+        vendor_catalog = get_vendor_catalog()
+        await vendor_catalog.ensure_fresh()
+        vendor = vendor_catalog.get(enrollment_data.vendor_platform_id)
 
         enrollment["vendor_name"] = vendor["name"] if vendor else None
         enrollment["vendor_logo_url"] = vendor["logo_url"] if vendor else None
@@ -451,7 +480,8 @@ async def enroll_campaign_vendor(
 async def unenroll_campaign_vendor(
     campaign_id: str,
     vendor_id: str,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
     Remove a vendor enrollment from a campaign.
@@ -469,27 +499,25 @@ async def unenroll_campaign_vendor(
         404: Campaign or enrollment not found
     """
     try:
-        async with get_db() as conn:
-            async with conn.transaction():
-                # Verify campaign ownership
-                campaign = await conn.fetchrow(
-                    "SELECT id FROM expert_network.campaigns WHERE id = $1 AND user_id = $2",
-                    campaign_id,
-                    user.user_id
-                )
-
-                if not campaign:
-                    raise HTTPException(status_code=404, detail="Campaign not found")
-
-                # Delete enrollment
-                result = await conn.execute(
-                    "DELETE FROM expert_network.campaign_vendor_enrollments WHERE campaign_id = $1 AND vendor_platform_id = $2",
-                    campaign_id,
-                    vendor_id
-                )
-
-                if result == "DELETE 0":
-                    raise HTTPException(status_code=404, detail="Vendor enrollment not found")
+        # Verify campaign ownership
+        if not await user_owns_campaign(campaign_id, user.user_id, conn=conn):
+            raise HTTPException(status_code=404, detail="Campaign not found")
+
+        # Delete enrollment
+        deleted = await execute_query(
+            """
+            DELETE FROM expert_network.campaign_vendor_enrollments
+            WHERE campaign_id = $1 AND vendor_platform_id = $2
+            RETURNING id
+            """,
+            campaign_id,
+            vendor_id,
+            fetch_one=True,
+            conn=conn
+        )
+
+        if not deleted:
+            raise HTTPException(status_code=404, detail="Vendor enrollment not found")
 
         return SuccessResponse(
             success=True,
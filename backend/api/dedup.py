@@ -0,0 +1,132 @@
+"""
+Expert deduplication API endpoints.
+
+The same person is often proposed for a campaign by several vendors. These
+endpoints list the duplicate groups found by dedup.py and let a user rerun
+the full pass over a campaign. New experts are matched automatically in the
+background when they are created.
+"""
+
+import asyncpg
+from fastapi import APIRouter, HTTPException, Depends
+from auth.better_auth import get_current_user, User
+from models.common import ErrorResponse
+from models.dedup import DuplicateGroupListResponse, DedupRunResponse
+from db import execute_query, user_owns_campaign, request_connection
+from dedup import dedupe_campaign
+from vendor_cache import get_vendor_catalog
+
+router = APIRouter(prefix="/api/campaigns", tags=["Deduplication"])
+
+
+@router.get(
+    "/{campaign_id}/duplicates",
+    response_model=DuplicateGroupListResponse,
+    summary="List duplicate experts",
+    description="Groups of experts in a campaign that different vendors proposed for the same person.",
+    responses={404: {"description": "Campaign not found", "model": ErrorResponse}}
+)
+async def list_duplicates(
+    campaign_id: str,
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
+):
+    """
+    List a campaign's duplicate groups.
+
+    Args:
+        campaign_id: UUID of the campaign
+
+    Returns:
+        Groups with their members, earliest proposal first
+
+    Raises:
+        404: Campaign not found or not owned by user
+    """
+    try:
+        # Verify campaign ownership
+        if not await user_owns_campaign(campaign_id, user.user_id, conn=conn):
+            raise HTTPException(status_code=404, detail="Campaign not found")
+
+        rows = await execute_query(
+            """
+            SELECT
+                ei.identity_id,
+                ei.expert_id,
+                ei.match_score,
+                e.name as expert_name,
+                e.title as current_title,
+                e.company as current_company,
+                e.vendor_platform_id
+            FROM expert_network.expert_identity ei
+            JOIN expert_network.experts e ON e.id = ei.expert_id
+            WHERE ei.campaign_id = $1
+            ORDER BY ei.identity_id, e.created_at, e.id
+            """,
+            campaign_id,
+            fetch_all=True,
+            conn=conn
+        )
+
+        vendor_catalog = get_vendor_catalog()
+        await vendor_catalog.ensure_fresh()
+
+        groups = {}
+        for row in rows:
+            vendor = vendor_catalog.get(row["vendor_platform_id"])
+            row["vendor_name"] = vendor["name"] if vendor else None
+            groups.setdefault(row.pop("identity_id"), []).append(row)
+
+        return DuplicateGroupListResponse(
+            campaign_id=campaign_id,
+            # Deleting experts can leave a group of one behind
+            groups=[
+                {"identity_id": identity_id, "members": members}
+                for identity_id, members in groups.items()
+                if len(members) > 1
+            ],
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch duplicates: {str(e)}")
+
+
+@router.post(
+    "/{campaign_id}/dedup",
+    response_model=DedupRunResponse,
+    summary="Rerun expert deduplication",
+    description="Recompute every duplicate group of a campaign from scratch.",
+    responses={404: {"description": "Campaign not found", "model": ErrorResponse}}
+)
+async def run_dedup(
+    campaign_id: str,
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
+):
+    """
+    Run the full dedup pass over a campaign.
+
+    Use after changing the DEDUP_* settings or editing expert names and
+    companies; inserts are matched incrementally without it.
+
+    Args:
+        campaign_id: UUID of the campaign
+
+    Returns:
+        Pair and group counts
+
+    Raises:
+        404: Campaign not found or not owned by user
+    """
+    try:
+        # Verify campaign ownership
+        if not await user_owns_campaign(campaign_id, user.user_id, conn=conn):
+            raise HTTPException(status_code=404, detail="Campaign not found")
+
+        stats = await dedupe_campaign(campaign_id, conn=conn)
+        return DedupRunResponse(campaign_id=campaign_id, **stats)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to deduplicate experts: {str(e)}")
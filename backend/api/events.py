@@ -0,0 +1,147 @@
+"""
+Live update API endpoints.
+
+GET /api/events is a Server-Sent Events stream of change hints for the
+user's campaigns, fed by Postgres LISTEN/NOTIFY (see live_updates.py and
+migration 012). Hints say what changed, not the new values; the client
+fetches those from the delta-sync feed (api/sync.py):
+
+1. Open the stream with ?since=<cursor> (or the Last-Event-ID header on
+   reconnect); the first `ready` event echoes the cursor.
+2. On `ready` or `resync`, call GET /api/campaigns/{id}/changes?since=<cursor>
+   and store its next_cursor.
+3. On `change`, do the same (debounced); `change` data lists the table, op,
+   campaign_id, up to 50 row ids and the row count.
+
+Changes committed while the client was disconnected are covered by step 2,
+so reconnecting never loses updates. Comment lines (`: ping`) are sent every
+LIVE_HEARTBEAT_SECONDS to keep proxies from closing idle streams.
+"""
+
+import os
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Header, Query
+from fastapi.responses import StreamingResponse
+from auth.better_auth import get_current_user, User
+from models.common import ErrorResponse, decode_sync_cursor
+from db import execute_query
+from fast_json import dumps
+from live_updates import LIVE_HEARTBEAT_SECONDS, Subscription, get_live_hub
+
+router = APIRouter(prefix="/api/events", tags=["Live Updates"])
+
+# Reconnect delay suggested to EventSource clients
+LIVE_RETRY_MS = int(os.getenv("LIVE_RETRY_MS", "3000"))
+
+# Sent with the response; X-Accel-Buffering stops nginx buffering the stream
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def format_event(event: str, data, event_id: Optional[str] = None) -> bytes:
+    """Encode one SSE message."""
+    head = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{head}event: {event}\n".encode("utf-8") + b"data: " + dumps(data) + b"\n\n"
+
+
+async def _event_stream(user_id: str, campaign_id: Optional[str], cursor: Optional[str]):
+    hub = get_live_hub()
+    # Subscribe inside the generator so the finally below always unsubscribes
+    subscription: Optional[Subscription] = hub.subscribe(user_id, campaign_id)
+    if subscription is None:
+        yield format_event("resync", {"reason": "too many subscribers"})
+        return
+    try:
+        yield f"retry: {LIVE_RETRY_MS}\n\n".encode("utf-8")
+        yield format_event("ready", {"since": cursor}, event_id=cursor)
+        while True:
+            event = await subscription.next_event(LIVE_HEARTBEAT_SECONDS)
+            if event is None:
+                yield b": ping\n\n"
+            else:
+                yield format_event(event["event"], event["data"])
+    finally:
+        hub.unsubscribe(subscription)
+
+
+@router.get(
+    "",
+    summary="Stream live campaign updates",
+    description="""
+    Server-Sent Events stream of change hints (`ready`, `change`, `resync`)
+    for the user's campaigns, or one campaign with `campaign_id`. Fetch the
+    changed rows from GET /api/campaigns/{id}/changes.
+
+    Authenticate like any other endpoint; browsers' EventSource cannot send
+    an Authorization header, so use a fetch-based SSE client.
+    """,
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Event stream"},
+        400: {"description": "Malformed cursor", "model": ErrorResponse},
+        404: {"description": "Campaign not found", "model": ErrorResponse},
+        503: {"description": "Live updates unavailable; poll the delta-sync feed", "model": ErrorResponse},
+    }
+)
+async def stream_events(
+    campaign_id: Optional[str] = Query(None, description="Only stream changes to this campaign"),
+    since: Optional[str] = Query(None, description="Delta-sync cursor to echo in the ready event"),
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    user: User = Depends(get_current_user)
+):
+    """
+    Open a live update stream.
+
+    Takes no request-scoped connection: a stream can stay open for hours and
+    must not hold a pool connection, so the ownership check borrows one
+    briefly.
+
+    Args:
+        campaign_id: Optional campaign filter
+        since: Cursor from the client's last sync (Last-Event-ID also accepted)
+
+    Returns:
+        text/event-stream response
+
+    Raises:
+        400: Malformed cursor
+        404: Campaign not found or not owned by user
+        503: Listener not running or subscriber limit reached
+    """
+    try:
+        cursor = since or last_event_id
+        if cursor:
+            try:
+                decode_sync_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+        hub = get_live_hub()
+        if not hub.available:
+            raise HTTPException(status_code=503, detail="Live updates unavailable")
+        if hub.subscriber_count >= hub.max_subscribers:
+            raise HTTPException(status_code=503, detail="Too many live update subscribers")
+
+        if campaign_id:
+            # Verify campaign ownership (a real query even in RLS tenancy mode:
+            # the stream is fed by NOTIFY, which row-level security never filters)
+            campaign = await execute_query(
+                "SELECT id FROM expert_network.campaigns WHERE id = $1 AND user_id = $2",
+                campaign_id,
+                user.user_id,
+                fetch_one=True
+            )
+            if not campaign:
+                raise HTTPException(status_code=404, detail="Campaign not found")
+
+        return StreamingResponse(
+            _event_stream(user.user_id, campaign_id, cursor),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to open event stream: {str(e)}")
@@ -5,63 +5,177 @@ Experts are individuals proposed by vendor platforms for interview.
 Includes expert management, screening, and filtering.
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
+import asyncio
+import html
+import os
+import uuid
+import asyncpg
+import orjson
+from typing import Any, AsyncIterator, List, Optional
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Query, Request
+from pydantic import ValidationError
 from auth.better_auth import get_current_user, User
 from models.expert import (
     ExpertCreate,
     ExpertUpdate,
     ExpertResponse,
     ExpertListResponse,
+    ExpertSearchResponse,
+    ExpertBulkItem,
+    ExpertBulkResponse,
+    BulkRowError,
+    ExpertRankedResponse,
+    ExpertSimilarResponse,
     ScreeningResponseCreate,
     ScreeningResponseResponse,
 )
-from models.common import SuccessResponse, ErrorResponse
-from db import get_campaign_experts, insert_and_return, update_and_return, execute_query, get_db
+from models.common import SuccessResponse, ErrorResponse, encode_cursor, decode_cursor
+from db import get_campaign_experts, insert_and_return, update_and_return, execute_query, user_owns_expert, request_connection, register_warmup_statement, campaign_contents_validator, get_db, bulk_insert_experts
+from fast_json import FastJSONRoute, dumps, fast_json
+from http_cache import LIST_CACHE_CONTROL, conditional_response, not_modified, request_matches, validator_etag
+from vendor_cache import get_vendor_catalog
+from dedup import schedule_dedup
+from ranking import FEATURES, get_campaign_candidates, parse_weights
+from similarity import similar_experts, schedule_similarity_index
+
+router = APIRouter(prefix="/api/experts", tags=["Experts"], route_class=FastJSONRoute)
+
+# Page size limits for GET /api/experts
+EXPERTS_DEFAULT_PAGE_SIZE = int(os.getenv("EXPERTS_DEFAULT_PAGE_SIZE", "100"))
+EXPERTS_MAX_PAGE_SIZE = int(os.getenv("EXPERTS_MAX_PAGE_SIZE", "500"))
+
+# Private-use characters ts_headline wraps matches in (and strips from the
+# source text); the fragment is then HTML-escaped and they become
+# <mark></mark>, so vendor-supplied text never reaches clients as raw HTML
+HIGHLIGHT_START = "\ue000"
+HIGHLIGHT_STOP = "\ue001"
+
+# Row limit for POST /api/experts/bulk
+EXPERTS_BULK_MAX_ROWS = int(os.getenv("EXPERTS_BULK_MAX_ROWS", "50000"))
+
+# Content types read line by line by the bulk endpoint (anything else is a JSON array)
+NDJSON_MEDIA_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines"}
+
+# Select list for an expert list row, read from an experts row aliased `e`
+# (the table itself, or an UPDATE ... RETURNING CTE) joined to its vendor `v`.
+# Database columns (name, title, company, ...) are mapped to model fields
+# (expert_name, current_title, ...).
+EXPERT_LIST_COLUMNS = """
+    e.id,
+    e.campaign_id,
+    e.vendor_platform_id,
+    e.name as expert_name,
+    e.title as current_title,
+    e.company as current_company,
+    e.avatar_url,
+    e.description as bio,
+    e.work_history,
+    e.skills as expertise_areas,
+    e.rating,
+    e.ai_fit_score as relevance_score,
+    e.status,
+    e.is_new,
+    e.created_at,
+    e.updated_at,
+    e.reviewed_at,
+    NULL as location,
+    NULL as linkedin_url,
+    NULL as email,
+    NULL as phone,
+    NULL as years_experience,
+    NULL as hourly_rate,
+    NULL as vendor_expert_id,
+    NULL as internal_notes,
+    v.name as vendor_name,
+    v.logo_url as vendor_logo_url,
+    (
+        SELECT COUNT(*)
+        FROM expert_network.interviews i
+        WHERE i.expert_id = e.id
+    ) as interview_count
+"""
 
-router = APIRouter(prefix="/api/experts", tags=["Experts"])
+# Full detail row: list columns plus screening responses as a correlated
+# subquery, so the whole detail comes back in one statement.
+EXPERT_DETAIL_COLUMNS = EXPERT_LIST_COLUMNS + """,
+    COALESCE((
+        SELECT json_agg(json_build_object(
+            'id', esr.id,
+            'expert_id', esr.expert_id,
+            'question_id', esr.screening_question_id,
+            'question_text', sq.question_text,
+            'response_text', esr.response_text,
+            'rating', NULL,
+            'created_at', esr.created_at,
+            'updated_at', esr.created_at
+        ) ORDER BY esr.created_at ASC)
+        FROM expert_network.expert_screening_responses esr
+        JOIN expert_network.screening_questions sq ON esr.screening_question_id = sq.id
+        WHERE esr.expert_id = e.id
+    ), '[]'::json) as screening_responses
+"""
+
+EXPERT_DETAIL_QUERY = f"""
+    SELECT {EXPERT_DETAIL_COLUMNS}
+    FROM expert_network.experts e
+    JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
+    JOIN expert_network.campaigns c ON e.campaign_id = c.id
+    WHERE e.id = $1 AND c.user_id = $2
+"""
+register_warmup_statement(EXPERT_DETAIL_QUERY)
 
 
 @router.get(
     "",
     response_model=ExpertListResponse,
     summary="List experts for campaign",
-    description="Get all experts for a specific campaign with optional filtering by status or vendor."
+    description="Get a page of experts for a campaign (newest first) with optional filtering by status or vendor.",
+    responses={304: {"description": "Not modified (If-None-Match matched the current ETag)"}}
 )
 async def list_experts(
+    request: Request,
     campaign_id: str = Query(..., description="Campaign UUID to filter experts"),
     status: Optional[str] = Query(None, description="Filter by expert status"),
     vendor_id: Optional[str] = Query(None, description="Filter by vendor platform ID"),
+    limit: int = Query(EXPERTS_DEFAULT_PAGE_SIZE, ge=1, le=EXPERTS_MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    include_total: bool = Query(False, description="Also compute the exact number of matching experts"),
     user: User = Depends(get_current_user)
 ):
     """
     List experts for a campaign.
 
-    Returns experts with vendor details and screening response counts.
+    Uses keyset pagination on (created_at, id), so every page is an index
+    range scan regardless of how deep into the campaign it is. The exact
+    total is only computed when requested, in a separate query. Supports
+    conditional GET: a current If-None-Match gets a 304 after only the change
+    validator.
 
     Args:
         campaign_id: UUID of the campaign
         status: Optional status filter (proposed, reviewed, approved, rejected, scheduled)
         vendor_id: Optional vendor platform filter
+        limit: Page size (default EXPERTS_DEFAULT_PAGE_SIZE)
+        cursor: next_cursor from the previous page
+        include_total: Whether to include the exact total
 
     Returns:
-        List of experts
+        Page of experts with next_cursor
 
     Raises:
+        400: Malformed cursor
         404: Campaign not found or not owned by user
     """
     try:
-        # Verify campaign ownership
-        campaign = await execute_query(
-            "SELECT id FROM expert_network.campaigns WHERE id = $1 AND user_id = $2",
-            campaign_id,
-            user.user_id,
-            fetch_one=True
-        )
-
-        if not campaign:
+        # Change validator; also verifies campaign ownership
+        validator = await campaign_contents_validator(campaign_id, user.user_id)
+        if not validator:
             raise HTTPException(status_code=404, detail="Campaign not found")
 
+        etag = validator_etag(request, user.user_id, validator, get_vendor_catalog().etag)
+        if request_matches(request, etag):
+            return not_modified(etag, LIST_CACHE_CONTROL)
+
         # Build query with optional filters
         where_clauses = ["e.campaign_id = $1"]
         params = [campaign_id]
@@ -77,12 +191,179 @@ async def list_experts(
             params.append(vendor_id)
             param_num += 1
 
+        filter_clause = " AND ".join(where_clauses)
+        filter_params = list(params)
+
+        # Keyset position: rows strictly after the cursor in (created_at DESC, id DESC) order
+        page_clauses = list(where_clauses)
+        if cursor:
+            try:
+                cursor_created_at, cursor_id = decode_cursor(cursor)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            page_clauses.append(f"(e.created_at, e.id) < (${param_num}::timestamptz, ${param_num + 1}::uuid)")
+            params.extend([cursor_created_at, cursor_id])
+            param_num += 2
+
+        page_clause = " AND ".join(page_clauses)
+
+        # Query one extra row to detect whether another page follows
+        page_query = execute_query(
+            f"""
+            SELECT {EXPERT_LIST_COLUMNS}
+            FROM expert_network.experts e
+            JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
+            WHERE {page_clause}
+            ORDER BY e.created_at DESC, e.id DESC
+            LIMIT ${param_num}
+            """,
+            *params,
+            limit + 1,
+            fetch_all=True
+        )
+
+        if include_total:
+            experts, total = await asyncio.gather(
+                page_query,
+                count_experts(campaign_id, filter_clause, filter_params, filtered=bool(status or vendor_id))
+            )
+        else:
+            experts = await page_query
+            total = None
+
+        has_more = len(experts) > limit
+        experts = experts[:limit]
+        next_cursor = (
+            encode_cursor(experts[-1]["created_at"], experts[-1]["id"]) if has_more else None
+        )
+
+        return conditional_response(
+            request,
+            dumps(ExpertListResponse(
+                experts=experts,
+                total=total,
+                limit=limit,
+                has_more=has_more,
+                next_cursor=next_cursor
+            )),
+            etag=etag,
+            cache_control=LIST_CACHE_CONTROL,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch experts: {str(e)}")
+
+
+async def count_experts(
+    campaign_id: str,
+    filter_clause: str,
+    filter_params: List,
+    filtered: bool
+) -> int:
+    """
+    Count experts matching a list filter.
+
+    Unfiltered counts come straight from the campaign_counters rollup;
+    filtered counts run a COUNT(*) on the (campaign_id, status) index.
+    """
+    if not filtered:
+        row = await execute_query(
+            "SELECT expert_count FROM expert_network.campaign_counters WHERE campaign_id = $1",
+            campaign_id,
+            fetch_one=True
+        )
+        if row:
+            return row["expert_count"]
+
+    row = await execute_query(
+        f"SELECT COUNT(*) as total FROM expert_network.experts e WHERE {filter_clause}",
+        *filter_params,
+        fetch_one=True
+    )
+    return row["total"]
+
+
+def _highlight_html(fragment: str) -> str:
+    """ts_headline fragment as escaped HTML with matches in <mark></mark>."""
+    return (
+        html.escape(fragment)
+        .replace(HIGHLIGHT_START, "<mark>")
+        .replace(HIGHLIGHT_STOP, "</mark>")
+    )
+
+
+@router.get(
+    "/search",
+    response_model=ExpertSearchResponse,
+    summary="Search experts",
+    description="Ranked fuzzy search across expert name, title, company, skills and description."
+)
+async def search_experts(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text (supports quotes, OR and -exclusions)"),
+    campaign_id: Optional[str] = Query(None, description="Restrict to one campaign"),
+    status: Optional[str] = Query(None, description="Filter by expert status"),
+    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+    limit: int = Query(20, ge=1, le=100, description="Results per page"),
+    user: User = Depends(get_current_user)
+):
+    """
+    Search experts across the user's campaigns.
+
+    Combines full-text ranking (websearch syntax over the weighted
+    search_vector) with trigram word similarity on search_text, so partial
+    words and typos still match. Both predicates are GIN-indexed
+    (migration 007). Highlights are only computed for the returned page;
+    they are HTML-escaped, with only the <mark> tags left unescaped.
+
+    Args:
+        q: Search text
+        campaign_id: Optional campaign filter
+        status: Optional status filter
+        page: Page number
+        limit: Results per page
+
+    Returns:
+        Ranked page of experts with scores and highlighted fragments
+    """
+    try:
+        where_clauses = [
+            "c.user_id = $1",
+            "(e.search_vector @@ query.tsq OR $2 <% e.search_text)",
+        ]
+        params = [user.user_id, q]
+        param_num = 3
+
+        if campaign_id:
+            where_clauses.append(f"e.campaign_id = ${param_num}")
+            params.append(campaign_id)
+            param_num += 1
+
+        if status:
+            where_clauses.append(f"e.status = ${param_num}")
+            params.append(status)
+            param_num += 1
+
         where_clause = " AND ".join(where_clauses)
+        offset = (page - 1) * limit
 
-        # Query experts with aggregated data
-        # Map database columns (name, title, company) to model fields (expert_name, current_title, current_company)
-        experts = await execute_query(
+        # Rank ids first, then join details and build headlines for the page only
+        rows = await execute_query(
             f"""
+            WITH query AS (
+                SELECT websearch_to_tsquery('english', $2) AS tsq
+            ),
+            hits AS (
+                SELECT
+                    e.id,
+                    ts_rank_cd(e.search_vector, query.tsq, 32) + word_similarity($2, e.search_text) AS score
+                FROM expert_network.experts e
+                JOIN expert_network.campaigns c ON e.campaign_id = c.id
+                CROSS JOIN query
+                WHERE {where_clause}
+                ORDER BY score DESC, e.id
+                LIMIT ${param_num} OFFSET ${param_num + 1}
+            )
             SELECT
                 e.id,
                 e.campaign_id,
@@ -101,35 +382,150 @@ async def list_experts(
                 e.created_at,
                 e.updated_at,
                 e.reviewed_at,
-                NULL as location,
-                NULL as linkedin_url,
-                NULL as email,
-                NULL as phone,
-                NULL as years_experience,
-                NULL as hourly_rate,
-                NULL as vendor_expert_id,
-                NULL as internal_notes,
                 v.name as vendor_name,
                 v.logo_url as vendor_logo_url,
-                COUNT(DISTINCT i.id) as interview_count
-            FROM expert_network.experts e
+                (
+                    SELECT COUNT(*) FROM expert_network.interviews i WHERE i.expert_id = e.id
+                ) as interview_count,
+                hits.score,
+                ts_headline('english', translate(e.title, '{HIGHLIGHT_START}{HIGHLIGHT_STOP}', ''), query.tsq,
+                            'StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, HighlightAll=true') as title_highlight,
+                ts_headline('english', translate(coalesce(e.description, ''), '{HIGHLIGHT_START}{HIGHLIGHT_STOP}', ''), query.tsq,
+                            'StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxFragments=2, MaxWords=20, MinWords=5') as bio_highlight
+            FROM hits
+            JOIN expert_network.experts e ON e.id = hits.id
             JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
-            LEFT JOIN expert_network.interviews i ON e.id = i.expert_id
-            WHERE {where_clause}
-            GROUP BY e.id, e.campaign_id, e.vendor_platform_id, e.name, e.title, e.company, e.avatar_url, 
-                     e.description, e.work_history, e.skills, e.rating, e.ai_fit_score, e.status, 
-                     e.is_new, e.created_at, e.updated_at, e.reviewed_at, v.name, v.logo_url
-            ORDER BY e.created_at DESC
+            CROSS JOIN query
+            ORDER BY hits.score DESC, e.id
             """,
             *params,
+            limit + 1,
+            offset,
             fetch_all=True
         )
 
-        return ExpertListResponse(experts=experts, total=len(experts))
+        has_more = len(rows) > limit
+        results = []
+        for row in rows[:limit]:
+            highlights = {}
+            for field in ("title", "bio"):
+                fragment = row.pop(f"{field}_highlight", None)
+                if fragment and HIGHLIGHT_START in fragment:
+                    highlights[field] = _highlight_html(fragment)
+            row["highlights"] = highlights
+            results.append(row)
+
+        return ExpertSearchResponse(
+            query=q,
+            results=results,
+            page=page,
+            limit=limit,
+            has_more=has_more
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to search experts: {str(e)}")
+
+
+@router.get(
+    "/ranked",
+    response_model=ExpertRankedResponse,
+    summary="Ranked expert shortlist",
+    description="Top experts of a campaign by a weighted score over fit, rating, vendor quality, cost, skills match and screening."
+)
+async def rank_experts(
+    campaign_id: str = Query(..., description="Campaign UUID"),
+    limit: int = Query(50, ge=1, le=EXPERTS_MAX_PAGE_SIZE, description="Number of experts to return"),
+    status: Optional[str] = Query(None, description="Filter by expert status"),
+    vendor_id: Optional[str] = Query(None, description="Filter by vendor platform ID"),
+    w_fit: Optional[float] = Query(None, ge=0, description="Weight of the AI fit score"),
+    w_rating: Optional[float] = Query(None, ge=0, description="Weight of the expert rating"),
+    w_vendor: Optional[float] = Query(None, ge=0, description="Weight of the vendor's overall score"),
+    w_cost: Optional[float] = Query(None, ge=0, description="Weight of vendor cost (cheaper scores higher)"),
+    w_skills: Optional[float] = Query(None, ge=0, description="Weight of the campaign industry/region keyword match"),
+    w_screening: Optional[float] = Query(None, ge=0, description="Weight of screening question completion"),
+    user: User = Depends(get_current_user)
+):
+    """
+    Rank a campaign's experts.
+
+    Scores come from a per-campaign feature matrix cached in memory (see
+    ranking.py), so re-ranking with different weights costs one
+    matrix-vector product and a top-K selection; only the returned page of
+    experts is read from the database. Omitted weights use the defaults and
+    all weights are normalized to sum to 1.
+
+    Args:
+        campaign_id: UUID of the campaign
+        limit: Number of experts to return
+        status: Optional status filter
+        vendor_id: Optional vendor platform filter
+        w_*: Optional weight overrides
+
+    Returns:
+        Best experts first, each with its score and per-signal components
+
+    Raises:
+        400: Invalid weights
+        404: Campaign not found or not owned by user
+    """
+    try:
+        weights = parse_weights({
+            "fit": w_fit,
+            "rating": w_rating,
+            "vendor": w_vendor,
+            "cost": w_cost,
+            "skills": w_skills,
+            "screening": w_screening,
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        # Change validator; also verifies campaign ownership
+        validator = await campaign_contents_validator(campaign_id, user.user_id)
+        if not validator:
+            raise HTTPException(status_code=404, detail="Campaign not found")
+
+        candidates = await get_campaign_candidates(campaign_id, validator)
+        indices, scores, total = candidates.top_k(weights, limit, status=status, vendor_id=vendor_id)
+
+        ids = [candidates.ids[i] for i in indices]
+        rows = await execute_query(
+            f"""
+            SELECT {EXPERT_LIST_COLUMNS}
+            FROM expert_network.experts e
+            JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
+            WHERE e.id = ANY($1::text[]::uuid[]) AND e.campaign_id = $2
+            """,
+            ids,
+            campaign_id,
+            fetch_all=True
+        ) if ids else []
+        by_id = {row["id"]: row for row in rows}
+
+        # Experts deleted since the matrix was built are skipped
+        results = []
+        for i, expert_id, score in zip(indices, ids, scores):
+            row = by_id.get(expert_id)
+            if row is None:
+                continue
+            row["score"] = round(float(score), 4)
+            row["score_components"] = {
+                name: round(float(value), 4) for name, value in zip(FEATURES, candidates.features[i])
+            }
+            results.append(row)
+
+        return ExpertRankedResponse(
+            campaign_id=campaign_id,
+            weights={name: round(float(value), 4) for name, value in zip(FEATURES, weights)},
+            total=total,
+            limit=limit,
+            results=results
+        )
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch experts: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to rank experts: {str(e)}")
 
 
 @router.get(
@@ -139,6 +535,7 @@ async def list_experts(
     description="Get detailed information about a specific expert including screening responses.",
     responses={404: {"description": "Expert not found", "model": ErrorResponse}}
 )
+@fast_json
 async def get_expert(expert_id: str, user: User = Depends(get_current_user)):
     """
     Get details for a specific expert.
@@ -155,77 +552,81 @@ async def get_expert(expert_id: str, user: User = Depends(get_current_user)):
         404: Expert not found or campaign not owned by user
     """
     try:
-        # Query expert with campaign ownership check
-        # Map database columns (name, title, company) to model fields (expert_name, current_title, current_company)
-        expert = await execute_query(
-            """
-            SELECT
-                e.id,
-                e.campaign_id,
-                e.vendor_platform_id,
-                e.name as expert_name,
-                e.title as current_title,
-                e.company as current_company,
-                e.avatar_url,
-                e.description as bio,
-                e.work_history,
-                e.skills as expertise_areas,
-                e.rating,
-                e.ai_fit_score as relevance_score,
-                e.status,
-                e.is_new,
-                e.created_at,
-                e.updated_at,
-                e.reviewed_at,
-                NULL as location,
-                NULL as linkedin_url,
-                NULL as email,
-                NULL as phone,
-                NULL as years_experience,
-                NULL as hourly_rate,
-                NULL as vendor_expert_id,
-                NULL as internal_notes,
-                v.name as vendor_name,
-                v.logo_url as vendor_logo_url,
-                COUNT(DISTINCT i.id) as interview_count
-            FROM expert_network.experts e
-            JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
-            JOIN expert_network.campaigns c ON e.campaign_id = c.id
-            LEFT JOIN expert_network.interviews i ON e.id = i.expert_id
-            WHERE e.id = $1 AND c.user_id = $2
-            GROUP BY e.id, e.campaign_id, e.vendor_platform_id, e.name, e.title, e.company, e.avatar_url, 
-                     e.description, e.work_history, e.skills, e.rating, e.ai_fit_score, e.status, 
-                     e.is_new, e.created_at, e.updated_at, e.reviewed_at, v.name, v.logo_url
-            """,
-            expert_id,
-            user.user_id,
-            fetch_one=True
-        )
+        # Expert, vendor, interview count and screening responses in one round trip
+        expert = await execute_query(EXPERT_DETAIL_QUERY, expert_id, user.user_id, fetch_one=True)
 
         if not expert:
             raise HTTPException(status_code=404, detail="Expert not found")
 
-        # Get screening responses
-        responses = await execute_query(
-            """
-            SELECT
-                esr.*,
-                sq.question_text
-            FROM expert_network.expert_screening_responses esr
-            JOIN expert_network.screening_questions sq ON esr.question_id = sq.id
-            WHERE esr.expert_id = $1
-            ORDER BY esr.created_at ASC
+        return expert
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch expert: {str(e)}")
+
+
+@router.get(
+    "/{expert_id}/similar",
+    response_model=ExpertSimilarResponse,
+    summary="Find similar experts",
+    description="Experts with the most similar skills, title and description across all of the user's campaigns.",
+    responses={404: {"description": "Expert not found", "model": ErrorResponse}}
+)
+async def get_similar_experts(
+    expert_id: str,
+    limit: int = Query(20, ge=1, le=100, description="Number of experts to return"),
+    min_similarity: float = Query(0.1, ge=0, le=1, description="Minimum estimated similarity (0-1)"),
+    user: User = Depends(get_current_user)
+):
+    """
+    Find experts similar to one expert.
+
+    Uses the MinHash/LSH skill index (see similarity.py): only experts
+    sharing a band key with this one are scored, up to
+    SIMILARITY_MAX_CANDIDATES of them. The index finds close matches;
+    experts below a similarity of about 0.5 are rarely returned. Experts
+    whose signatures are not indexed yet are not returned.
+
+    Args:
+        expert_id: UUID of the expert
+        limit: Number of experts to return
+        min_similarity: Minimum estimated Jaccard similarity
+
+    Returns:
+        Most similar experts first, each with its similarity
+
+    Raises:
+        404: Expert not found or campaign not owned by user
+    """
+    try:
+        neighbours = await similar_experts(expert_id, user.user_id, limit, min_similarity)
+        if neighbours is None:
+            raise HTTPException(status_code=404, detail="Expert not found")
+
+        rows = await execute_query(
+            f"""
+            SELECT {EXPERT_LIST_COLUMNS}
+            FROM expert_network.experts e
+            JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
+            WHERE e.id = ANY($1::text[]::uuid[])
             """,
-            expert_id,
+            [neighbour_id for neighbour_id, _ in neighbours],
             fetch_all=True
-        )
+        ) if neighbours else []
+        by_id = {row["id"]: row for row in rows}
 
-        expert["screening_responses"] = responses
-        return expert
+        results = []
+        for neighbour_id, similarity in neighbours:
+            row = by_id.get(neighbour_id)
+            if row is not None:
+                row["similarity"] = round(similarity, 4)
+                results.append(row)
+
+        return ExpertSimilarResponse(expert_id=expert_id, results=results)
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to fetch expert: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to find similar experts: {str(e)}")
 
 
 @router.post(
@@ -237,7 +638,11 @@ async def get_expert(expert_id: str, user: User = Depends(get_current_user)):
 )
 async def create_expert(
     expert_data: ExpertCreate,
-    user: User = Depends(get_current_user)
+    background_tasks: BackgroundTasks,
+    user: User = Depends(get_current_user),
+    # Function scope: released (and, in RLS tenancy mode, committed) before
+    # background tasks run, so they see the new row
+    conn: asyncpg.Connection = Depends(request_connection, scope="function")
 ):
     """
     Create a new expert.
@@ -260,18 +665,17 @@ async def create_expert(
             "SELECT id FROM expert_network.campaigns WHERE id = $1 AND user_id = $2",
             expert_data.campaign_id,
             user.user_id,
-            fetch_one=True
+            fetch_one=True,
+            conn=conn
         )
 
         if not campaign:
             raise HTTPException(status_code=404, detail="Campaign not found")
 
-        # Verify vendor exists
-        vendor = await execute_query(
-            "SELECT id, name, logo_url FROM expert_network.vendor_platforms WHERE id = $1",
-            expert_data.vendor_platform_id,
-            fetch_one=True
-        )
+        # Verify vendor exists (in-memory catalog, no round trip)
+        vendor_catalog = get_vendor_catalog()
+        await vendor_catalog.ensure_fresh()
+        vendor = vendor_catalog.get(expert_data.vendor_platform_id)
 
         if not vendor:
             raise HTTPException(status_code=404, detail="Vendor platform not found")
@@ -295,9 +699,15 @@ async def create_expert(
                 "bio": expert_data.bio,
                 "hourly_rate": expert_data.hourly_rate,
                 "status": expert_data.status,
-            }
+            },
+            conn=conn
         )
 
+        # Match against other vendors' proposals and index skills once the
+        # insert is committed
+        background_tasks.add_task(schedule_dedup, expert_data.campaign_id, [expert["id"]])
+        background_tasks.add_task(schedule_similarity_index, [expert["id"]])
+
         # Add vendor details
         expert["vendor_name"] = vendor["name"]
         expert["vendor_logo_url"] = vendor["logo_url"]
@@ -311,6 +721,189 @@ async def create_expert(
         raise HTTPException(status_code=400, detail=f"Failed to create expert: {str(e)}")
 
 
+def _decode_ndjson_line(line: bytes) -> Any:
+    try:
+        return orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        return e
+
+
+async def _iter_bulk_items(request: Request) -> AsyncIterator[Any]:
+    """
+    Decoded items of a bulk body: a JSON array, or NDJSON read as it streams in.
+    An NDJSON line that is not valid JSON yields its JSONDecodeError.
+    """
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type in NDJSON_MEDIA_TYPES:
+        pending = b""
+        async for chunk in request.stream():
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield _decode_ndjson_line(line)
+        if pending.strip():
+            yield _decode_ndjson_line(pending)
+        return
+
+    try:
+        items = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON: {str(e)}")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array of experts")
+    for item in items:
+        yield item
+
+
+@router.post(
+    "/bulk",
+    response_model=ExpertBulkResponse,
+    summary="Bulk create experts",
+    description="""
+    Add a vendor's batch of expert proposals to a campaign in one request.
+
+    Send a JSON array, or NDJSON (`Content-Type: application/x-ndjson`, one
+    expert per line). Each item has the fields of `POST /api/experts` except
+    `campaign_id`, and `current_title` is required. Valid rows are inserted
+    together; rows that fail validation are reported in `errors`, and rows
+    the vendor already proposed for the campaign (same name and company) are
+    listed in `duplicates`.
+    """,
+    responses={
+        400: {"description": "Malformed body", "model": ErrorResponse},
+        404: {"description": "Campaign not found", "model": ErrorResponse},
+        413: {"description": "More than EXPERTS_BULK_MAX_ROWS rows", "model": ErrorResponse},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {"type": "array", "items": ExpertBulkItem.model_json_schema(ref_template="#/components/schemas/{model}")}
+                },
+                "application/x-ndjson": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)
+async def bulk_create_experts(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    campaign_id: str = Query(..., description="Campaign UUID the experts belong to"),
+    return_ids: bool = Query(False, description="Include each row's new expert UUID"),
+    user: User = Depends(get_current_user)
+):
+    """
+    Bulk create experts.
+
+    Ownership is checked once and vendors are resolved from the in-memory
+    catalog. Rows are validated as they are read, then loaded with one COPY
+    into a staging table and one INSERT ... SELECT (db.bulk_insert_experts),
+    so the cost per row is validation plus COPY encoding. The body is read
+    before a connection is taken for the load, so a slow upload does not
+    hold a pool connection.
+
+    Args:
+        campaign_id: UUID of the campaign
+        return_ids: Whether to return the new expert ids
+
+    Returns:
+        Counts, per-row errors, skipped duplicates and optionally ids
+
+    Raises:
+        400: Malformed body
+        404: Campaign not found or not owned by user
+        413: Too many rows
+    """
+    try:
+        # Verify campaign ownership (a real query even in RLS tenancy mode)
+        campaign = await execute_query(
+            "SELECT id FROM expert_network.campaigns WHERE id = $1 AND user_id = $2",
+            campaign_id,
+            user.user_id,
+            fetch_one=True
+        )
+
+        if not campaign:
+            raise HTTPException(status_code=404, detail="Campaign not found")
+
+        vendor_catalog = get_vendor_catalog()
+        await vendor_catalog.ensure_fresh()
+
+        records = []
+        errors = []
+        received = 0
+        async for item in _iter_bulk_items(request):
+            row = received
+            received += 1
+            if received > EXPERTS_BULK_MAX_ROWS:
+                raise HTTPException(status_code=413, detail=f"At most {EXPERTS_BULK_MAX_ROWS} experts per request")
+
+            if isinstance(item, orjson.JSONDecodeError):
+                errors.append(BulkRowError(row=row, errors=[f"Invalid JSON: {str(item)}"]))
+                continue
+            if not isinstance(item, dict):
+                errors.append(BulkRowError(row=row, errors=["Expected a JSON object"]))
+                continue
+            try:
+                expert = ExpertBulkItem.model_validate(item)
+            except ValidationError as e:
+                errors.append(BulkRowError(row=row, errors=[
+                    f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+                ]))
+                continue
+
+            vendor = vendor_catalog.get(expert.vendor_platform_id)
+            if not vendor:
+                errors.append(BulkRowError(row=row, errors=["vendor_platform_id: Vendor platform not found"]))
+                continue
+
+            records.append((
+                row,
+                str(uuid.uuid4()),
+                vendor["id"],
+                expert.expert_name,
+                expert.current_title,
+                expert.current_company,
+                expert.avatar_url,
+                expert.bio,
+                expert.work_history,
+                expert.expertise_areas,
+                expert.rating,
+                expert.status,
+            ))
+
+        results = []
+        if records:
+            async with get_db() as conn:
+                results = await bulk_insert_experts(campaign_id, user.user_id, records, conn)
+            inserted_ids = [result["id"] for result in results if result["inserted"]]
+            # Matching and indexing start after the response, never before the
+            # load commits
+            background_tasks.add_task(schedule_dedup, campaign_id, inserted_ids)
+            background_tasks.add_task(schedule_similarity_index, inserted_ids)
+
+        expert_ids = None
+        if return_ids:
+            expert_ids = [None] * received
+            for result in results:
+                if result["inserted"]:
+                    expert_ids[result["row_no"]] = result["id"]
+
+        return ExpertBulkResponse(
+            campaign_id=campaign_id,
+            received=received,
+            inserted=sum(1 for result in results if result["inserted"]),
+            duplicates=[result["row_no"] for result in results if not result["inserted"]],
+            errors=errors,
+            expert_ids=expert_ids,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to bulk create experts: {str(e)}")
+
+
 @router.patch(
     "/{expert_id}",
     response_model=ExpertResponse,
@@ -321,6 +914,7 @@ async def create_expert(
 async def update_expert(
     expert_id: str,
     expert_data: ExpertUpdate,
+    background_tasks: BackgroundTasks,
     user: User = Depends(get_current_user)
 ):
     """
@@ -350,52 +944,48 @@ async def update_expert(
         if not update_fields:
             raise HTTPException(status_code=400, detail="No fields to update")
 
-        # Update expert with campaign ownership check
-        async with get_db() as conn:
-            async with conn.transaction():
-                # Verify campaign ownership
-                campaign_check = await conn.fetchrow(
-                    """
-                    SELECT c.id
-                    FROM expert_network.experts e
-                    JOIN expert_network.campaigns c ON e.campaign_id = c.id
-                    WHERE e.id = $1 AND c.user_id = $2
-                    """,
-                    expert_id,
-                    user.user_id
-                )
-
-                if not campaign_check:
-                    raise HTTPException(status_code=404, detail="Expert not found")
-
-                # Build SET clause
-                set_parts = []
-                values = []
-                param_num = 1
-
-                for col, val in update_fields.items():
-                    set_parts.append(f"{col} = ${param_num}")
-                    values.append(val)
-                    param_num += 1
-
-                set_clause = ', '.join(set_parts)
-
-                # Update expert
-                query = f"""
-                    UPDATE expert_network.experts
-                    SET {set_clause}, updated_at = NOW()
-                    WHERE id = ${param_num}
-                    RETURNING *
-                """
-                values.append(expert_id)
-
-                updated = await conn.fetchrow(query, *values)
-
-                if not updated:
-                    raise HTTPException(status_code=404, detail="Expert not found")
-
-        # Fetch full expert details
-        return await get_expert(expert_id, user)
+        # Build SET clause
+        set_parts = []
+        values = []
+        param_num = 1
+
+        for col, val in update_fields.items():
+            set_parts.append(f"{col} = ${param_num}")
+            values.append(val)
+            param_num += 1
+
+        set_clause = ', '.join(set_parts)
+
+        # Update with the campaign ownership check folded into the WHERE clause,
+        # and read the full detail row back from the RETURNING CTE
+        expert = await execute_query(
+            f"""
+            WITH e AS (
+                UPDATE expert_network.experts ex
+                SET {set_clause}, updated_at = NOW()
+                FROM expert_network.campaigns c
+                WHERE ex.id = ${param_num}
+                  AND ex.campaign_id = c.id
+                  AND c.user_id = ${param_num + 1}
+                RETURNING ex.*
+            )
+            SELECT {EXPERT_DETAIL_COLUMNS}
+            FROM e
+            JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
+            """,
+            *values,
+            expert_id,
+            user.user_id,
+            fetch_one=True
+        )
+
+        if not expert:
+            raise HTTPException(status_code=404, detail="Expert not found")
+
+        # Re-index skills after the response (the signature tracks updated_at)
+        background_tasks.add_task(schedule_similarity_index, [expert["id"]])
+
+        return expert
     except HTTPException:
         raise
     except Exception as e:
@@ -425,28 +1015,21 @@ async def delete_expert(expert_id: str, user: User = Depends(get_current_user)):
         404: Expert not found or campaign not owned by user
     """
     try:
-        async with get_db() as conn:
-            async with conn.transaction():
-                # Verify campaign ownership
-                expert = await conn.fetchrow(
-                    """
-                    SELECT e.id
-                    FROM expert_network.experts e
-                    JOIN expert_network.campaigns c ON e.campaign_id = c.id
-                    WHERE e.id = $1 AND c.user_id = $2
-                    """,
-                    expert_id,
-                    user.user_id
-                )
-
-                if not expert:
-                    raise HTTPException(status_code=404, detail="Expert not found")
-
-                # Delete expert (cascades via FK constraints)
-                await conn.execute(
-                    "DELETE FROM expert_network.experts WHERE id = $1",
-                    expert_id
-                )
+        # Delete expert with campaign ownership check (cascades via FK constraints)
+        deleted = await execute_query(
+            """
+            DELETE FROM expert_network.experts e
+            USING expert_network.campaigns c
+            WHERE e.id = $1 AND e.campaign_id = c.id AND c.user_id = $2
+            RETURNING e.id
+            """,
+            expert_id,
+            user.user_id,
+            fetch_one=True
+        )
+
+        if not deleted:
+            raise HTTPException(status_code=404, detail="Expert not found")
 
         return SuccessResponse(
             success=True,
@@ -472,7 +1055,8 @@ async def delete_expert(expert_id: str, user: User = Depends(get_current_user)):
 async def create_screening_response(
     expert_id: str,
     response_data: ScreeningResponseCreate,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
     Add a screening question response for an expert.
@@ -499,7 +1083,8 @@ async def create_screening_response(
             """,
             expert_id,
             user.user_id,
-            fetch_one=True
+            fetch_one=True,
+            conn=conn
         )
 
         if not expert:
@@ -513,7 +1098,8 @@ async def create_screening_response(
         question = await execute_query(
             "SELECT id, question_text FROM expert_network.screening_questions WHERE id = $1",
             response_data.question_id,
-            fetch_one=True
+            fetch_one=True,
+            conn=conn
         )
 
         if not question:
@@ -527,7 +1113,8 @@ async def create_screening_response(
                 "question_id": response_data.question_id,
                 "response_text": response_data.response_text,
                 "rating": response_data.rating,
-            }
+            },
+            conn=conn
         )
 
         response["question_text"] = question["question_text"]
@@ -546,7 +1133,8 @@ async def create_screening_response(
 )
 async def list_expert_screening_responses(
     expert_id: str,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
     Get all screening responses for an expert.
@@ -562,19 +1150,7 @@ async def list_expert_screening_responses(
     """
     try:
         # Verify expert exists and campaign ownership
-        expert = await execute_query(
-            """
-            SELECT e.id
-            FROM expert_network.experts e
-            JOIN expert_network.campaigns c ON e.campaign_id = c.id
-            WHERE e.id = $1 AND c.user_id = $2
-            """,
-            expert_id,
-            user.user_id,
-            fetch_one=True
-        )
-
-        if not expert:
+        if not await user_owns_expert(expert_id, user.user_id, conn=conn):
             raise HTTPException(status_code=404, detail="Expert not found")
 
         # Get screening responses
@@ -589,7 +1165,8 @@ async def list_expert_screening_responses(
             ORDER BY esr.created_at ASC
             """,
             expert_id,
-            fetch_all=True
+            fetch_all=True,
+            conn=conn
         )
 
         return responses
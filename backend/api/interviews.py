@@ -5,112 +5,411 @@ Interviews represent scheduled calls with experts, including notes,
 transcripts, and status tracking.
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Depends, Query
+from datetime import date, datetime, time, timedelta, timezone
+from typing import List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import asyncpg
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from auth.better_auth import get_current_user, User
 from models.interview import (
     InterviewCreate,
     InterviewUpdate,
     InterviewResponse,
     InterviewListResponse,
+    ConflictCheckRequest,
+    ConflictCheckResponse,
+    SuggestSlotsRequest,
+    SuggestSlotsResponse,
 )
 from models.common import SuccessResponse, ErrorResponse
-from db import insert_and_return, execute_query, get_db
+from db import insert_and_return, execute_query, request_connection, campaign_contents_validator
+from fast_json import FastJSONRoute, dumps, fast_json
+from http_cache import LIST_CACHE_CONTROL, conditional_response, not_modified, request_matches, validator_etag
+from vendor_cache import get_vendor_catalog
+from scheduling import (
+    INTERVIEW_CONFLICT_CHECK,
+    INTERVIEW_CONFLICT_MAX_SLOTS,
+    NON_BLOCKING_STATUSES,
+    SUGGEST_MAX_EXPERTS,
+    SUGGEST_MAX_HORIZON_DAYS,
+    find_conflicts,
+    suggest_slots,
+)
+
+router = APIRouter(prefix="/api/interviews", tags=["Interviews"], route_class=FastJSONRoute)
+
+
+# Interview rows with expert and vendor details, for lists and detail. Maps
+# database columns (name, title, company) to model fields (expert_name, ...),
+# returns the absolute start time (scheduled_at, migration 015) as
+# scheduled_date, adds user_id from the campaign and fills API fields the
+# table does not have.
+INTERVIEW_SELECT = """
+    SELECT
+        i.id,
+        i.campaign_id,
+        i.expert_id,
+        c.user_id,
+        i.scheduled_at as scheduled_date,
+        i.duration_minutes,
+        i.status,
+        i.team_member_id,
+        NULL as interview_notes,
+        NULL as key_insights,
+        NULL as recording_url,
+        NULL as transcript_text,
+        NULL as interviewer_name,
+        i.created_at,
+        i.updated_at,
+        e.name as expert_name,
+        e.company as expert_company,
+        e.title as expert_title,
+        e.avatar_url as expert_avatar_url,
+        e.vendor_platform_id,
+        v.name as vendor_name
+    FROM expert_network.interviews i
+    JOIN expert_network.experts e ON i.expert_id = e.id
+    JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
+    JOIN expert_network.campaigns c ON i.campaign_id = c.id
+"""
+
+# InterviewResponse fields with no interviews column (NULL in INTERVIEW_SELECT)
+INTERVIEW_UNSTORED_FIELDS = ("interview_notes", "key_insights", "recording_url", "transcript_text", "interviewer_name")
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Range bounds without an offset are taken as UTC."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
 
-router = APIRouter(prefix="/api/interviews", tags=["Interviews"])
+# Column default for interviews.timezone (migration 001); the API stores new
+# interviews in it
+DEFAULT_INTERVIEW_TIMEZONE = "UTC"
+
+
+def _local_schedule(starts_at: datetime, tz_name: str) -> Tuple[date, time]:
+    """The scheduled_date and scheduled_time columns for an instant in the interview's timezone."""
+    local = _as_utc(starts_at).astimezone(ZoneInfo(tz_name))
+    return local.date(), local.time()
+
+
+def _slot_start(scheduled_date: date, scheduled_time: time, tz_name: str) -> datetime:
+    """
+    Start instant of a stored schedule, as the generated columns compute it:
+    (scheduled_date + scheduled_time) AT TIME ZONE timezone.
+    """
+    return datetime.combine(scheduled_date, scheduled_time, tzinfo=ZoneInfo(tz_name))
+
+
+def _proposed_slot(
+    expert_id: Optional[str],
+    team_member_id: Optional[str],
+    starts_at: datetime,
+    duration_minutes: int
+) -> dict:
+    """A slot for scheduling.find_conflicts."""
+    starts_at = _as_utc(starts_at)
+    return {
+        "expert_id": expert_id,
+        "team_member_id": team_member_id,
+        "starts_at": starts_at,
+        "ends_at": starts_at + timedelta(minutes=duration_minutes),
+    }
+
+
+async def _reject_double_booking(
+    slot: dict,
+    user_id: str,
+    conn: asyncpg.Connection,
+    exclude_interview_id: Optional[str] = None
+):
+    """409 when the slot overlaps a booked interview of its expert or team member."""
+    conflicts = await find_conflicts(
+        [slot],
+        user_id,
+        exclude_interview_ids=[exclude_interview_id] if exclude_interview_id else [],
+        within_batch=False,
+        conn=conn
+    )
+    if conflicts:
+        kinds = " and ".join(sorted({conflict["kind"].replace("_", " ") for conflict in conflicts}))
+        ids = ", ".join(sorted({conflict["interview_id"] for conflict in conflicts}))
+        raise HTTPException(
+            status_code=409,
+            detail=f"Slot overlaps interviews of the same {kinds}: {ids}"
+        )
 
 
 @router.get(
     "",
     response_model=InterviewListResponse,
     summary="List interviews",
-    description="Get all interviews for a campaign with optional status filtering."
+    description=(
+        "Get the interviews of a campaign, or of all the user's campaigns within a time range, "
+        "with optional status filtering."
+    ),
+    responses={304: {"description": "Not modified (If-None-Match matched the current ETag)"}}
 )
 async def list_interviews(
-    campaign_id: str = Query(..., description="Campaign UUID to filter interviews"),
+    request: Request,
+    campaign_id: Optional[str] = Query(None, description="Campaign UUID (omit for all campaigns; requires from and to)"),
     status: Optional[str] = Query(None, description="Filter by interview status"),
-    user: User = Depends(get_current_user)
+    from_: Optional[datetime] = Query(None, alias="from", description="Only interviews starting at or after this time"),
+    to: Optional[datetime] = Query(None, description="Only interviews starting before this time"),
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
-    List interviews for a campaign.
+    List interviews, latest first.
+
+    Returns interviews with expert and vendor details. The from/to range is
+    half-open and applies to the absolute start time (scheduled_at), so a
+    calendar window is one range scan of idx_interviews_campaign_scheduled_at
+    per campaign. Without campaign_id, interviews from all of the user's
+    campaigns are returned and both bounds are required.
 
-    Returns interviews with expert and vendor details.
+    Supports conditional GET: for a single campaign, a current If-None-Match
+    gets a 304 after only the change validator.
 
     Args:
-        campaign_id: UUID of the campaign
+        campaign_id: Optional UUID of the campaign
         status: Optional status filter (scheduled, completed, cancelled, no_show)
+        from: Optional range start (inclusive; UTC if no offset is given)
+        to: Optional range end (exclusive; UTC if no offset is given)
 
     Returns:
         List of interviews
 
     Raises:
+        400: Missing or inverted range
         404: Campaign not found or not owned by user
     """
-    try:
-        # Verify campaign ownership
-        campaign = await execute_query(
-            "SELECT id FROM expert_network.campaigns WHERE id = $1 AND user_id = $2",
-            campaign_id,
-            user.user_id,
-            fetch_one=True
-        )
-
-        if not campaign:
-            raise HTTPException(status_code=404, detail="Campaign not found")
-
-        # Build query with optional status filter
-        where_clause = "i.campaign_id = $1"
-        params = [campaign_id]
+    from_, to = _as_utc(from_), _as_utc(to)
+    if from_ is not None and to is not None and from_ >= to:
+        raise HTTPException(status_code=400, detail="'from' must be before 'to'")
+    if campaign_id is None and (from_ is None or to is None):
+        raise HTTPException(status_code=400, detail="'from' and 'to' are required without campaign_id")
 
+    try:
+        etag = None
+        if campaign_id is not None:
+            # Change validator; also verifies campaign ownership
+            validator = await campaign_contents_validator(campaign_id, user.user_id, conn=conn)
+            if not validator:
+                raise HTTPException(status_code=404, detail="Campaign not found")
+
+            etag = validator_etag(request, user.user_id, validator, get_vendor_catalog().etag)
+            if request_matches(request, etag):
+                return not_modified(etag, LIST_CACHE_CONTROL)
+
+            where_clauses = ["i.campaign_id = $1"]
+            params = [campaign_id]
+        else:
+            where_clauses = ["c.user_id = $1"]
+            params = [user.user_id]
+
+        # Build query with optional filters
         if status:
-            where_clause += " AND i.status = $2"
             params.append(status)
+            where_clauses.append(f"i.status = ${len(params)}")
+        if from_ is not None:
+            params.append(from_)
+            where_clauses.append(f"i.scheduled_at >= ${len(params)}")
+        if to is not None:
+            params.append(to)
+            where_clauses.append(f"i.scheduled_at < ${len(params)}")
 
         # Query interviews with expert and vendor details
-        # Map database columns (name, title, company) to model fields (expert_name, current_title, current_company)
-        # Note: Combine scheduled_date and scheduled_time into scheduled_date datetime
-        # Add user_id from campaign, and handle missing fields from API model
         interviews = await execute_query(
             f"""
-            SELECT
-                i.id,
-                i.campaign_id,
-                i.expert_id,
-                c.user_id,
-                (i.scheduled_date + i.scheduled_time)::timestamp as scheduled_date,
-                i.duration_minutes,
-                i.status,
-                NULL as interview_notes,
-                NULL as key_insights,
-                NULL as recording_url,
-                NULL as transcript_text,
-                NULL as interviewer_name,
-                i.created_at,
-                i.updated_at,
-                e.name as expert_name,
-                e.company as expert_company,
-                e.title as expert_title,
-                e.avatar_url as expert_avatar_url,
-                e.vendor_platform_id,
-                v.name as vendor_name
-            FROM expert_network.interviews i
-            JOIN expert_network.experts e ON i.expert_id = e.id
-            JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
-            JOIN expert_network.campaigns c ON i.campaign_id = c.id
-            WHERE {where_clause}
-            ORDER BY i.scheduled_date DESC
+            {INTERVIEW_SELECT}
+            WHERE {" AND ".join(where_clauses)}
+            ORDER BY i.scheduled_at DESC
             """,
             *params,
-            fetch_all=True
+            fetch_all=True,
+            conn=conn
         )
 
-        return InterviewListResponse(interviews=interviews, total=len(interviews))
+        # Without a campaign validator the ETag is a hash of the body
+        return conditional_response(
+            request,
+            dumps(InterviewListResponse(interviews=interviews, total=len(interviews))),
+            etag=etag,
+            cache_control=LIST_CACHE_CONTROL,
+        )
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch interviews: {str(e)}")
 
 
+@router.post(
+    "/conflicts",
+    response_model=ConflictCheckResponse,
+    summary="Check slots for double-booking",
+    description="Check proposed slots against the booked interviews of their experts and team members in one query."
+)
+async def check_conflicts(
+    request_data: ConflictCheckRequest,
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
+):
+    """
+    Check proposed interview slots for double-booking.
+
+    Every slot is compared with the user's booked interviews (not cancelled
+    or no-show) of the same expert or team member, and, unless
+    check_within_batch is false, with the other proposed slots. All slots are
+    checked in a single query against the GiST slot indexes (migration 016),
+    so a week of several hundred proposed slots costs one round trip.
+
+    Args:
+        request_data: Slots to check
+
+    Returns:
+        Conflicts per slot position
+
+    Raises:
+        400: A slot names neither an expert nor a team member, or too many slots
+    """
+    slots = request_data.slots
+    if len(slots) > INTERVIEW_CONFLICT_MAX_SLOTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {INTERVIEW_CONFLICT_MAX_SLOTS} slots can be checked per request"
+        )
+    for position, slot in enumerate(slots):
+        if not slot.expert_id and not slot.team_member_id:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Slot {position} needs an expert_id or a team_member_id"
+            )
+
+    try:
+        conflicts = await find_conflicts(
+            [
+                _proposed_slot(slot.expert_id, slot.team_member_id, slot.starts_at, slot.duration_minutes)
+                for slot in slots
+            ],
+            user.user_id,
+            exclude_interview_ids=request_data.exclude_interview_ids,
+            within_batch=request_data.check_within_batch,
+            conn=conn
+        )
+
+        return ConflictCheckResponse(
+            checked=len(slots),
+            conflicting_slots=sorted({conflict["slot"] for conflict in conflicts}),
+            conflicts=conflicts
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to check interview conflicts: {str(e)}")
+
+
+@router.post(
+    "/suggest-slots",
+    response_model=SuggestSlotsResponse,
+    summary="Suggest interview slots",
+    description="Earliest free slots for many experts, given their availability, the team's interviews and working hours."
+)
+async def suggest_interview_slots(
+    request_data: SuggestSlotsRequest,
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
+):
+    """
+    Suggest interview slots.
+
+    For each expert, finds the earliest `count` non-overlapping slots that
+    fall within the horizon, the working hours and the expert's availability
+    windows, and that overlap no booked interview of the expert or of any
+    listed team member. With `together`, finds slots where all experts are
+    free at once instead. Booked interviews are read in one query; the
+    slots are then found with an interval sweep (see scheduling.py).
+
+    Args:
+        request_data: Experts with availability, team members and constraints
+
+    Returns:
+        Suggested slots (UTC)
+
+    Raises:
+        400: Invalid horizon or time zone, or too many experts
+    """
+    if len(request_data.experts) > SUGGEST_MAX_EXPERTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {SUGGEST_MAX_EXPERTS} experts can be scheduled per request"
+        )
+
+    horizon_start = _as_utc(request_data.horizon_start) or datetime.now(timezone.utc)
+    horizon_end = _as_utc(request_data.horizon_end) or horizon_start + timedelta(days=14)
+    if horizon_end <= horizon_start:
+        raise HTTPException(status_code=400, detail="horizon_end must be after horizon_start")
+    if horizon_end - horizon_start > timedelta(days=SUGGEST_MAX_HORIZON_DAYS):
+        raise HTTPException(
+            status_code=400,
+            detail=f"The horizon can span at most {SUGGEST_MAX_HORIZON_DAYS} days"
+        )
+
+    # Window times without an offset are local to the expert's time zone
+    experts = []
+    try:
+        for expert in request_data.experts:
+            tz = ZoneInfo(expert.timezone)
+            experts.append({
+                "expert_id": expert.expert_id,
+                "windows": [
+                    (
+                        window.starts_at if window.starts_at.tzinfo else window.starts_at.replace(tzinfo=tz),
+                        window.ends_at if window.ends_at.tzinfo else window.ends_at.replace(tzinfo=tz),
+                    )
+                    for window in expert.windows
+                ],
+            })
+        working_hours = None
+        if request_data.working_hours:
+            working_hours = request_data.working_hours.model_dump()
+            ZoneInfo(working_hours["timezone"])
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Unknown time zone: {str(e)}")
+
+    try:
+        suggestions = await suggest_slots(
+            experts,
+            request_data.team_member_ids,
+            user.user_id,
+            horizon_start,
+            horizon_end,
+            request_data.duration_minutes,
+            count=request_data.count,
+            step_minutes=request_data.step_minutes,
+            buffer_minutes=request_data.buffer_minutes,
+            working_hours=working_hours,
+            together=request_data.together,
+            conn=conn
+        )
+
+        def slots(found):
+            return [{"starts_at": start, "ends_at": end} for start, end in found]
+
+        return SuggestSlotsResponse(
+            duration_minutes=request_data.duration_minutes,
+            horizon_start=horizon_start,
+            horizon_end=horizon_end,
+            experts=[] if request_data.together else [
+                {"expert_id": expert["expert_id"], "slots": slots(found)}
+                for expert, found in zip(experts, suggestions)
+            ],
+            common_slots=slots(suggestions[0]) if request_data.together else None
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to suggest interview slots: {str(e)}")
+
+
 @router.get(
     "/{interview_id}",
     response_model=InterviewResponse,
@@ -118,7 +417,12 @@ async def list_interviews(
     description="Get detailed information about a specific interview.",
     responses={404: {"description": "Interview not found", "model": ErrorResponse}}
 )
-async def get_interview(interview_id: str, user: User = Depends(get_current_user)):
+@fast_json
+async def get_interview(
+    interview_id: str,
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
+):
     """
     Get details for a specific interview.
 
@@ -135,41 +439,15 @@ async def get_interview(interview_id: str, user: User = Depends(get_current_user
     """
     try:
         # Query interview with campaign ownership check
-        # Map database columns (name, title, company) to model fields (expert_name, current_title, current_company)
-        # Note: Combine scheduled_date and scheduled_time into scheduled_date datetime
-        # Add user_id from campaign, and handle missing fields from API model
         interview = await execute_query(
-            """
-            SELECT
-                i.id,
-                i.campaign_id,
-                i.expert_id,
-                c.user_id,
-                (i.scheduled_date + i.scheduled_time)::timestamp as scheduled_date,
-                i.duration_minutes,
-                i.status,
-                NULL as interview_notes,
-                NULL as key_insights,
-                NULL as recording_url,
-                NULL as transcript_text,
-                NULL as interviewer_name,
-                i.created_at,
-                i.updated_at,
-                e.name as expert_name,
-                e.company as expert_company,
-                e.title as expert_title,
-                e.avatar_url as expert_avatar_url,
-                e.vendor_platform_id,
-                v.name as vendor_name
-            FROM expert_network.interviews i
-            JOIN expert_network.experts e ON i.expert_id = e.id
-            JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
-            JOIN expert_network.campaigns c ON i.campaign_id = c.id
+            f"""
+            {INTERVIEW_SELECT}
             WHERE i.id = $1 AND c.user_id = $2
             """,
             interview_id,
             user.user_id,
-            fetch_one=True
+            fetch_one=True,
+            conn=conn
         )
 
         if not interview:
@@ -191,7 +469,8 @@ async def get_interview(interview_id: str, user: User = Depends(get_current_user
 )
 async def create_interview(
     interview_data: InterviewCreate,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
     Schedule a new interview.
@@ -204,7 +483,8 @@ async def create_interview(
 
     Raises:
         400: Invalid interview data
-        404: Campaign or expert not found
+        404: Campaign, expert or team member not found
+        409: Expert or team member already booked for an overlapping slot
     """
     try:
         # Verify campaign ownership
@@ -212,7 +492,8 @@ async def create_interview(
             "SELECT id FROM expert_network.campaigns WHERE id = $1 AND user_id = $2",
             interview_data.campaign_id,
             user.user_id,
-            fetch_one=True
+            fetch_one=True,
+            conn=conn
         )
 
         if not campaign:
@@ -221,47 +502,86 @@ async def create_interview(
         # Verify expert exists and belongs to campaign
         expert = await execute_query(
             """
-            SELECT e.id, e.name as expert_name, e.company as current_company, e.title as current_title, e.vendor_platform_id, v.name as vendor_name
+            SELECT e.id, e.name as expert_name, e.company as current_company, e.title as current_title, e.avatar_url, e.vendor_platform_id, v.name as vendor_name
             FROM expert_network.experts e
             JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
             WHERE e.id = $1 AND e.campaign_id = $2
             """,
             interview_data.expert_id,
             interview_data.campaign_id,
-            fetch_one=True
+            fetch_one=True,
+            conn=conn
         )
 
         if not expert:
             raise HTTPException(status_code=404, detail="Expert not found in this campaign")
 
-        # Create interview
+        if interview_data.team_member_id:
+            member = await execute_query(
+                "SELECT id FROM expert_network.team_members WHERE id = $1 AND user_id = $2",
+                interview_data.team_member_id,
+                user.user_id,
+                fetch_one=True,
+                conn=conn
+            )
+            if not member:
+                raise HTTPException(status_code=404, detail="Team member not found")
+
+        # Stored as local date and time columns; the slot is checked from
+        # those same columns
+        scheduled_date, scheduled_time = _local_schedule(
+            interview_data.scheduled_date, DEFAULT_INTERVIEW_TIMEZONE
+        )
+
+        # Reject double-booking of the expert or team member
+        if INTERVIEW_CONFLICT_CHECK and interview_data.status not in NON_BLOCKING_STATUSES:
+            await _reject_double_booking(
+                _proposed_slot(
+                    interview_data.expert_id,
+                    interview_data.team_member_id,
+                    _slot_start(scheduled_date, scheduled_time, DEFAULT_INTERVIEW_TIMEZONE),
+                    interview_data.duration_minutes
+                ),
+                user.user_id,
+                conn
+            )
+
+        # Create interview (interviews has no notes, insights, recording,
+        # transcript or interviewer columns; those fields are not stored)
         interview = await insert_and_return(
             "interviews",
             {
                 "campaign_id": interview_data.campaign_id,
                 "expert_id": interview_data.expert_id,
-                "user_id": user.user_id,
-                "scheduled_date": interview_data.scheduled_date,
+                "scheduled_date": scheduled_date,
+                "scheduled_time": scheduled_time,
+                "timezone": DEFAULT_INTERVIEW_TIMEZONE,
                 "duration_minutes": interview_data.duration_minutes,
                 "status": interview_data.status,
-                "interview_notes": interview_data.interview_notes,
-                "key_insights": interview_data.key_insights,
-                "recording_url": str(interview_data.recording_url) if interview_data.recording_url else None,
-                "transcript_text": interview_data.transcript_text,
-                "interviewer_name": interview_data.interviewer_name,
-            }
+                "team_member_id": interview_data.team_member_id,
+            },
+            conn=conn
         )
 
+        # Shape the row like INTERVIEW_SELECT
+        interview["user_id"] = user.user_id
+        interview["scheduled_date"] = interview["scheduled_at"]
+        for field in INTERVIEW_UNSTORED_FIELDS:
+            interview[field] = None
+
         # Add expert details
         interview["expert_name"] = expert["expert_name"]
         interview["expert_company"] = expert["current_company"]
         interview["expert_title"] = expert["current_title"]
+        interview["expert_avatar_url"] = expert["avatar_url"]
         interview["vendor_platform_id"] = expert["vendor_platform_id"]
         interview["vendor_name"] = expert["vendor_name"]
 
         return interview
     except HTTPException:
         raise
+    except asyncpg.ExclusionViolationError:
+        raise HTTPException(status_code=409, detail="Slot overlaps another interview of this expert")
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to create interview: {str(e)}")
 
@@ -276,7 +596,8 @@ async def create_interview(
 async def update_interview(
     interview_id: str,
     interview_data: InterviewUpdate,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
     Update an interview.
@@ -296,6 +617,7 @@ async def update_interview(
     Raises:
         404: Interview not found or campaign not owned by user
         400: Invalid update data
+        409: Expert or team member already booked for an overlapping slot
     """
     try:
         # Build update dict from non-None fields
@@ -311,54 +633,95 @@ async def update_interview(
         if "recording_url" in update_fields:
             update_fields["recording_url"] = str(update_fields["recording_url"])
 
-        # Update interview with campaign ownership check
-        async with get_db() as conn:
-            async with conn.transaction():
-                # Verify campaign ownership
-                campaign_check = await conn.fetchrow(
-                    """
-                    SELECT c.id
-                    FROM expert_network.interviews i
-                    JOIN expert_network.campaigns c ON i.campaign_id = c.id
-                    WHERE i.id = $1 AND c.user_id = $2
-                    """,
-                    interview_id,
-                    user.user_id
+        if "team_member_id" in update_fields:
+            member = await execute_query(
+                "SELECT id FROM expert_network.team_members WHERE id = $1 AND user_id = $2",
+                update_fields["team_member_id"],
+                user.user_id,
+                fetch_one=True,
+                conn=conn
+            )
+            if not member:
+                raise HTTPException(status_code=404, detail="Team member not found")
+
+        check_conflicts = INTERVIEW_CONFLICT_CHECK and bool(update_fields.keys() & {
+            "scheduled_date", "duration_minutes", "status", "team_member_id"
+        })
+        if check_conflicts or "scheduled_date" in update_fields:
+            current = await execute_query(
+                """
+                SELECT i.expert_id, i.team_member_id, i.scheduled_date, i.scheduled_time,
+                       i.timezone, i.duration_minutes, i.status
+                FROM expert_network.interviews i
+                JOIN expert_network.campaigns c ON i.campaign_id = c.id
+                WHERE i.id = $1 AND c.user_id = $2
+                """,
+                interview_id,
+                user.user_id,
+                fetch_one=True,
+                conn=conn
+            )
+            if not current:
+                raise HTTPException(status_code=404, detail="Interview not found")
+
+            # A new start instant is stored in the interview's own timezone
+            if "scheduled_date" in update_fields:
+                update_fields["scheduled_date"], update_fields["scheduled_time"] = _local_schedule(
+                    update_fields["scheduled_date"], current["timezone"]
                 )
 
-                if not campaign_check:
-                    raise HTTPException(status_code=404, detail="Interview not found")
-
-                # Build SET clause
-                set_parts = []
-                values = []
-                param_num = 1
+            # Reject double-booking when the slot, team member or status changes
+            merged = {**current, **update_fields}
+            if check_conflicts and merged["status"] not in NON_BLOCKING_STATUSES:
+                await _reject_double_booking(
+                    _proposed_slot(
+                        merged["expert_id"],
+                        merged["team_member_id"],
+                        _slot_start(merged["scheduled_date"], merged["scheduled_time"], merged["timezone"]),
+                        merged["duration_minutes"]
+                    ),
+                    user.user_id,
+                    conn,
+                    exclude_interview_id=interview_id
+                )
 
-                for col, val in update_fields.items():
-                    set_parts.append(f"{col} = ${param_num}")
-                    values.append(val)
-                    param_num += 1
+        # Build SET clause
+        set_parts = []
+        values = []
+        param_num = 1
 
-                set_clause = ', '.join(set_parts)
+        for col, val in update_fields.items():
+            set_parts.append(f"{col} = ${param_num}")
+            values.append(val)
+            param_num += 1
 
-                # Update interview
-                query = f"""
-                    UPDATE expert_network.interviews
-                    SET {set_clause}, updated_at = NOW()
-                    WHERE id = ${param_num}
-                    RETURNING *
-                """
-                values.append(interview_id)
+        set_clause = ', '.join(set_parts)
 
-                updated = await conn.fetchrow(query, *values)
+        # Update interview with campaign ownership check
+        updated = await execute_query(
+            f"""
+            UPDATE expert_network.interviews i
+            SET {set_clause}, updated_at = NOW()
+            FROM expert_network.campaigns c
+            WHERE i.id = ${param_num} AND i.campaign_id = c.id AND c.user_id = ${param_num + 1}
+            RETURNING i.id
+            """,
+            *values,
+            interview_id,
+            user.user_id,
+            fetch_one=True,
+            conn=conn
+        )
 
-                if not updated:
-                    raise HTTPException(status_code=404, detail="Interview not found")
+        if not updated:
+            raise HTTPException(status_code=404, detail="Interview not found")
 
         # Fetch full interview details
-        return await get_interview(interview_id, user)
+        return await get_interview(interview_id, user, conn)
     except HTTPException:
         raise
+    except asyncpg.ExclusionViolationError:
+        raise HTTPException(status_code=409, detail="Slot overlaps another interview of this expert")
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to update interview: {str(e)}")
 
@@ -384,28 +747,21 @@ async def delete_interview(interview_id: str, user: User = Depends(get_current_u
         404: Interview not found or campaign not owned by user
     """
     try:
-        async with get_db() as conn:
-            async with conn.transaction():
-                # Verify campaign ownership
-                interview = await conn.fetchrow(
-                    """
-                    SELECT i.id
-                    FROM expert_network.interviews i
-                    JOIN expert_network.campaigns c ON i.campaign_id = c.id
-                    WHERE i.id = $1 AND c.user_id = $2
-                    """,
-                    interview_id,
-                    user.user_id
-                )
-
-                if not interview:
-                    raise HTTPException(status_code=404, detail="Interview not found")
+        # Delete interview with campaign ownership check
+        deleted = await execute_query(
+            """
+            DELETE FROM expert_network.interviews i
+            USING expert_network.campaigns c
+            WHERE i.id = $1 AND i.campaign_id = c.id AND c.user_id = $2
+            RETURNING i.id
+            """,
+            interview_id,
+            user.user_id,
+            fetch_one=True
+        )
 
-                # Delete interview
-                await conn.execute(
-                    "DELETE FROM expert_network.interviews WHERE id = $1",
-                    interview_id
-                )
+        if not deleted:
+            raise HTTPException(status_code=404, detail="Interview not found")
 
         return SuccessResponse(
             success=True,
@@ -14,7 +14,7 @@ from models.screening_question import (
     ScreeningQuestionTreeResponse
 )
 from models.common import ErrorResponse
-from db import execute_query, insert_and_return, update_and_return, get_db
+from db import execute_query, insert_and_return, update_and_return, user_owns_campaign, request_connection
 import asyncpg
 import json
 
@@ -29,7 +29,8 @@ router = APIRouter(prefix="/api/campaigns/{campaign_id}/screening-questions", ta
 )
 async def list_screening_questions(
     campaign_id: str,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
     List all screening questions for a campaign.
@@ -38,14 +39,7 @@ async def list_screening_questions(
     """
     try:
         # Verify campaign belongs to user
-        campaign = await execute_query(
-            "SELECT id FROM expert_network.campaigns WHERE id = $1 AND user_id = $2",
-            campaign_id,
-            user.user_id,
-            fetch_one=True
-        )
-        
-        if not campaign:
+        if not await user_owns_campaign(campaign_id, user.user_id, conn=conn):
             raise HTTPException(status_code=404, detail="Campaign not found")
         
         # Fetch all questions for the campaign
@@ -56,7 +50,8 @@ async def list_screening_questions(
             ORDER BY display_order, created_at
             """,
             campaign_id,
-            fetch_all=True
+            fetch_all=True,
+            conn=conn
         )
         
         # Build hierarchical structure
@@ -120,7 +115,8 @@ async def list_screening_questions(
 async def create_screening_question(
     campaign_id: str,
     question_data: ScreeningQuestionCreate,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
     Create a new screening question.
@@ -138,7 +134,8 @@ async def create_screening_question(
             "SELECT id FROM expert_network.campaigns WHERE id = $1 AND user_id = $2",
             campaign_id,
             user.user_id,
-            fetch_one=True
+            fetch_one=True,
+            conn=conn
         )
         
         if not campaign:
@@ -150,7 +147,8 @@ async def create_screening_question(
                 "SELECT id FROM expert_network.screening_questions WHERE id = $1 AND campaign_id = $2",
                 question_data.parent_question_id,
                 campaign_id,
-                fetch_one=True
+                fetch_one=True,
+                conn=conn
             )
             if not parent:
                 raise HTTPException(status_code=404, detail="Parent question not found")
@@ -165,7 +163,8 @@ async def create_screening_question(
                 """,
                 campaign_id,
                 question_data.parent_question_id,
-                fetch_one=True
+                fetch_one=True,
+                conn=conn
             )
         else:
             max_order_result = await execute_query(
@@ -175,7 +174,8 @@ async def create_screening_question(
                 WHERE campaign_id = $1 AND parent_question_id IS NULL
                 """,
                 campaign_id,
-                fetch_one=True
+                fetch_one=True,
+                conn=conn
             )
         
         max_order = max_order_result.get("max_order", 0) if max_order_result else 0
@@ -191,7 +191,8 @@ async def create_screening_question(
                 "question_type": question_data.question_type,
                 "options": question_data.options,
                 "display_order": display_order
-            }
+            },
+            conn=conn
         )
         
         # Parse options if it's a string
@@ -233,7 +234,8 @@ async def update_screening_question(
     campaign_id: str,
     question_id: str,
     question_data: ScreeningQuestionUpdate,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
     Update a screening question.
@@ -248,27 +250,9 @@ async def update_screening_question(
     """
     try:
         # Verify campaign belongs to user
-        campaign = await execute_query(
-            "SELECT id FROM expert_network.campaigns WHERE id = $1 AND user_id = $2",
-            campaign_id,
-            user.user_id,
-            fetch_one=True
-        )
-        
-        if not campaign:
+        if not await user_owns_campaign(campaign_id, user.user_id, conn=conn):
             raise HTTPException(status_code=404, detail="Campaign not found")
         
-        # Verify question exists and belongs to campaign
-        question = await execute_query(
-            "SELECT * FROM expert_network.screening_questions WHERE id = $1 AND campaign_id = $2",
-            question_id,
-            campaign_id,
-            fetch_one=True
-        )
-        
-        if not question:
-            raise HTTPException(status_code=404, detail="Question not found")
-        
         # Build update dict
         update_fields = {
             k: v for k, v in question_data.model_dump(exclude_unset=True).items()
@@ -278,14 +262,18 @@ async def update_screening_question(
         if not update_fields:
             raise HTTPException(status_code=400, detail="No fields to update")
         
-        # Update question
+        # Update question (must belong to the campaign)
         updated = await update_and_return(
             "screening_questions",
             update_fields,
-            where="id = $1",
-            where_params=[question_id]
+            where="id = $1 AND campaign_id = $2",
+            where_params=[question_id, campaign_id],
+            conn=conn
         )
         
+        if not updated:
+            raise HTTPException(status_code=404, detail="Question not found")
+        
         # Parse options if it's a string
         options = updated.get("options")
         if options is not None:
@@ -324,7 +312,8 @@ async def update_screening_question(
 async def delete_screening_question(
     campaign_id: str,
     question_id: str,
-    user: User = Depends(get_current_user)
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
 ):
     """
     Delete a screening question.
@@ -337,34 +326,21 @@ async def delete_screening_question(
     """
     try:
         # Verify campaign belongs to user
-        campaign = await execute_query(
-            "SELECT id FROM expert_network.campaigns WHERE id = $1 AND user_id = $2",
-            campaign_id,
-            user.user_id,
-            fetch_one=True
-        )
-        
-        if not campaign:
+        if not await user_owns_campaign(campaign_id, user.user_id, conn=conn):
             raise HTTPException(status_code=404, detail="Campaign not found")
         
-        # Verify question exists and belongs to campaign
-        question = await execute_query(
-            "SELECT id FROM expert_network.screening_questions WHERE id = $1 AND campaign_id = $2",
+        # Delete question if it belongs to the campaign (CASCADE will handle sub-questions)
+        deleted = await execute_query(
+            "DELETE FROM expert_network.screening_questions WHERE id = $1 AND campaign_id = $2 RETURNING id",
             question_id,
             campaign_id,
-            fetch_one=True
+            fetch_one=True,
+            conn=conn
         )
         
-        if not question:
+        if not deleted:
             raise HTTPException(status_code=404, detail="Question not found")
         
-        # Delete question (CASCADE will handle sub-questions)
-        async with get_db() as conn:
-            await conn.execute(
-                "DELETE FROM expert_network.screening_questions WHERE id = $1",
-                question_id
-            )
-        
         return None
         
     except HTTPException:
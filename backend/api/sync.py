@@ -0,0 +1,197 @@
+"""
+Delta-sync API endpoints.
+
+Lets the UI keep a campaign's experts, interviews, screening questions,
+vendor enrollments and team assignments up to date without refetching whole
+lists: the first call returns everything plus a cursor, and each later call
+with ?since=<cursor> returns only rows changed since then and tombstones for
+deleted rows (migration 011).
+
+Rows may be sent more than once around a cursor boundary. Clients apply
+`deleted` first and then the changed rows as upserts keyed by id (a row
+deleted and re-created since the cursor appears in both).
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+import asyncpg
+from fastapi import APIRouter, HTTPException, Depends, Query
+from auth.better_auth import get_current_user, User
+from models.common import ErrorResponse, encode_sync_cursor, decode_sync_cursor
+from models.sync import ChangeFeedResponse
+from db import execute_query, user_owns_campaign, request_connection, sync_horizon
+from vendor_cache import get_vendor_catalog
+from api.experts import EXPERT_LIST_COLUMNS
+from api.interviews import INTERVIEW_SELECT
+
+router = APIRouter(prefix="/api/campaigns", tags=["Sync"])
+
+# Tombstones older than this are purged (expert_network.purge_deleted_rows);
+# older cursors can no longer be served incrementally.
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30"))
+
+# Upper bound on how far a long-open transaction can hold back the cursor
+SYNC_MAX_HORIZON_LAG_SECONDS = float(os.getenv("SYNC_MAX_HORIZON_LAG_SECONDS", "300"))
+
+# Cursor for a full sync: every row is "changed since -infinity"
+_BEGINNING = datetime.min.replace(tzinfo=timezone.utc)
+
+
+@router.get(
+    "/{campaign_id}/changes",
+    response_model=ChangeFeedResponse,
+    summary="Get campaign changes since a cursor",
+    description="""
+    Incremental feed of a campaign's experts, interviews, screening questions,
+    vendor enrollments and team assignments.
+
+    Call without `since` for a full snapshot, then pass the returned
+    `next_cursor` as `since` to receive only rows changed (or deleted) after
+    it. A cursor older than the tombstone retention window returns 410; the
+    client must then resync without `since`.
+    """,
+    responses={
+        400: {"description": "Malformed cursor", "model": ErrorResponse},
+        404: {"description": "Campaign not found", "model": ErrorResponse},
+        410: {"description": "Cursor expired; resync without since", "model": ErrorResponse},
+    }
+)
+async def get_campaign_changes(
+    campaign_id: str,
+    since: Optional[str] = Query(None, description="next_cursor from the previous sync"),
+    user: User = Depends(get_current_user),
+    conn: asyncpg.Connection = Depends(request_connection)
+):
+    """
+    Get changes to a campaign since a cursor.
+
+    The next cursor is taken before any rows are read, from the start of the
+    oldest transaction still open, so changes that commit while this request
+    runs are picked up by the next sync.
+
+    Args:
+        campaign_id: UUID of the campaign
+        since: Cursor from a previous response (omit for a full sync)
+
+    Returns:
+        Changed rows per table, tombstones and the next cursor
+
+    Raises:
+        400: Malformed cursor
+        404: Campaign not found or not owned by user
+        410: Cursor older than the tombstone retention window
+    """
+    try:
+        if since:
+            try:
+                since_at = decode_sync_cursor(since)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            retention = timedelta(days=SYNC_TOMBSTONE_RETENTION_DAYS)
+            if since_at < datetime.now(timezone.utc) - retention:
+                raise HTTPException(status_code=410, detail="Sync cursor expired; resync without since")
+        else:
+            since_at = _BEGINNING
+
+        # Verify campaign ownership
+        if not await user_owns_campaign(campaign_id, user.user_id, conn=conn):
+            raise HTTPException(status_code=404, detail="Campaign not found")
+
+        horizon = max(await sync_horizon(SYNC_MAX_HORIZON_LAG_SECONDS, conn=conn), since_at)
+
+        experts = await execute_query(
+            f"""
+            SELECT {EXPERT_LIST_COLUMNS}
+            FROM expert_network.experts e
+            JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
+            WHERE e.campaign_id = $1 AND e.updated_at >= $2
+            ORDER BY e.updated_at
+            """,
+            campaign_id, since_at,
+            fetch_all=True,
+            conn=conn
+        )
+
+        interviews = await execute_query(
+            f"""
+            {INTERVIEW_SELECT}
+            WHERE i.campaign_id = $1 AND i.updated_at >= $2
+            ORDER BY i.updated_at
+            """,
+            campaign_id, since_at,
+            fetch_all=True,
+            conn=conn
+        )
+
+        screening_questions = await execute_query(
+            """
+            SELECT * FROM expert_network.screening_questions
+            WHERE campaign_id = $1 AND updated_at >= $2
+            ORDER BY updated_at
+            """,
+            campaign_id, since_at,
+            fetch_all=True,
+            conn=conn
+        )
+
+        vendor_enrollments = await execute_query(
+            """
+            SELECT * FROM expert_network.campaign_vendor_enrollments
+            WHERE campaign_id = $1 AND updated_at >= $2
+            ORDER BY updated_at
+            """,
+            campaign_id, since_at,
+            fetch_all=True,
+            conn=conn
+        )
+        vendor_catalog = get_vendor_catalog()
+        await vendor_catalog.ensure_fresh()
+        for enrollment in vendor_enrollments:
+            vendor = vendor_catalog.get(enrollment["vendor_platform_id"])
+            enrollment["vendor_name"] = vendor["name"] if vendor else None
+            enrollment["vendor_logo_url"] = vendor["logo_url"] if vendor else None
+
+        team_assignments = await execute_query(
+            """
+            SELECT tm.*, cta.assigned_at
+            FROM expert_network.campaign_team_assignments cta
+            JOIN expert_network.team_members tm ON tm.id = cta.team_member_id
+            WHERE cta.campaign_id = $1 AND cta.assigned_at >= $2
+            ORDER BY cta.assigned_at
+            """,
+            campaign_id, since_at,
+            fetch_all=True,
+            conn=conn
+        )
+
+        # A full sync has nothing to delete
+        deleted = []
+        if since:
+            deleted = await execute_query(
+                """
+                SELECT table_name as "table", row_id as id, deleted_at
+                FROM expert_network.deleted_rows
+                WHERE campaign_id = $1 AND deleted_at >= $2
+                ORDER BY deleted_at
+                """,
+                campaign_id, since_at,
+                fetch_all=True,
+                conn=conn
+            )
+
+        return ChangeFeedResponse(
+            campaign_id=campaign_id,
+            full=not since,
+            next_cursor=encode_sync_cursor(horizon),
+            experts=experts,
+            interviews=interviews,
+            screening_questions=screening_questions,
+            vendor_enrollments=vendor_enrollments,
+            team_assignments=team_assignments,
+            deleted=deleted,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fetch campaign changes: {str(e)}")
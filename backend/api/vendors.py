@@ -2,14 +2,17 @@
 Vendor platform API endpoints.
 
 Provides read-only access to expert network vendor platforms.
-These are typically seeded during database setup and rarely change.
+These are typically seeded during database setup and rarely change, so both
+endpoints are served from the in-memory vendor catalog (see vendor_cache.py)
+with strong ETags; clients revalidate with If-None-Match and get a 304.
 """
 
 from typing import List
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from models.vendor import VendorPlatformResponse
 from models.common import ErrorResponse
-from db import get_vendor_platforms
+from http_cache import conditional_response
+from vendor_cache import VENDOR_CACHE_MAX_AGE_SECONDS, get_vendor_catalog
 
 router = APIRouter(prefix="/api/vendors", tags=["Vendors"])
 
@@ -47,10 +50,11 @@ router = APIRouter(prefix="/api/vendors", tags=["Vendors"])
                     ]
                 }
             }
-        }
+        },
+        304: {"description": "Not modified (If-None-Match matched the current ETag)"}
     }
 )
-async def list_vendors():
+async def list_vendors(request: Request):
     """
     List all active vendor platforms.
 
@@ -58,8 +62,14 @@ async def list_vendors():
     Includes cost ranges, ratings, and capabilities for comparison.
     """
     try:
-        vendors = await get_vendor_platforms()
-        return vendors
+        catalog = get_vendor_catalog()
+        await catalog.ensure_fresh()
+        return conditional_response(
+            request,
+            catalog.body,
+            etag=catalog.etag,
+            cache_control=f"public, max-age={VENDOR_CACHE_MAX_AGE_SECONDS}",
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch vendors: {str(e)}")
 
@@ -71,10 +81,11 @@ async def list_vendors():
     description="Get detailed information about a specific vendor platform by ID.",
     responses={
         200: {"description": "Vendor platform details"},
+        304: {"description": "Not modified (If-None-Match matched the current ETag)"},
         404: {"description": "Vendor not found", "model": ErrorResponse}
     }
 )
-async def get_vendor(vendor_id: str):
+async def get_vendor(vendor_id: str, request: Request):
     """
     Get details for a specific vendor platform.
 
@@ -88,18 +99,18 @@ async def get_vendor(vendor_id: str):
         404: Vendor not found
     """
     try:
-        from db import execute_query
-
-        vendor = await execute_query(
-            "SELECT * FROM expert_network.vendor_platforms WHERE id = $1",
-            vendor_id,
-            fetch_one=True
-        )
+        catalog = get_vendor_catalog()
+        await catalog.ensure_fresh()
+        body = catalog.get_json(vendor_id)
 
-        if not vendor:
+        if body is None:
             raise HTTPException(status_code=404, detail="Vendor platform not found")
 
-        return vendor
+        return conditional_response(
+            request,
+            body,
+            cache_control=f"public, max-age={VENDOR_CACHE_MAX_AGE_SECONDS}",
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -21,11 +21,13 @@ Usage:
 """
 
 import os
-import psycopg2
 from typing import Optional
 from fastapi import Header, HTTPException, Depends
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import datetime, timezone
+
+from db import get_db, set_request_user, register_warmup_statement
+from auth.session_cache import get_session_cache
 
 
 class User(BaseModel):
@@ -51,7 +53,6 @@ class BetterAuthConfig:
 
 # Singleton config
 _config: Optional[BetterAuthConfig] = None
-_db_conn: Optional[psycopg2.extensions.connection] = None
 
 
 def get_auth_config() -> BetterAuthConfig:
@@ -62,29 +63,34 @@ def get_auth_config() -> BetterAuthConfig:
     return _config
 
 
-def get_db_connection():
-    """Get database connection for session validation."""
-    global _db_conn
-    config = get_auth_config()
+def _is_expired(expires_at: Optional[datetime]) -> bool:
+    """Check a session expiry, handling both naive and tz-aware timestamps."""
+    if expires_at is None:
+        return False
+    if expires_at.tzinfo is None:
+        return expires_at < datetime.now()
+    return expires_at < datetime.now(timezone.utc)
 
-    if not config.enabled:
-        return None
 
-    # Create connection if needed
-    if _db_conn is None or _db_conn.closed:
-        try:
-            _db_conn = psycopg2.connect(config.database_url)
-        except Exception as e:
-            print(f"[BetterAuth] Database connection failed: {e}")
-            return None
-
-    return _db_conn
+# Session + user lookup (Better Auth stores sessions with a userId reference)
+SESSION_LOOKUP_QUERY = """
+    SELECT u.id, u.email, u.name, s."expiresAt"
+    FROM public.session s
+    JOIN public."user" u ON s."userId" = u.id
+    WHERE s.token = $1
+"""
+register_warmup_statement(SESSION_LOOKUP_QUERY)
 
 
-def validate_session(token: str) -> Optional[dict]:
+async def validate_session(token: str) -> Optional[dict]:
     """
     Validate session token against Better Auth session table.
 
+    Runs on the shared asyncpg pool from db.py, so lookups never block the
+    event loop and concurrent requests use separate pooled connections.
+    Results (including misses) are served from the in-process session cache
+    when possible; see auth/session_cache.py.
+
     Args:
         token: Session token from Better Auth
 
@@ -96,45 +102,76 @@ def validate_session(token: str) -> Optional[dict]:
     if not config.enabled:
         return None
 
-    conn = get_db_connection()
-    if not conn:
-        return None
+    cache = get_session_cache()
+    if cache is not None:
+        hit, cached = cache.get(token)
+        if hit:
+            return cached
 
     try:
-        cursor = conn.cursor()
-
-        # Query session and user tables (Better Auth stores sessions with userId reference)
-        cursor.execute("""
-            SELECT u.id, u.email, u.name, s."expiresAt"
-            FROM public.session s
-            JOIN public."user" u ON s."userId" = u.id
-            WHERE s.token = %s
-        """, (token,))
-
-        result = cursor.fetchone()
-        cursor.close()
+        async with get_db() as conn:
+            result = await conn.fetchrow(SESSION_LOOKUP_QUERY, token)
 
         if not result:
+            if cache is not None:
+                cache.set_negative(token)
             return None
 
         user_id, email, name, expires_at = result
 
         # Check if session is expired
-        if expires_at and expires_at < datetime.now():
+        if _is_expired(expires_at):
             print(f"[BetterAuth] Session expired for user {user_id}")
+            if cache is not None:
+                cache.set_negative(token)
             return None
 
-        return {
+        user_data = {
             "id": user_id,
             "email": email,
-            "name": name
+            "name": name,
+            "expires_at": expires_at
         }
+        if cache is not None:
+            cache.set(token, user_data, expires_at)
+        return user_data
 
     except Exception as e:
         print(f"[BetterAuth] Session validation error: {e}")
         return None
 
 
+def invalidate_session(token: str) -> bool:
+    """
+    Drop a session token from the in-process cache.
+
+    Call this on logout so revocation takes effect immediately in this worker.
+
+    Returns:
+        True if the token was cached
+    """
+    cache = get_session_cache()
+    if cache is None:
+        return False
+    return cache.invalidate(token)
+
+
+def parse_bearer_token(authorization: Optional[str]) -> Optional[str]:
+    """Extract the token from a "Bearer <token>" header, or None if malformed."""
+    if not authorization:
+        return None
+    parts = authorization.split()
+    if len(parts) != 2 or parts[0].lower() != "bearer":
+        return None
+    return parts[1]
+
+
+def _bind_request_user(user: User) -> User:
+    """Scope the request's database connections to this user (RLS tenancy mode)."""
+    set_request_user(user.user_id)
+    return user
+
+
 async def get_current_user(
     authorization: Optional[str] = Header(None),
     x_user_id: Optional[str] = Header(None, alias="X-User-Id")
@@ -153,12 +190,12 @@ async def get_current_user(
     # Check for X-User-Id header first (demo mode - works even when auth is enabled)
     if x_user_id:
         print(f"[BetterAuth] Using X-User-Id header for demo mode: {x_user_id}")
-        return User(user_id=x_user_id, email=None, name=f"User {x_user_id}")
+        return _bind_request_user(User(user_id=x_user_id, email=None, name=f"User {x_user_id}"))
 
     if not config.enabled:
         # Auth disabled - allow all requests with anonymous user
         print("[BetterAuth] Auth disabled - allowing request with anonymous user")
-        return User(user_id="anonymous", email=None, name="Anonymous")
+        return _bind_request_user(User(user_id="anonymous", email=None, name="Anonymous"))
 
     if not authorization:
         raise HTTPException(
@@ -175,7 +212,7 @@ async def get_current_user(
         )
 
     token = parts[1]
-    user_data = validate_session(token)
+    user_data = await validate_session(token)
 
     if not user_data:
         raise HTTPException(
@@ -183,12 +220,12 @@ async def get_current_user(
             detail="Invalid or expired session"
         )
 
-    return User(
+    return _bind_request_user(User(
         user_id=user_data['id'],
         email=user_data.get('email'),
         name=user_data.get('name'),
         role=None  # Add role support if needed
-    )
+    ))
 
 
 async def optional_auth(authorization: Optional[str] = Header(None)) -> Optional[User]:
@@ -214,14 +251,14 @@ async def optional_auth(authorization: Optional[str] = Header(None)) -> Optional
         return None
 
     token = parts[1]
-    user_data = validate_session(token)
+    user_data = await validate_session(token)
 
     if not user_data:
         return None
 
-    return User(
+    return _bind_request_user(User(
         user_id=user_data['id'],
         email=user_data.get('email'),
         name=user_data.get('name'),
         role=None  # Add role support if needed
-    )
+    ))
@@ -0,0 +1,159 @@
+"""
+In-process cache for Better Auth session lookups.
+
+A browser tab sends the same bearer token on every request, so validating it
+against `public.session` each time is wasted work. This module keeps a bounded
+LRU of recent lookups keyed by a SHA-256 hash of the token (raw tokens are
+never held in memory longer than the request).
+
+- Valid sessions are cached for at most `AUTH_CACHE_TTL_SECONDS`, and never
+  past the session's own `expiresAt`.
+- Unknown or expired tokens are cached as negative entries for
+  `AUTH_CACHE_NEGATIVE_TTL_SECONDS`, which absorbs token-stuffing bursts.
+- `invalidate()` drops a token immediately (used on logout).
+
+The cache is per worker process. Revocations made elsewhere (e.g. another
+worker, or Better Auth deleting the session directly) take effect once the
+positive TTL lapses, so keep that TTL short.
+
+Usage:
+    from auth.session_cache import get_session_cache
+
+    cache = get_session_cache()
+    hit, user_data = cache.get(token)
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+
+AUTH_CACHE_ENABLED = os.getenv('AUTH_CACHE_ENABLED', 'true').lower() == 'true'
+AUTH_CACHE_MAX_ENTRIES = int(os.getenv('AUTH_CACHE_MAX_ENTRIES', '10000'))
+AUTH_CACHE_TTL_SECONDS = float(os.getenv('AUTH_CACHE_TTL_SECONDS', '60'))
+AUTH_CACHE_NEGATIVE_TTL_SECONDS = float(os.getenv('AUTH_CACHE_NEGATIVE_TTL_SECONDS', '5'))
+
+
+def hash_token(token: str) -> str:
+    """Hash a session token for use as a cache key."""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+def _seconds_until(expires_at: datetime) -> float:
+    """Seconds from now until `expires_at` (naive timestamps are local time)."""
+    if expires_at.tzinfo is None:
+        return (expires_at - datetime.now()).total_seconds()
+    return (expires_at - datetime.now(timezone.utc)).total_seconds()
+
+
+class SessionCache:
+    """Bounded LRU/TTL cache of session lookups with negative caching."""
+
+    def __init__(
+        self,
+        max_entries: int = AUTH_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = AUTH_CACHE_TTL_SECONDS,
+        negative_ttl_seconds: float = AUTH_CACHE_NEGATIVE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+        # key -> (deadline on the monotonic clock, user data or None)
+        self._entries: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, token: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up a token.
+
+        Returns:
+            (hit, user_data). On a negative hit, user_data is None.
+        """
+        key = hash_token(token)
+        entry = self._entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        deadline, user_data = entry
+        if deadline <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        if user_data is None:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return True, user_data
+
+    def set(self, token: str, user_data: Dict[str, Any], expires_at: Optional[datetime] = None):
+        """Cache a valid session, capped at the session's own expiry."""
+        lifetime = self.ttl_seconds
+        if expires_at is not None:
+            lifetime = min(lifetime, _seconds_until(expires_at))
+        if lifetime <= 0:
+            return
+        self._store(hash_token(token), lifetime, user_data)
+
+    def set_negative(self, token: str):
+        """Cache an unknown or expired token for the short negative TTL."""
+        if self.negative_ttl_seconds > 0:
+            self._store(hash_token(token), self.negative_ttl_seconds, None)
+
+    def invalidate(self, token: str) -> bool:
+        """Drop a token from the cache. Returns True if it was cached."""
+        removed = self._entries.pop(hash_token(token), None) is not None
+        if removed:
+            self.invalidations += 1
+        return removed
+
+    def clear(self):
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size."""
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_ratio": (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+        }
+
+    def _store(self, key: str, lifetime: float, user_data: Optional[Dict[str, Any]]):
+        self._entries[key] = (time.monotonic() + lifetime, user_data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+# Singleton cache
+_cache: Optional[SessionCache] = None
+
+
+def get_session_cache() -> Optional[SessionCache]:
+    """Get the process-wide session cache, or None if caching is disabled."""
+    global _cache
+    if not AUTH_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        _cache = SessionCache()
+    return _cache
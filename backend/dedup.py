@@ -0,0 +1,420 @@
+"""
+Cross-vendor expert deduplication.
+
+Groups a campaign's proposals of the same person by different vendors into
+expert_identity rows (migration 013):
+
+1. Blocking: only experts sharing a name key (a name token plus the initial
+   of another token, computed in SQL by expert_name_keys) are compared.
+   Blocks bigger than DEDUP_MAX_BLOCK_SIZE (very common names) fall back to
+   a sorted-neighbourhood window of DEDUP_WINDOW, in both modes below, so
+   the number of pairs stays roughly linear in the number of experts
+   compared.
+2. Scoring: a pair from two different vendors scores the weighted trigram
+   similarity of normalized names and companies plus the Jaccard overlap
+   of skills; features missing on either side are left out of the weighting.
+3. Clustering: pairs scoring at least DEDUP_MATCH_THRESHOLD are merged with
+   union-find; each group is keyed by its earliest proposal.
+
+`dedupe_campaign` recomputes a whole campaign. `dedupe_experts` handles
+newly inserted experts: it finds their candidates through the name-key GIN
+index and merges them into existing groups, so the cost is per new expert,
+not per campaign. Inserts schedule it in the background via
+`schedule_dedup`, once the insert has committed: the run uses its own
+connection and would not see uncommitted rows.
+
+Usage:
+    from dedup import dedupe_campaign, schedule_dedup
+
+    stats = await dedupe_campaign(campaign_id)
+    background_tasks.add_task(schedule_dedup, campaign_id, [expert["id"]])
+"""
+
+import asyncio
+import bisect
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import asyncpg
+
+from db import execute_query, get_db
+
+
+DEDUP_MATCH_THRESHOLD = float(os.getenv('DEDUP_MATCH_THRESHOLD', '0.75'))
+DEDUP_MIN_NAME_SIMILARITY = float(os.getenv('DEDUP_MIN_NAME_SIMILARITY', '0.6'))
+DEDUP_MAX_BLOCK_SIZE = int(os.getenv('DEDUP_MAX_BLOCK_SIZE', '200'))
+DEDUP_WINDOW = int(os.getenv('DEDUP_WINDOW', '20'))
+DEDUP_ON_INSERT = os.getenv('DEDUP_ON_INSERT', 'true').lower() == 'true'
+
+# Feature weights (renormalized over the features both experts have)
+NAME_WEIGHT = 0.6
+COMPANY_WEIGHT = 0.25
+SKILLS_WEIGHT = 0.15
+
+_COMPANY_STOPWORDS = {
+    "inc", "llc", "ltd", "limited", "corp", "corporation", "co", "company",
+    "the", "group", "plc", "gmbh", "ag", "sa", "lp", "llp", "holdings",
+}
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Columns for a dedup candidate; names are normalized in SQL so both paths
+# and the name-key index agree
+CANDIDATE_COLUMNS = """
+    e.id,
+    e.vendor_platform_id,
+    e.created_at,
+    expert_network.normalize_person_name(e.name) AS norm_name,
+    e.company,
+    e.skills,
+    expert_network.expert_name_keys(e.name) AS name_keys
+"""
+
+
+def trigrams(text: str) -> frozenset:
+    """pg_trgm-style trigrams: each word padded with two spaces in front, one behind."""
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def normalize_company(company: Optional[str]) -> str:
+    words = _NON_ALNUM.sub(" ", (company or "").lower()).split()
+    return " ".join(word for word in words if word not in _COMPANY_STOPWORDS)
+
+
+class Candidate:
+    """Precomputed comparison features for one expert."""
+
+    __slots__ = ("id", "vendor_id", "created_at", "name_grams", "company_grams", "skills", "keys", "sort_key")
+
+    def __init__(self, row: Dict[str, Any]):
+        self.id = row["id"]
+        self.vendor_id = row["vendor_platform_id"]
+        self.created_at = row["created_at"]
+        # Sorted tokens without initials, so "Chen, Sarah J." ~ "Sarah Chen"
+        name = " ".join(sorted(token for token in row["norm_name"].split() if len(token) > 1))
+        company = normalize_company(row["company"])
+        self.name_grams = trigrams(name)
+        self.company_grams = trigrams(company)
+        self.skills = frozenset(skill.strip().lower() for skill in row["skills"] or () if skill.strip())
+        self.keys = row["name_keys"] or []
+        self.sort_key = (company, name)
+
+
+def score_pair(a: Candidate, b: Candidate) -> float:
+    """Match score in [0, 1]; 0 for same-vendor pairs and dissimilar names."""
+    if a.vendor_id == b.vendor_id:
+        return 0.0
+    name = jaccard(a.name_grams, b.name_grams)
+    if name < DEDUP_MIN_NAME_SIMILARITY:
+        return 0.0
+    total = NAME_WEIGHT * name
+    weight = NAME_WEIGHT
+    if a.company_grams and b.company_grams:
+        total += COMPANY_WEIGHT * jaccard(a.company_grams, b.company_grams)
+        weight += COMPANY_WEIGHT
+    if a.skills and b.skills:
+        total += SKILLS_WEIGHT * jaccard(a.skills, b.skills)
+        weight += SKILLS_WEIGHT
+    return total / weight
+
+
+def _blocks(candidates: Iterable[Candidate]) -> Dict[str, List[Candidate]]:
+    blocks: Dict[str, List[Candidate]] = {}
+    for candidate in candidates:
+        for key in candidate.keys:
+            blocks.setdefault(key, []).append(candidate)
+    return blocks
+
+
+def candidate_pairs(
+    candidates: List[Candidate],
+    probes: Optional[List[Candidate]] = None
+) -> Iterator[Tuple[Candidate, Candidate]]:
+    """
+    Distinct pairs sharing a name key. With `probes`, only pairs involving a
+    probe (incremental mode); otherwise every pair within each block. Either
+    way, oversized blocks are only compared within a sorted window: in
+    incremental mode, a probe meets the DEDUP_WINDOW candidates on each side
+    of its sort position.
+    """
+    blocks = _blocks(candidates)
+    seen: Set[Tuple[str, str]] = set()
+
+    def emit(a: Candidate, b: Candidate):
+        if a.id == b.id or a.vendor_id == b.vendor_id:
+            return None
+        pair = (a.id, b.id) if a.id < b.id else (b.id, a.id)
+        if pair in seen:
+            return None
+        seen.add(pair)
+        return (a, b)
+
+    if probes is not None:
+        # Oversized blocks, sorted once, with their sort keys for bisection
+        windowed: Dict[str, Tuple[List[Candidate], List[Tuple[str, str]]]] = {}
+        for probe in probes:
+            for key in probe.keys:
+                block = blocks.get(key, ())
+                if len(block) > DEDUP_MAX_BLOCK_SIZE:
+                    if key not in windowed:
+                        block = sorted(block, key=lambda candidate: candidate.sort_key)
+                        windowed[key] = (block, [candidate.sort_key for candidate in block])
+                    block, sort_keys = windowed[key]
+                    position = bisect.bisect_left(sort_keys, probe.sort_key)
+                    block = block[max(0, position - DEDUP_WINDOW):position + DEDUP_WINDOW + 1]
+                for other in block:
+                    pair = emit(probe, other)
+                    if pair:
+                        yield pair
+        return
+
+    for block in blocks.values():
+        if len(block) <= DEDUP_MAX_BLOCK_SIZE:
+            for i, a in enumerate(block):
+                for b in block[i + 1:]:
+                    pair = emit(a, b)
+                    if pair:
+                        yield pair
+        else:
+            block = sorted(block, key=lambda candidate: candidate.sort_key)
+            for i, a in enumerate(block):
+                for b in block[i + 1:i + 1 + DEDUP_WINDOW]:
+                    pair = emit(a, b)
+                    if pair:
+                        yield pair
+
+
+class _UnionFind:
+    def __init__(self):
+        self.parent: Dict[str, str] = {}
+
+    def find(self, item: str) -> str:
+        root = self.parent.setdefault(item, item)
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # Path compression
+        while item != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a: str, b: str):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[root_b] = root_a
+
+
+def cluster(
+    matches: List[Tuple[str, str, float]],
+    created_at: Dict[str, Any],
+    existing: Optional[Dict[str, Tuple[str, float]]] = None
+) -> Dict[str, Tuple[str, float]]:
+    """
+    Merge matched pairs (and existing groups) into identity groups.
+
+    Args:
+        matches: (expert_id, expert_id, score) pairs at or above the threshold
+        created_at: Creation time of every expert involved (picks the group key)
+        existing: expert_id -> (identity_id, match_score) for groups being extended
+
+    Returns:
+        expert_id -> (identity_id, match_score) for every member of a group
+    """
+    existing = existing or {}
+    groups = _UnionFind()
+    best: Dict[str, float] = {}
+    for expert_id, (identity_id, score) in existing.items():
+        groups.union(identity_id, expert_id)
+        best[expert_id] = score
+    for a, b, score in matches:
+        groups.union(a, b)
+        best[a] = max(best.get(a, 0.0), score)
+        best[b] = max(best.get(b, 0.0), score)
+
+    members: Dict[str, List[str]] = {}
+    for expert_id in best:
+        members.setdefault(groups.find(expert_id), []).append(expert_id)
+
+    result = {}
+    for group in members.values():
+        if len(group) < 2:
+            continue
+        identity_id = min(group, key=lambda expert_id: (created_at[expert_id], expert_id))
+        for expert_id in group:
+            result[expert_id] = (identity_id, best[expert_id])
+    return result
+
+
+def _match(pairs: Iterable[Tuple[Candidate, Candidate]]) -> Tuple[int, List[Tuple[str, str, float]]]:
+    compared = 0
+    matches = []
+    for a, b in pairs:
+        compared += 1
+        score = score_pair(a, b)
+        if score >= DEDUP_MATCH_THRESHOLD:
+            matches.append((a.id, b.id, score))
+    return compared, matches
+
+
+async def _store_groups(
+    conn: asyncpg.Connection,
+    campaign_id: str,
+    groups: Dict[str, Tuple[str, float]],
+    replace: bool
+):
+    async with conn.transaction():
+        if replace:
+            await conn.execute("DELETE FROM expert_network.expert_identity WHERE campaign_id = $1", campaign_id)
+        if not groups:
+            return
+        expert_ids = list(groups)
+        await conn.execute(
+            """
+            INSERT INTO expert_network.expert_identity (expert_id, campaign_id, identity_id, match_score)
+            SELECT g.expert_id::uuid, $1, g.identity_id::uuid, g.match_score
+            FROM unnest($2::text[], $3::text[], $4::real[]) AS g(expert_id, identity_id, match_score)
+            ON CONFLICT (expert_id) DO UPDATE
+            SET identity_id = EXCLUDED.identity_id, match_score = EXCLUDED.match_score, updated_at = NOW()
+            """,
+            campaign_id,
+            expert_ids,
+            [groups[expert_id][0] for expert_id in expert_ids],
+            [groups[expert_id][1] for expert_id in expert_ids],
+        )
+
+
+async def dedupe_campaign(campaign_id: str, conn: Optional[asyncpg.Connection] = None) -> Dict[str, int]:
+    """
+    Recompute every identity group of a campaign.
+
+    Returns:
+        Counts: experts, compared pairs, matched pairs, identities (groups)
+        and duplicates (group members beyond the first)
+    """
+    if conn is None:
+        async with get_db() as conn:
+            return await dedupe_campaign(campaign_id, conn=conn)
+
+    rows = await execute_query(
+        f"SELECT {CANDIDATE_COLUMNS} FROM expert_network.experts e WHERE e.campaign_id = $1",
+        campaign_id,
+        fetch_all=True,
+        conn=conn
+    )
+    candidates = [Candidate(row) for row in rows]
+    compared, matches = _match(candidate_pairs(candidates))
+    groups = cluster(matches, {candidate.id: candidate.created_at for candidate in candidates})
+    await _store_groups(conn, campaign_id, groups, replace=True)
+
+    identities = len({identity_id for identity_id, _ in groups.values()})
+    return {
+        "experts": len(candidates),
+        "compared_pairs": compared,
+        "matched_pairs": len(matches),
+        "identities": identities,
+        "duplicates": len(groups) - identities,
+    }
+
+
+async def dedupe_experts(
+    campaign_id: str,
+    expert_ids: List[str],
+    conn: Optional[asyncpg.Connection] = None
+) -> int:
+    """
+    Match newly inserted experts against their campaign and extend groups.
+
+    Returns:
+        Number of matched pairs
+    """
+    if not expert_ids:
+        return 0
+    if conn is None:
+        async with get_db() as conn:
+            return await dedupe_experts(campaign_id, expert_ids, conn=conn)
+
+    probe_rows = await execute_query(
+        f"""
+        SELECT {CANDIDATE_COLUMNS} FROM expert_network.experts e
+        WHERE e.campaign_id = $1 AND e.id = ANY($2::text[]::uuid[])
+        """,
+        campaign_id, list(expert_ids),
+        fetch_all=True,
+        conn=conn
+    )
+    probes = [Candidate(row) for row in probe_rows]
+    keys = sorted({key for probe in probes for key in probe.keys})
+    if not keys:
+        return 0
+
+    # Candidates through the name-key GIN index (migration 013)
+    block_rows = await execute_query(
+        f"""
+        SELECT {CANDIDATE_COLUMNS} FROM expert_network.experts e
+        WHERE e.campaign_id = $1 AND expert_network.expert_name_keys(e.name) && $2::text[]
+        """,
+        campaign_id, keys,
+        fetch_all=True,
+        conn=conn
+    )
+    candidates = [Candidate(row) for row in block_rows]
+    _, matches = _match(candidate_pairs(candidates, probes=probes))
+    if not matches:
+        return 0
+
+    # Every member of the groups the matched experts already belong to
+    matched_ids = sorted({expert_id for a, b, _ in matches for expert_id in (a, b)})
+    member_rows = await execute_query(
+        """
+        SELECT ei.expert_id, ei.identity_id, ei.match_score, e.created_at
+        FROM expert_network.expert_identity ei
+        JOIN expert_network.experts e ON e.id = ei.expert_id
+        WHERE ei.campaign_id = $1 AND ei.identity_id IN (
+            SELECT identity_id FROM expert_network.expert_identity
+            WHERE expert_id = ANY($2::text[]::uuid[])
+        )
+        """,
+        campaign_id, matched_ids,
+        fetch_all=True,
+        conn=conn
+    )
+    created_at = {candidate.id: candidate.created_at for candidate in candidates}
+    created_at.update((row["expert_id"], row["created_at"]) for row in member_rows)
+    existing = {row["expert_id"]: (row["identity_id"], row["match_score"]) for row in member_rows}
+
+    groups = cluster(matches, created_at, existing)
+    await _store_groups(conn, campaign_id, groups, replace=False)
+    return len(matches)
+
+
+# Strong references to in-flight background runs (the loop keeps only weak ones)
+_background: Set[asyncio.Task] = set()
+
+
+async def _dedupe_quietly(campaign_id: str, expert_ids: List[str]):
+    try:
+        await dedupe_experts(campaign_id, expert_ids)
+    except Exception as e:
+        print(f"[DB] WARNING: Expert dedup failed for campaign {campaign_id}: {e}")
+
+
+def schedule_dedup(campaign_id: str, expert_ids: List[str]):
+    """
+    Match new experts in the background (no-op when DEDUP_ON_INSERT is off).
+
+    Call it after the insert has committed, e.g. from FastAPI BackgroundTasks.
+    """
+    if DEDUP_ON_INSERT and expert_ids:
+        task = asyncio.get_running_loop().create_task(_dedupe_quietly(campaign_id, list(expert_ids)))
+        _background.add(task)
+        task.add_done_callback(_background.discard)
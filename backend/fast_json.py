@@ -0,0 +1,116 @@
+"""
+Fast JSON responses built on orjson.
+
+FastAPI's default path validates every response against its response_model,
+runs jsonable_encoder over the result and then json.dumps it. For list
+endpoints that is a large share of request CPU. This module provides:
+
+- FastJSONResponse: a JSONResponse that renders with orjson, handling UUID,
+  datetime, date, Decimal and Pydantic models natively.
+- FastJSONRoute: an APIRoute class for endpoints that opt in with the
+  @fast_json decorator. Their results are serialized straight through
+  FastJSONResponse, skipping response_model validation and filtering;
+  response_model is still used for the OpenAPI docs. Every other endpoint
+  keeps FastAPI's validation, so a row with extra columns cannot leak
+  fields the model does not declare.
+- fast_json: opt-in decorator for async GET endpoints whose result already
+  has exactly the shape of their response_model (explicit column lists, no
+  RETURNING * rows, no fields outside the model).
+
+The hot list endpoints do not depend on either: they build their body with
+dumps() from explicit SELECTs and return it via http_cache.
+
+Usage:
+    from fast_json import FastJSONRoute, fast_json
+
+    router = APIRouter(prefix="/api/things", route_class=FastJSONRoute)
+
+    @router.get("/{id}", response_model=Thing)         # validated path
+    async def get_thing(id: str): ...
+
+    @router.get("", response_model=ThingList)
+    @fast_json                                         # fast path
+    async def list_things(): ...
+"""
+
+import asyncio
+import functools
+import time
+from decimal import Decimal
+from typing import Any, Callable
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+from metrics import JSON_SERIALIZATION, METRICS_ENABLED
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="python")
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes with orjson."""
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        if not METRICS_ENABLED:
+            return dumps(content)
+        started = time.perf_counter()
+        body = dumps(content)
+        JSON_SERIALIZATION.observe(time.perf_counter() - started)
+        return body
+
+
+def fast_json(endpoint: Callable) -> Callable:
+    """Opt an endpoint into the fast path: its response_model is not enforced."""
+    endpoint._fast_json = True
+    return endpoint
+
+
+def _body_allowed(status_code: int) -> bool:
+    return not (status_code < 200 or status_code in (204, 205, 304))
+
+
+class FastJSONRoute(APIRoute):
+    """APIRoute that serializes @fast_json endpoint results directly with orjson."""
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs: Any):
+        methods = {m.upper() for m in (kwargs.get("methods") or ["GET"])}
+        if (
+            methods <= {"GET", "HEAD"}
+            and asyncio.iscoroutinefunction(endpoint)
+            and getattr(endpoint, "_fast_json", False)
+        ):
+            endpoint = self._wrap_endpoint(endpoint, kwargs.get("status_code") or 200)
+        super().__init__(path, endpoint, **kwargs)
+
+    @staticmethod
+    def _wrap_endpoint(endpoint: Callable, status_code: int) -> Callable:
+        # functools.wraps keeps the original signature visible to FastAPI's
+        # dependency resolution (inspect.signature follows __wrapped__).
+        @functools.wraps(endpoint)
+        async def fast_endpoint(*args: Any, **kwargs: Any) -> Any:
+            result = await endpoint(*args, **kwargs)
+            if isinstance(result, Response):
+                return result
+            if not _body_allowed(status_code):
+                return Response(status_code=status_code)
+            return FastJSONResponse(result, status_code=status_code)
+
+        return fast_endpoint
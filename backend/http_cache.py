@@ -0,0 +1,90 @@
+"""
+HTTP conditional-request helpers (ETag / If-None-Match / 304).
+
+Two kinds of ETag are used:
+
+- Strong ETags hash the rendered body (`make_etag`). They suit data already
+  held in memory, such as the vendor catalog.
+- Weak, validator-based ETags (`validator_etag`) hash a cheap change
+  validator (row counts, MAX/SUM of updated_at; see db.py) together with the
+  request URL and user. A list endpoint runs only the validator first and
+  answers a matching `If-None-Match` with 304, so it never runs the heavy
+  SELECT or serializes anything. Polling clients then cost one index-only
+  aggregate per poll while nothing has changed.
+
+Usage:
+    from http_cache import conditional_response, not_modified, request_matches, validator_etag
+
+    etag = validator_etag(request, user.user_id, await user_campaigns_validator(user.user_id))
+    if request_matches(request, etag):
+        return not_modified(etag, LIST_CACHE_CONTROL)
+    ...
+    return conditional_response(request, dumps(payload), etag=etag, cache_control=LIST_CACHE_CONTROL)
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+
+# Browsers may reuse the response but must revalidate it first
+LIST_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def validator_etag(request: Request, *parts: Any) -> str:
+    """Weak ETag for a response derived from change validators, not its bytes."""
+    material = "|".join([request.url.path, request.url.query, *(repr(part) for part in parts)])
+    return 'W/"' + hashlib.sha256(material.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match comparison (weak, per RFC 9110: W/ prefixes are ignored)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def request_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match matches `etag`."""
+    return etag_matches(request.headers.get("if-none-match"), etag)
+
+
+def not_modified(etag: str, cache_control: Optional[str] = None) -> Response:
+    """Bodyless 304 carrying the current validators."""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return Response(status_code=304, headers=headers)
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    etag: Optional[str] = None,
+    cache_control: Optional[str] = None,
+    media_type: str = "application/json",
+) -> Response:
+    """200 with the body, or 304 when the request's If-None-Match matches."""
+    etag = etag or make_etag(body)
+    if request_matches(request, etag):
+        return not_modified(etag, cache_control)
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return Response(body, media_type=media_type, headers=headers)
@@ -0,0 +1,239 @@
+"""
+Live campaign updates: Postgres LISTEN/NOTIFY fanned out to SSE subscribers.
+
+Triggers on experts, interviews and campaign_vendor_enrollments (migration
+012) send a compact `campaign_changes` notification per statement and
+campaign: table, operation, campaign_id, the owning user_id and up to 50 row
+ids. Each worker holds one dedicated listener connection and fans every
+notification out to its subscribers in memory; nothing touches the pool per
+event or per subscriber.
+
+- Subscribers are filtered by user (always) and campaign (optional).
+- Each subscriber has a bounded queue. A client too slow to drain it gets
+  its backlog replaced by a single `resync` event instead of growing memory
+  (backpressure by coalescing).
+- If the listener connection drops, it is re-established with backoff and
+  every subscriber gets `resync`, since notifications sent in between are
+  lost.
+
+Events are change hints, not data: clients fetch the rows through the delta
+feed (GET /api/campaigns/{id}/changes?since=<cursor>), which also makes
+reconnects lossless.
+
+Usage:
+    from live_updates import get_live_hub
+
+    hub = get_live_hub()
+    subscription = hub.subscribe(user_id, campaign_id)
+    try:
+        event = await subscription.next_event(timeout=15)
+    finally:
+        hub.unsubscribe(subscription)
+"""
+
+import asyncio
+import json
+import os
+from typing import Any, Dict, Optional, Set
+
+import asyncpg
+
+from db import ASYNCPG_URL, DB_PGBOUNCER_MODE
+
+
+LIVE_UPDATES_ENABLED = os.getenv('LIVE_UPDATES_ENABLED', 'true').lower() == 'true'
+LIVE_QUEUE_SIZE = int(os.getenv('LIVE_QUEUE_SIZE', '100'))
+LIVE_MAX_SUBSCRIBERS = int(os.getenv('LIVE_MAX_SUBSCRIBERS', '10000'))
+LIVE_HEARTBEAT_SECONDS = float(os.getenv('LIVE_HEARTBEAT_SECONDS', '15'))
+
+# NOTIFY channel raised by the migration 012 triggers
+LIVE_CHANNEL = "campaign_changes"
+
+# Listener reconnect backoff bounds (seconds)
+_RECONNECT_MIN = 0.5
+_RECONNECT_MAX = 30.0
+
+
+class Subscription:
+    """One SSE client's filter and bounded event queue."""
+
+    __slots__ = ("user_id", "campaign_id", "queue", "overflowed")
+
+    def __init__(self, user_id: str, campaign_id: Optional[str], queue_size: int = LIVE_QUEUE_SIZE):
+        self.user_id = user_id
+        self.campaign_id = campaign_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = 0
+
+    def offer(self, event: Dict[str, Any]):
+        """Enqueue without blocking; on overflow collapse the backlog into `resync`."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed += 1
+            self.reset({"event": "resync", "data": {"reason": "backlog"}})
+
+    def reset(self, event: Dict[str, Any]):
+        """Drop anything queued and leave only `event`."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def next_event(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Next event, or None after `timeout` seconds (time for a heartbeat)."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class LiveUpdateHub:
+    """Per-worker LISTEN connection and subscriber registry."""
+
+    def __init__(self, max_subscribers: int = LIVE_MAX_SUBSCRIBERS):
+        self.max_subscribers = max_subscribers
+        self._by_user: Dict[str, Set[Subscription]] = {}
+        self._by_campaign: Dict[str, Set[Subscription]] = {}
+        self._count = 0
+        self._listener: Optional[asyncpg.Connection] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.notifications = 0
+        self.delivered = 0
+
+    @property
+    def available(self) -> bool:
+        return self._listener is not None and not self._listener.is_closed()
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._count
+
+    # -- subscribers ---------------------------------------------------------
+
+    def subscribe(self, user_id: str, campaign_id: Optional[str] = None) -> Optional[Subscription]:
+        """Register a subscriber, or None when the worker is at LIVE_MAX_SUBSCRIBERS."""
+        if self._count >= self.max_subscribers:
+            return None
+        if campaign_id is not None:
+            # Notifications carry Postgres' lowercase UUID text
+            campaign_id = campaign_id.lower()
+        subscription = Subscription(user_id, campaign_id)
+        if campaign_id is None:
+            self._by_user.setdefault(user_id, set()).add(subscription)
+        else:
+            self._by_campaign.setdefault(campaign_id, set()).add(subscription)
+        self._count += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        index, key = (
+            (self._by_user, subscription.user_id) if subscription.campaign_id is None
+            else (self._by_campaign, subscription.campaign_id)
+        )
+        members = index.get(key)
+        if members is not None and subscription in members:
+            members.discard(subscription)
+            if not members:
+                del index[key]
+            self._count -= 1
+
+    # -- fan-out -------------------------------------------------------------
+
+    def publish(self, change: Dict[str, Any]):
+        """Deliver a change to matching subscribers (never blocks)."""
+        self.notifications += 1
+        change = dict(change)
+        user_id = change.pop("user_id", None)
+        if user_id is None:
+            # Cascaded deletes after the campaign row is gone: the owner is
+            # unknown, so nobody can be shown to be entitled to the event
+            return
+        campaign_id = change.get("campaign_id")
+        event = {"event": "change", "data": change}
+
+        targets = [
+            subscription for subscription in self._by_campaign.get(campaign_id, ())
+            if subscription.user_id == user_id
+        ]
+        targets.extend(self._by_user.get(user_id, ()))
+
+        for subscription in targets:
+            subscription.offer(event)
+        self.delivered += len(targets)
+
+    def broadcast_resync(self, reason: str):
+        event = {"event": "resync", "data": {"reason": reason}}
+        for index in (self._by_user, self._by_campaign):
+            for members in index.values():
+                for subscription in members:
+                    subscription.reset(event)
+
+    def _on_notify(self, connection, pid, channel, payload):
+        try:
+            change = json.loads(payload)
+        except ValueError:
+            print(f"[DB] WARNING: Ignoring malformed {LIVE_CHANNEL} payload")
+            return
+        self.publish(change)
+
+    # -- listener lifecycle --------------------------------------------------
+
+    async def _connect(self):
+        listener = await asyncpg.connect(ASYNCPG_URL)
+        await listener.add_listener(LIVE_CHANNEL, self._on_notify)
+        listener.add_termination_listener(self._on_terminated)
+        self._listener = listener
+
+    def _on_terminated(self, connection):
+        if self._stopping or connection is not self._listener:
+            return
+        print("[DB] WARNING: Live update listener disconnected, reconnecting")
+        self._listener = None
+        self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self):
+        delay = _RECONNECT_MIN
+        while not self._stopping:
+            try:
+                await self._connect()
+                # Anything sent while disconnected is gone; clients must refetch
+                self.broadcast_resync("listener reconnected")
+                print("[DB] Live update listener reconnected")
+                return
+            except Exception as e:
+                print(f"[DB] WARNING: Live update listener reconnect failed: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RECONNECT_MAX)
+
+    async def start(self):
+        """Open the LISTEN connection (skipped when disabled or behind PgBouncer)."""
+        if not LIVE_UPDATES_ENABLED or DB_PGBOUNCER_MODE:
+            return
+        try:
+            await self._connect()
+            print(f"[DB] Live update listener started on {LIVE_CHANNEL}")
+        except Exception as e:
+            print(f"[DB] WARNING: Live updates unavailable: {e}")
+
+    async def stop(self):
+        """Close the LISTEN connection and tell open streams to resync."""
+        self._stopping = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._listener is not None:
+            await self._listener.close()
+            self._listener = None
+        self.broadcast_resync("server shutdown")
+
+
+# Singleton hub
+_hub: Optional[LiveUpdateHub] = None
+
+
+def get_live_hub() -> LiveUpdateHub:
+    """Get the process-wide live update hub."""
+    global _hub
+    if _hub is None:
+        _hub = LiveUpdateHub()
+    return _hub
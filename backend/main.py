@@ -17,19 +17,60 @@ interview scheduling, and vendor platform integration.
 - **models/**: Pydantic models for request/response validation
 - **api/**: Domain-organized API routers
 - **db.py**: Database connection pooling and utilities
+- **fast_json.py**: orjson response class and fast-path route class
+- **query_stats.py**: Per-statement query statistics and slow-query log
+- **metrics.py**: Prometheus text-format metrics (GET /metrics)
+- **readiness.py**: Deep readiness probe (GET /ready)
+- **vendor_cache.py**: In-memory vendor catalog (LISTEN/NOTIFY refresh)
+- **http_cache.py**: ETag / If-None-Match helpers
+- **dedup.py**: Cross-vendor expert deduplication (expert_identity groups)
+- **ranking.py**: Vectorized expert ranking (GET /api/experts/ranked)
+- **similarity.py**: MinHash skill similarity index (GET /api/experts/{id}/similar)
+- **scheduling.py**: Interview double-booking detection and slot suggestions
+- **live_updates.py**: LISTEN/NOTIFY fan-out for the SSE stream (GET /api/events)
 
 ## Running the Server
 ```bash
 # Development
 uvicorn main:app --reload --host 0.0.0.0 --port 8000
 
-# Production
-uvicorn main:app --host 0.0.0.0 --port 8000 --workers 4
+# Production (WEB_CONCURRENCY tells db.py how many pools share DB_MAX_CONNECTIONS)
+WEB_CONCURRENCY=4 uvicorn main:app --host 0.0.0.0 --port 8000
 ```
 
 ## Environment Variables
 - DATABASE_URL: PostgreSQL connection string
 - ALLOWED_ORIGINS: Comma-separated list of allowed CORS origins (default: localhost:3000)
+- AUTH_CACHE_ENABLED / AUTH_CACHE_TTL_SECONDS / AUTH_CACHE_NEGATIVE_TTL_SECONDS /
+  AUTH_CACHE_MAX_ENTRIES: In-process session cache (see auth/session_cache.py)
+- RLS_TENANCY_ENABLED: Enforce campaign ownership with Postgres row-level security, once
+  switched on with expert_network.set_row_level_security(true) (see db.py)
+- DB_MAINTENANCE_ROLE: BYPASSRLS role scripts and cross-campaign jobs switch to
+  (see migrations/008_row_level_security.sql)
+- DB_POOL_MIN_SIZE / DB_POOL_MAX_SIZE / DB_MAX_CONNECTIONS / WEB_CONCURRENCY /
+  DB_COMMAND_TIMEOUT / DB_MAX_INACTIVE_CONNECTION_LIFETIME / DB_STATEMENT_CACHE_SIZE /
+  DB_PGBOUNCER_MODE / DB_POOL_WARMUP: Connection pool tuning (see db.py)
+- QUERY_STATS_SAMPLE_RATE / SLOW_QUERY_MS / SLOW_QUERY_EXPLAIN: Query instrumentation
+  and slow-query log (see query_stats.py, GET /api/admin/query-stats)
+- QUERY_STATS_ADMIN_ENABLED: Serve the /api/admin endpoints and GET /api/auth/session-cache;
+  404 when off (default: false)
+- METRICS_ENABLED: Request latency / pool / cache metrics at GET /metrics (default: true)
+- READY_DB_TIMEOUT_MS / READY_MAX_DB_LATENCY_MS / READY_MAX_AUTH_LATENCY_MS /
+  READY_MAX_POOL_UTILIZATION / READY_MAX_POOL_WAITING / READY_CACHE_SECONDS:
+  GET /ready thresholds (see readiness.py)
+- VENDOR_CACHE_TTL_SECONDS / VENDOR_CACHE_LISTEN / VENDOR_CACHE_MAX_AGE_SECONDS:
+  Vendor catalog cache (see vendor_cache.py)
+- SYNC_TOMBSTONE_RETENTION_DAYS / SYNC_MAX_HORIZON_LAG_SECONDS: Campaign delta-sync
+  feed (see api/sync.py)
+- LIVE_UPDATES_ENABLED / LIVE_QUEUE_SIZE / LIVE_MAX_SUBSCRIBERS / LIVE_HEARTBEAT_SECONDS /
+  LIVE_RETRY_MS: Live update stream (see live_updates.py, api/events.py)
+- DEDUP_MATCH_THRESHOLD / DEDUP_MIN_NAME_SIMILARITY / DEDUP_MAX_BLOCK_SIZE / DEDUP_WINDOW /
+  DEDUP_ON_INSERT: Cross-vendor expert deduplication (see dedup.py)
+- RANKING_CACHE_SIZE / RANKING_CACHE_TTL_SECONDS: Per-campaign ranking matrix cache (see ranking.py)
+- SIMILARITY_INDEX_ON_WRITE / SIMILARITY_REINDEX_BATCH / SIMILARITY_MAX_CANDIDATES: Expert
+  similarity index (see similarity.py)
+- INTERVIEW_CONFLICT_CHECK / INTERVIEW_CONFLICT_MAX_SLOTS: Interview double-booking checks (see scheduling.py)
+- SUGGEST_MAX_EXPERTS / SUGGEST_MAX_HORIZON_DAYS: Interview slot suggestions (see scheduling.py)
 """
 
 import os
@@ -37,12 +78,19 @@ from contextlib import asynccontextmanager
 from typing import List
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 # Import database lifecycle hooks
 from db import startup_db, shutdown_db
+from fast_json import FastJSONResponse
+from metrics import CONTENT_TYPE, METRICS_ENABLED, MetricsMiddleware, render_metrics
+from readiness import check_readiness
+from vendor_cache import get_vendor_catalog
+from live_updates import get_live_hub
 
 # Import API routers
+from api.auth import router as auth_router
+from api.admin import router as admin_router
 from api.vendors import router as vendors_router
 from api.projects import router as projects_router
 from api.campaigns import router as campaigns_router
@@ -50,6 +98,9 @@ from api.experts import router as experts_router
 from api.interviews import router as interviews_router
 from api.screening_questions import router as screening_questions_router
 from api.team_members import router as team_members_router
+from api.sync import router as sync_router
+from api.events import router as events_router
+from api.dedup import router as dedup_router
 
 
 # ============================================================================
@@ -121,6 +172,8 @@ async def lifespan(app: FastAPI):
     print("Initializing database connection pool...")
 
     await startup_db()
+    await get_vendor_catalog().start()
+    await get_live_hub().start()
 
     print("✓ Database connection pool initialized")
     print("✓ Application startup complete")
@@ -133,6 +186,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("\nShutting down application...")
+    await get_live_hub().stop()
+    await get_vendor_catalog().stop()
     await shutdown_db()
     print("✓ Application shutdown complete")
 
@@ -150,6 +205,10 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    # orjson-rendered JSON by default; on FastJSONRoute routers, GET endpoints
+    # whose rows already match their response_model opt in to skipping its
+    # validation with @fast_json (see fast_json.py)
+    default_response_class=FastJSONResponse,
 )
 
 
@@ -166,6 +225,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency histograms; added last so it wraps CORS and times everything
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 
 # ============================================================================
 # Root Endpoint
@@ -219,6 +282,35 @@ async def health():
     return {"status": "healthy"}
 
 
+@app.get(
+    "/ready",
+    tags=["Health"],
+    summary="Readiness check endpoint",
+    description="Checks database latency, auth lookups and pool saturation. Returns 503 when not ready."
+)
+async def ready():
+    """
+    Readiness check endpoint.
+
+    Unlike /health, this verifies the worker can reach Postgres quickly and
+    still has pool capacity, so load balancers can stop routing to it.
+    Results are cached briefly (READY_CACHE_SECONDS).
+
+    Returns:
+        Readiness report with per-check details (HTTP 503 when not ready)
+    """
+    report = await check_readiness()
+    return FastJSONResponse(report, status_code=200 if report["ready"] else 503)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint (text exposition format, this worker only)."""
+    if not METRICS_ENABLED:
+        return Response(status_code=404)
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
+
+
 # ============================================================================
 # Exception Handlers
 # ============================================================================
@@ -255,6 +347,8 @@ async def internal_error_handler(request, exc):
 # ============================================================================
 
 # Register all API routers
+app.include_router(auth_router)
+app.include_router(admin_router)
 app.include_router(vendors_router)
 app.include_router(projects_router)
 app.include_router(campaigns_router)
@@ -262,6 +356,9 @@ app.include_router(experts_router)
 app.include_router(interviews_router)
 app.include_router(screening_questions_router)
 app.include_router(team_members_router)
+app.include_router(sync_router)
+app.include_router(events_router)
+app.include_router(dedup_router)
 
 
 # ============================================================================
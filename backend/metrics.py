@@ -0,0 +1,233 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+No client library or push gateway is needed: metrics live in this worker's
+memory and `GET /metrics` renders them. With several uvicorn workers each
+worker keeps its own series (scrape each worker, or sum at query time).
+
+Collected:
+- http_request_duration_seconds{method,route,status}: latency histogram per
+  route template (e.g. /api/experts/{expert_id}), from MetricsMiddleware
+- http_requests_in_flight: requests currently being handled
+- json_serialization_seconds: orjson render time in FastJSONResponse
+- db_pool_*: asyncpg pool size, idle connections and waiting acquirers
+- auth_session_cache_*: session cache size, lookups and hit ratio
+
+Usage:
+    from metrics import MetricsMiddleware, render_metrics
+
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics")
+    async def metrics():
+        return Response(render_metrics(), media_type=CONTENT_TYPE)
+"""
+
+import os
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request latency buckets in seconds
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Serialization buckets in seconds
+SERIALIZATION_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+# Route label for requests that matched no route (404s, CORS preflights)
+UNMATCHED_ROUTE = "<unmatched>"
+
+# Long-lived streams would pin the in-flight gauge and skew latency; they are
+# counted by live_update_subscribers instead
+UNTIMED_PATHS = {"/api/events"}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a tuple of label values."""
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float], labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self.labelnames = tuple(labelnames)
+        # labels -> [bucket counts..., +Inf count], sum
+        self._series: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, labels: Tuple[str, ...] = ()):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = series
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+        total[0] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_format(total[0])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Gauge:
+    """Unlabelled gauge, either set directly or read from a callback at scrape time."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, help_text: str, collect: Optional[Callable[[], Optional[float]]] = None):
+        self.name = name
+        self.help_text = help_text
+        self.collect = collect
+        self.value = 0.0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+    def render(self) -> List[str]:
+        value = self.collect() if self.collect is not None else self.value
+        if value is None:
+            return []
+        return [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.metric_type}",
+            f"{self.name} {_format(value)}",
+        ]
+
+
+class Counter(Gauge):
+    """Monotonic counter read from a callback at scrape time."""
+
+    metric_type = "counter"
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method, route template and status code.",
+    REQUEST_BUCKETS,
+    ("method", "route", "status"),
+)
+
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled by this worker.",
+)
+
+JSON_SERIALIZATION = Histogram(
+    "json_serialization_seconds",
+    "Time spent rendering JSON response bodies with orjson.",
+    SERIALIZATION_BUCKETS,
+)
+
+
+def _pool_stat(key: str) -> Callable[[], Optional[float]]:
+    def collect() -> Optional[float]:
+        from db import get_pool_stats
+        stats = get_pool_stats()
+        return stats[key] if stats else None
+    return collect
+
+
+def _cache_stat(key: str) -> Callable[[], Optional[float]]:
+    def collect() -> Optional[float]:
+        from auth.session_cache import get_session_cache
+        cache = get_session_cache()
+        return cache.stats()[key] if cache is not None else None
+    return collect
+
+
+def _live_stat() -> Optional[float]:
+    from live_updates import get_live_hub
+    return get_live_hub().subscriber_count
+
+
+_SCRAPE_TIME = [
+    Gauge("db_pool_size", "Open connections in the asyncpg pool.", _pool_stat("size")),
+    Gauge("db_pool_idle", "Idle connections in the asyncpg pool.", _pool_stat("idle")),
+    Gauge("db_pool_max_size", "Configured maximum size of the asyncpg pool.", _pool_stat("max_size")),
+    Gauge("db_pool_waiting", "Callers waiting to acquire a pool connection.", _pool_stat("waiting")),
+    Gauge("auth_session_cache_size", "Entries in the session cache.", _cache_stat("size")),
+    Gauge("auth_session_cache_hit_ratio", "Session cache hits (incl. negative) over lookups.", _cache_stat("hit_ratio")),
+    Counter("auth_session_cache_hits_total", "Session cache positive hits.", _cache_stat("hits")),
+    Counter("auth_session_cache_negative_hits_total", "Session cache negative hits.", _cache_stat("negative_hits")),
+    Counter("auth_session_cache_misses_total", "Session cache misses.", _cache_stat("misses")),
+    Gauge("live_update_subscribers", "Open live-update (SSE) streams in this worker.", _live_stat),
+]
+
+
+def render_metrics() -> str:
+    """Render every metric in the text exposition format."""
+    lines: List[str] = []
+    for metric in [REQUEST_DURATION, REQUESTS_IN_FLIGHT, JSON_SERIALIZATION, *_SCRAPE_TIME]:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording per-route latency and in-flight requests."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in UNTIMED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+        REQUESTS_IN_FLIGHT.inc()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            # The router stores the matched route in the scope; use its template
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                (scope["method"], route, str(status)),
+            )
@@ -0,0 +1,187 @@
+-- Migration: Materialize per-campaign counters
+--
+-- list_campaigns / get_campaign_detail used to LEFT JOIN experts, interviews
+-- and campaign_vendor_enrollments together and COUNT(DISTINCT ...), which
+-- builds an experts x interviews x enrollments product per campaign.
+--
+-- This migration keeps those counts in a 1:1 rollup table maintained by
+-- statement-level triggers (so bulk INSERT/DELETE adjust each campaign once
+-- per statement, not once per row). A separate table is used instead of
+-- columns on campaigns so counter bumps do not touch campaigns.updated_at.
+
+-- =============================================================================
+-- ROLLUP TABLE
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS expert_network.campaign_counters (
+    campaign_id UUID PRIMARY KEY,
+    expert_count INTEGER NOT NULL DEFAULT 0,
+    interview_count INTEGER NOT NULL DEFAULT 0,
+    vendor_enrollment_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT fk_campaign_counters_campaign FOREIGN KEY (campaign_id)
+        REFERENCES expert_network.campaigns(id) ON DELETE CASCADE
+);
+
+COMMENT ON TABLE expert_network.campaign_counters IS 'Trigger-maintained expert/interview/enrollment counts per campaign';
+
+-- =============================================================================
+-- TRIGGER FUNCTIONS
+-- =============================================================================
+
+-- Create the counters row alongside each new campaign
+CREATE OR REPLACE FUNCTION expert_network.init_campaign_counters()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO expert_network.campaign_counters (campaign_id)
+    SELECT id FROM new_rows
+    ON CONFLICT (campaign_id) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Adjust one counter column (TG_ARGV[0]) from the statement's transition tables
+CREATE OR REPLACE FUNCTION expert_network.bump_campaign_counter()
+RETURNS TRIGGER AS $$
+DECLARE
+    counter_column TEXT := TG_ARGV[0];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        EXECUTE format(
+            'UPDATE expert_network.campaign_counters cc
+             SET %1$I = cc.%1$I + d.n, updated_at = NOW()
+             FROM (SELECT campaign_id, COUNT(*) AS n FROM new_rows GROUP BY campaign_id) d
+             WHERE cc.campaign_id = d.campaign_id',
+            counter_column
+        );
+    ELSIF TG_OP = 'DELETE' THEN
+        EXECUTE format(
+            'UPDATE expert_network.campaign_counters cc
+             SET %1$I = GREATEST(cc.%1$I - d.n, 0), updated_at = NOW()
+             FROM (SELECT campaign_id, COUNT(*) AS n FROM old_rows GROUP BY campaign_id) d
+             WHERE cc.campaign_id = d.campaign_id',
+            counter_column
+        );
+    ELSIF TG_OP = 'UPDATE' THEN
+        -- Only rows that moved between campaigns affect the counts
+        EXECUTE format(
+            'UPDATE expert_network.campaign_counters cc
+             SET %1$I = GREATEST(cc.%1$I + d.n, 0), updated_at = NOW()
+             FROM (
+                 SELECT campaign_id, SUM(delta) AS n
+                 FROM (
+                     SELECT n.campaign_id, 1 AS delta
+                     FROM new_rows n JOIN old_rows o ON o.id = n.id
+                     WHERE o.campaign_id IS DISTINCT FROM n.campaign_id
+                     UNION ALL
+                     SELECT o.campaign_id, -1 AS delta
+                     FROM new_rows n JOIN old_rows o ON o.id = n.id
+                     WHERE o.campaign_id IS DISTINCT FROM n.campaign_id
+                 ) moved
+                 GROUP BY campaign_id
+             ) d
+             WHERE cc.campaign_id = d.campaign_id',
+            counter_column
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Recompute counters from scratch (repair tool; pass NULL for all campaigns)
+CREATE OR REPLACE FUNCTION expert_network.refresh_campaign_counters(target_campaign_id UUID DEFAULT NULL)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO expert_network.campaign_counters
+        (campaign_id, expert_count, interview_count, vendor_enrollment_count, updated_at)
+    SELECT
+        c.id,
+        (SELECT COUNT(*) FROM expert_network.experts e WHERE e.campaign_id = c.id),
+        (SELECT COUNT(*) FROM expert_network.interviews i WHERE i.campaign_id = c.id),
+        (SELECT COUNT(*) FROM expert_network.campaign_vendor_enrollments cve WHERE cve.campaign_id = c.id),
+        NOW()
+    FROM expert_network.campaigns c
+    WHERE target_campaign_id IS NULL OR c.id = target_campaign_id
+    ON CONFLICT (campaign_id) DO UPDATE SET
+        expert_count = EXCLUDED.expert_count,
+        interview_count = EXCLUDED.interview_count,
+        vendor_enrollment_count = EXCLUDED.vendor_enrollment_count,
+        updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql;
+
+-- =============================================================================
+-- TRIGGERS
+-- =============================================================================
+-- Transition tables require one trigger per event.
+
+CREATE TRIGGER campaigns_init_counters
+    AFTER INSERT ON expert_network.campaigns
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expert_network.init_campaign_counters();
+
+-- Experts
+CREATE TRIGGER experts_count_insert
+    AFTER INSERT ON expert_network.experts
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expert_network.bump_campaign_counter('expert_count');
+
+CREATE TRIGGER experts_count_delete
+    AFTER DELETE ON expert_network.experts
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expert_network.bump_campaign_counter('expert_count');
+
+CREATE TRIGGER experts_count_update
+    AFTER UPDATE ON expert_network.experts
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expert_network.bump_campaign_counter('expert_count');
+
+-- Interviews
+CREATE TRIGGER interviews_count_insert
+    AFTER INSERT ON expert_network.interviews
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expert_network.bump_campaign_counter('interview_count');
+
+CREATE TRIGGER interviews_count_delete
+    AFTER DELETE ON expert_network.interviews
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expert_network.bump_campaign_counter('interview_count');
+
+CREATE TRIGGER interviews_count_update
+    AFTER UPDATE ON expert_network.interviews
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expert_network.bump_campaign_counter('interview_count');
+
+-- Vendor enrollments
+CREATE TRIGGER enrollments_count_insert
+    AFTER INSERT ON expert_network.campaign_vendor_enrollments
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expert_network.bump_campaign_counter('vendor_enrollment_count');
+
+CREATE TRIGGER enrollments_count_delete
+    AFTER DELETE ON expert_network.campaign_vendor_enrollments
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expert_network.bump_campaign_counter('vendor_enrollment_count');
+
+CREATE TRIGGER enrollments_count_update
+    AFTER UPDATE ON expert_network.campaign_vendor_enrollments
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION expert_network.bump_campaign_counter('vendor_enrollment_count');
+
+-- =============================================================================
+-- LIST ORDERING INDEX
+-- =============================================================================
+-- Matches list_campaigns' WHERE user_id = $1 ORDER BY display_order, created_at DESC
+
+CREATE INDEX IF NOT EXISTS idx_campaigns_user_list
+    ON expert_network.campaigns(user_id, display_order, created_at DESC);
+
+-- =============================================================================
+-- BACKFILL
+-- =============================================================================
+
+SELECT expert_network.refresh_campaign_counters();
+
+SELECT 'campaign_counters materialized for ' || COUNT(*) || ' campaigns' AS status
+FROM expert_network.campaign_counters;
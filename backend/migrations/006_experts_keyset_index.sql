@@ -0,0 +1,9 @@
+-- Migration: Keyset pagination index for experts
+--
+-- GET /api/experts pages through a campaign's experts newest-first using
+-- WHERE campaign_id = $1 AND (created_at, id) < ($2, $3)
+-- ORDER BY created_at DESC, id DESC LIMIT n
+-- This index turns every page into a bounded index range scan.
+
+CREATE INDEX IF NOT EXISTS idx_experts_campaign_keyset
+    ON expert_network.experts(campaign_id, created_at DESC, id DESC);
@@ -0,0 +1,43 @@
+-- Migration: Ranked fuzzy search over experts
+--
+-- Backs GET /api/experts/search. Two stored generated columns are added:
+--   search_vector - weighted tsvector over name (A), title/company/skills (B)
+--                   and description (C) for full-text matching and ranking
+--   search_text   - flat name/title/company/skills string for trigram
+--                   (typo-tolerant) matching
+-- Both are indexed with GIN, so a search is a bitmap index scan instead of
+-- shipping every expert to the browser.
+--
+-- NOTE: adding stored generated columns rewrites the experts table.
+
+-- array_to_string is only STABLE; generated columns need an IMMUTABLE wrapper
+CREATE OR REPLACE FUNCTION expert_network.immutable_array_to_string(arr TEXT[], sep TEXT)
+RETURNS TEXT AS $$
+    SELECT array_to_string(arr, sep);
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+ALTER TABLE expert_network.experts
+    ADD COLUMN IF NOT EXISTS search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('english'::regconfig, coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(company, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(expert_network.immutable_array_to_string(skills, ' '), '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C')
+    ) STORED;
+
+ALTER TABLE expert_network.experts
+    ADD COLUMN IF NOT EXISTS search_text TEXT GENERATED ALWAYS AS (
+        coalesce(name, '') || ' ' ||
+        coalesce(title, '') || ' ' ||
+        coalesce(company, '') || ' ' ||
+        coalesce(expert_network.immutable_array_to_string(skills, ' '), '')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_experts_search_vector
+    ON expert_network.experts USING gin(search_vector);
+
+CREATE INDEX IF NOT EXISTS idx_experts_search_text_trgm
+    ON expert_network.experts USING gin(search_text gin_trgm_ops);
+
+COMMENT ON COLUMN expert_network.experts.search_vector IS 'Weighted full-text vector for /api/experts/search';
+COMMENT ON COLUMN expert_network.experts.search_text IS 'Flat text for trigram fuzzy matching in /api/experts/search';
@@ -0,0 +1,150 @@
+-- Migration: Row-level security for campaign tenancy
+--
+-- With RLS_TENANCY_ENABLED=true, db.get_db() scopes each checkout to the
+-- request's user by setting app.user_id. These policies then restrict
+-- campaigns, and everything hanging off a campaign, to that user's rows.
+--
+-- This migration only defines the policies; row-level security stays off
+-- until it is switched on explicitly, together with the API setting:
+--
+--   SELECT expert_network.set_row_level_security(true);
+--
+-- Once on, the policies fail closed: a session that never set app.user_id
+-- sees no rows and can write none. Work that runs without a user
+-- (migrations, seed and maintenance scripts) must then run as a role that
+-- bypasses row-level security: a superuser, or the
+-- expert_network_maintenance role created below (SET ROLE to it, or set
+-- DB_MAINTENANCE_ROLE for scripts using db.get_maintenance_db()).
+--
+-- NOTE: superusers and roles with BYPASSRLS ignore policies entirely. In
+-- tenancy mode the API must connect as an ordinary role. db.startup_db()
+-- refuses to start when the API setting, the switch and the role disagree.
+
+-- =============================================================================
+-- CURRENT APP USER
+-- =============================================================================
+
+-- NULL when unset (a custom setting reads '' after RESET, hence NULLIF); no
+-- row matches a NULL user, so unscoped sessions see nothing
+CREATE OR REPLACE FUNCTION expert_network.current_app_user()
+RETURNS TEXT AS $$
+    SELECT NULLIF(current_setting('app.user_id', true), '');
+$$ LANGUAGE sql STABLE PARALLEL SAFE;
+
+-- =============================================================================
+-- MAINTENANCE ROLE
+-- =============================================================================
+-- NOLOGIN and BYPASSRLS, with data access to the schema. BYPASSRLS is not
+-- inherited through membership: members must SET ROLE expert_network_maintenance.
+-- Creating a BYPASSRLS role needs a superuser; without one the migration
+-- carries on and the role has to be created by a DBA.
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'expert_network_maintenance') THEN
+        CREATE ROLE expert_network_maintenance NOLOGIN BYPASSRLS;
+    END IF;
+    GRANT USAGE ON SCHEMA expert_network TO expert_network_maintenance;
+    GRANT SELECT, INSERT, UPDATE, DELETE ON ALL TABLES IN SCHEMA expert_network TO expert_network_maintenance;
+    GRANT USAGE, SELECT, UPDATE ON ALL SEQUENCES IN SCHEMA expert_network TO expert_network_maintenance;
+    ALTER DEFAULT PRIVILEGES IN SCHEMA expert_network
+        GRANT SELECT, INSERT, UPDATE, DELETE ON TABLES TO expert_network_maintenance;
+    ALTER DEFAULT PRIVILEGES IN SCHEMA expert_network
+        GRANT USAGE, SELECT, UPDATE ON SEQUENCES TO expert_network_maintenance;
+    EXECUTE format('GRANT expert_network_maintenance TO %I', current_user);
+EXCEPTION WHEN insufficient_privilege THEN
+    RAISE NOTICE 'Could not set up role expert_network_maintenance (needs a superuser); create it with BYPASSRLS and grant it data access to expert_network';
+END;
+$$;
+
+-- =============================================================================
+-- CAMPAIGNS
+-- =============================================================================
+
+DROP POLICY IF EXISTS campaigns_tenant ON expert_network.campaigns;
+CREATE POLICY campaigns_tenant ON expert_network.campaigns
+    USING (user_id = expert_network.current_app_user());
+
+-- =============================================================================
+-- CAMPAIGN-SCOPED TABLES
+-- =============================================================================
+-- Same predicate for each table with a campaign_id column. USING doubles as
+-- WITH CHECK, so rows cannot be inserted into (or moved to) another user's
+-- campaign either.
+
+DO $$
+DECLARE
+    scoped_table TEXT;
+BEGIN
+    FOREACH scoped_table IN ARRAY ARRAY[
+        'experts',
+        'interviews',
+        'screening_questions',
+        'campaign_vendor_enrollments',
+        'campaign_counters'
+    ]
+    LOOP
+        EXECUTE format('DROP POLICY IF EXISTS %I ON expert_network.%I', scoped_table || '_tenant', scoped_table);
+        EXECUTE format(
+            'CREATE POLICY %I ON expert_network.%I
+                USING (
+                    campaign_id IN (
+                        SELECT id FROM expert_network.campaigns
+                        WHERE user_id = expert_network.current_app_user()
+                    )
+                )',
+            scoped_table || '_tenant', scoped_table
+        );
+    END LOOP;
+END;
+$$;
+
+-- =============================================================================
+-- EXPERT SCREENING RESPONSES
+-- =============================================================================
+-- No campaign_id column; scoped through the owning expert.
+
+DROP POLICY IF EXISTS expert_screening_responses_tenant ON expert_network.expert_screening_responses;
+CREATE POLICY expert_screening_responses_tenant ON expert_network.expert_screening_responses
+    USING (
+        expert_id IN (
+            SELECT e.id
+            FROM expert_network.experts e
+            JOIN expert_network.campaigns c ON e.campaign_id = c.id
+            WHERE c.user_id = expert_network.current_app_user()
+        )
+    );
+
+-- =============================================================================
+-- SWITCH
+-- =============================================================================
+-- Enables and FORCEs (or disables) row-level security on every table in the
+-- schema that has a policy, so tables added by later migrations follow the
+-- same switch. FORCE applies the policies to the table owner as well.
+
+CREATE OR REPLACE FUNCTION expert_network.set_row_level_security(enabled BOOLEAN)
+RETURNS VOID AS $$
+DECLARE
+    scoped_table TEXT;
+BEGIN
+    FOR scoped_table IN
+        SELECT DISTINCT tablename FROM pg_policies WHERE schemaname = 'expert_network'
+    LOOP
+        IF enabled THEN
+            EXECUTE format('ALTER TABLE expert_network.%I ENABLE ROW LEVEL SECURITY', scoped_table);
+            EXECUTE format('ALTER TABLE expert_network.%I FORCE ROW LEVEL SECURITY', scoped_table);
+        ELSE
+            EXECUTE format('ALTER TABLE expert_network.%I NO FORCE ROW LEVEL SECURITY', scoped_table);
+            EXECUTE format('ALTER TABLE expert_network.%I DISABLE ROW LEVEL SECURITY', scoped_table);
+        END IF;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION expert_network.set_row_level_security(BOOLEAN) IS 'Switch campaign tenancy row-level security on or off (pair with RLS_TENANCY_ENABLED)';
+
+-- Whether the switch is on (campaigns is the table every policy refers to)
+CREATE OR REPLACE FUNCTION expert_network.row_level_security_enabled()
+RETURNS BOOLEAN AS $$
+    SELECT relrowsecurity FROM pg_class WHERE oid = 'expert_network.campaigns'::regclass;
+$$ LANGUAGE sql STABLE;
@@ -0,0 +1,20 @@
+-- Migration: Notify API workers when vendor_platforms changes
+--
+-- Each worker keeps the vendor catalog in memory (see vendor_cache.py) and
+-- LISTENs on vendor_platforms_changed. One notification per statement is
+-- enough: listeners reload the whole (small) table rather than applying
+-- row-level deltas. NOTIFY is delivered on commit, so workers never reload
+-- before the change is visible.
+
+CREATE OR REPLACE FUNCTION expert_network.notify_vendor_platforms_changed()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('vendor_platforms_changed', TG_OP);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS notify_vendor_platforms_changed ON expert_network.vendor_platforms;
+CREATE TRIGGER notify_vendor_platforms_changed
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON expert_network.vendor_platforms
+    FOR EACH STATEMENT EXECUTE FUNCTION expert_network.notify_vendor_platforms_changed();
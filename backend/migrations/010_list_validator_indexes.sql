@@ -0,0 +1,18 @@
+-- Migration: Covering indexes for conditional-GET change validators
+--
+-- GET /api/campaigns, /api/experts and /api/interviews first run a small
+-- aggregate (COUNT, MAX/SUM of updated_at; see the *_VALIDATOR_QUERY
+-- statements in db.py) and answer 304 when the client's ETag still matches.
+-- Including updated_at in the scoping index lets those aggregates run as
+-- index-only scans instead of visiting every heap row on each poll. For
+-- experts and interviews it is a key column, so the same index also serves
+-- range scans on updated_at within a campaign (the delta-sync feed, 011).
+
+CREATE INDEX IF NOT EXISTS idx_campaigns_user_validator
+    ON expert_network.campaigns(user_id) INCLUDE (id, project_id, updated_at);
+
+CREATE INDEX IF NOT EXISTS idx_experts_campaign_updated
+    ON expert_network.experts(campaign_id, updated_at);
+
+CREATE INDEX IF NOT EXISTS idx_interviews_campaign_updated
+    ON expert_network.interviews(campaign_id, updated_at);
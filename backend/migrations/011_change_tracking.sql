@@ -0,0 +1,115 @@
+-- Migration: Change tracking for the campaign delta-sync feed
+--
+-- GET /api/campaigns/{id}/changes?since=<cursor> (api/sync.py) returns the
+-- campaign-scoped rows whose updated_at (assigned_at for team assignments)
+-- is at or after the cursor (a range scan on the (campaign_id, updated_at)
+-- indexes from migration 010). Updates and inserts are already visible that
+-- way. Deletes are not, so this migration records a tombstone for every
+-- deleted row, written by statement-level triggers (one INSERT ... SELECT
+-- per DELETE statement, however many rows it removes).
+--
+-- Tombstones outlive the campaign (no foreign key) and are purged with
+-- expert_network.purge_deleted_rows(); cursors older than the retention
+-- window get 410 Gone and must resync from scratch.
+
+-- =============================================================================
+-- TOMBSTONES
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS expert_network.deleted_rows (
+    id BIGSERIAL PRIMARY KEY,
+    table_name TEXT NOT NULL,
+    row_id UUID NOT NULL,
+    campaign_id UUID NOT NULL,
+    deleted_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_deleted_rows_campaign
+    ON expert_network.deleted_rows(campaign_id, deleted_at);
+CREATE INDEX IF NOT EXISTS idx_deleted_rows_deleted_at
+    ON expert_network.deleted_rows(deleted_at);
+
+COMMENT ON TABLE expert_network.deleted_rows IS 'Tombstones for the campaign delta-sync feed';
+
+-- Record one tombstone per deleted row; TG_ARGV[0] names the row id column
+-- (campaign_team_assignments has no id, its member id identifies the row)
+CREATE OR REPLACE FUNCTION expert_network.record_deleted_rows()
+RETURNS TRIGGER AS $$
+BEGIN
+    EXECUTE format(
+        'INSERT INTO expert_network.deleted_rows (table_name, row_id, campaign_id)
+         SELECT %L, %I, campaign_id FROM old_rows',
+        TG_TABLE_NAME, TG_ARGV[0]
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    tracked RECORD;
+BEGIN
+    FOR tracked IN
+        SELECT * FROM (VALUES
+            ('experts', 'id'),
+            ('interviews', 'id'),
+            ('screening_questions', 'id'),
+            ('campaign_vendor_enrollments', 'id'),
+            ('campaign_team_assignments', 'team_member_id')
+        ) AS t(table_name, id_column)
+    LOOP
+        EXECUTE format(
+            'DROP TRIGGER IF EXISTS %I ON expert_network.%I',
+            'record_' || tracked.table_name || '_deletes', tracked.table_name
+        );
+        EXECUTE format(
+            'CREATE TRIGGER %I
+                AFTER DELETE ON expert_network.%I
+                REFERENCING OLD TABLE AS old_rows
+                FOR EACH STATEMENT EXECUTE FUNCTION expert_network.record_deleted_rows(%L)',
+            'record_' || tracked.table_name || '_deletes', tracked.table_name, tracked.id_column
+        );
+    END LOOP;
+END;
+$$;
+
+-- Drop tombstones older than the feed's retention window
+CREATE OR REPLACE FUNCTION expert_network.purge_deleted_rows(retain INTERVAL DEFAULT INTERVAL '30 days')
+RETURNS BIGINT AS $$
+    WITH purged AS (
+        DELETE FROM expert_network.deleted_rows
+        WHERE deleted_at < NOW() - retain
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM purged;
+$$ LANGUAGE sql;
+
+-- =============================================================================
+-- ROW-LEVEL SECURITY (see 008_row_level_security.sql)
+-- =============================================================================
+-- Reads are scoped like the other campaign tables. Inserts are unrestricted:
+-- they only come from the trigger above, and when a campaign is deleted its
+-- cascaded child deletes run after the campaign row is gone, so a campaign
+-- ownership check would reject them. There is no DELETE policy: only roles
+-- that bypass row-level security (expert_network_maintenance) purge.
+
+
+DROP POLICY IF EXISTS deleted_rows_tenant ON expert_network.deleted_rows;
+CREATE POLICY deleted_rows_tenant ON expert_network.deleted_rows
+    FOR SELECT
+    USING (
+        campaign_id IN (
+            SELECT id FROM expert_network.campaigns
+            WHERE user_id = expert_network.current_app_user()
+        )
+    );
+
+DROP POLICY IF EXISTS deleted_rows_record ON expert_network.deleted_rows;
+CREATE POLICY deleted_rows_record ON expert_network.deleted_rows
+    FOR INSERT
+    WITH CHECK (true);
+
+DROP POLICY IF EXISTS deleted_rows_purge ON expert_network.deleted_rows;
+
+-- Apply the current row-level security switch (008) to the new table
+SELECT expert_network.set_row_level_security(expert_network.row_level_security_enabled());
@@ -0,0 +1,84 @@
+-- Migration: NOTIFY live-update subscribers of campaign changes
+--
+-- GET /api/events (api/events.py) streams change hints over Server-Sent
+-- Events. Each API worker LISTENs on campaign_changes with one dedicated
+-- connection (live_updates.py) and fans notifications out to its streams.
+--
+-- Statement-level triggers send one notification per statement and campaign,
+-- however many rows changed:
+--
+--   {"table": "experts", "op": "update", "campaign_id": "...",
+--    "user_id": "...", "ids": ["...", ...], "n": 3}
+--
+-- `ids` is omitted (null) above 50 rows to stay well under NOTIFY's 8000-byte
+-- payload limit; clients fetch the rows from the delta-sync feed either way.
+-- `user_id` is null when the campaign row is already gone (cascaded deletes);
+-- live_updates.py drops those, since no subscriber can be matched to them.
+-- NOTIFY is delivered on commit, so a hint never arrives before its change is
+-- visible, and identical notifications within a transaction are collapsed.
+
+CREATE OR REPLACE FUNCTION expert_network.notify_campaign_changes()
+RETURNS TRIGGER AS $$
+DECLARE
+    change RECORD;
+BEGIN
+    FOR change IN EXECUTE format(
+        'SELECT r.campaign_id, c.user_id, COUNT(*) AS n,
+                CASE WHEN COUNT(*) <= 50 THEN array_agg(r.id) END AS ids
+         FROM (%s) r
+         LEFT JOIN expert_network.campaigns c ON c.id = r.campaign_id
+         GROUP BY r.campaign_id, c.user_id',
+        CASE TG_OP
+            WHEN 'INSERT' THEN 'SELECT id, campaign_id FROM new_rows'
+            WHEN 'DELETE' THEN 'SELECT id, campaign_id FROM old_rows'
+            -- A row moved between campaigns changes both of them
+            ELSE 'SELECT id, campaign_id FROM new_rows
+                  UNION SELECT id, campaign_id FROM old_rows'
+        END
+    )
+    LOOP
+        PERFORM pg_notify('campaign_changes', json_build_object(
+            'table', TG_TABLE_NAME,
+            'op', lower(TG_OP),
+            'campaign_id', change.campaign_id,
+            'user_id', change.user_id,
+            'ids', change.ids,
+            'n', change.n
+        )::text);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Transition tables need one trigger per event
+DO $$
+DECLARE
+    tracked TEXT;
+    event TEXT;
+BEGIN
+    FOREACH tracked IN ARRAY ARRAY['experts', 'interviews', 'campaign_vendor_enrollments']
+    LOOP
+        FOREACH event IN ARRAY ARRAY['insert', 'update', 'delete']
+        LOOP
+            EXECUTE format(
+                'DROP TRIGGER IF EXISTS %I ON expert_network.%I',
+                'notify_' || tracked || '_' || event, tracked
+            );
+            EXECUTE format(
+                'CREATE TRIGGER %I
+                    AFTER %s ON expert_network.%I
+                    REFERENCING %s
+                    FOR EACH STATEMENT EXECUTE FUNCTION expert_network.notify_campaign_changes()',
+                'notify_' || tracked || '_' || event,
+                upper(event),
+                tracked,
+                CASE event
+                    WHEN 'insert' THEN 'NEW TABLE AS new_rows'
+                    WHEN 'delete' THEN 'OLD TABLE AS old_rows'
+                    ELSE 'OLD TABLE AS old_rows NEW TABLE AS new_rows'
+                END
+            );
+        END LOOP;
+    END LOOP;
+END;
+$$;
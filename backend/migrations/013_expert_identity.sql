@@ -0,0 +1,80 @@
+-- Migration: Cross-vendor expert identities
+--
+-- The same person is often proposed for one campaign by several vendors.
+-- dedup.py groups those proposals: every expert found to duplicate another
+-- gets an expert_identity row naming its group (identity_id, the id of the
+-- group's earliest proposal). Experts with no duplicate have no row.
+--
+-- Candidate pairs are "blocked" on name keys computed here, in SQL, so the
+-- batch and incremental paths agree and the incremental path can find an
+-- expert's candidates through a GIN index instead of scanning the campaign.
+-- A name key is a name token plus the initial of another token of the same
+-- name ("chen:s", "sarah:c" for "Dr. Sarah Chen"), which tolerates token
+-- order, middle names, honorifics and initials.
+
+-- =============================================================================
+-- NAME NORMALIZATION AND BLOCKING KEYS
+-- =============================================================================
+
+-- Lowercase, punctuation to spaces, honorifics and suffixes removed
+CREATE OR REPLACE FUNCTION expert_network.normalize_person_name(name TEXT)
+RETURNS TEXT AS $$
+    SELECT btrim(regexp_replace(
+        regexp_replace(
+            regexp_replace(lower(COALESCE(name, '')), '[^[:alnum:]]+', ' ', 'g'),
+            '\m(dr|prof|mr|mrs|ms|phd|md|mba|jr|sr|ii|iii)\M', ' ', 'g'
+        ),
+        '\s+', ' ', 'g'
+    ));
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+CREATE OR REPLACE FUNCTION expert_network.expert_name_keys(name TEXT)
+RETURNS TEXT[] AS $$
+    SELECT COALESCE(array_agg(DISTINCT t.token || ':' || left(u.token, 1)), '{}')
+    FROM unnest(string_to_array(expert_network.normalize_person_name(name), ' '))
+        WITH ORDINALITY AS t(token, pos)
+    JOIN unnest(string_to_array(expert_network.normalize_person_name(name), ' '))
+        WITH ORDINALITY AS u(token, pos) ON t.pos <> u.pos
+    WHERE length(t.token) >= 2;
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+CREATE INDEX IF NOT EXISTS idx_experts_name_keys
+    ON expert_network.experts USING gin (expert_network.expert_name_keys(name));
+
+-- =============================================================================
+-- IDENTITY GROUPS
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS expert_network.expert_identity (
+    expert_id UUID PRIMARY KEY,
+    campaign_id UUID NOT NULL,
+    identity_id UUID NOT NULL,
+    match_score REAL NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT fk_expert_identity_expert FOREIGN KEY (expert_id)
+        REFERENCES expert_network.experts(id) ON DELETE CASCADE,
+    CONSTRAINT fk_expert_identity_campaign FOREIGN KEY (campaign_id)
+        REFERENCES expert_network.campaigns(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_expert_identity_campaign
+    ON expert_network.expert_identity(campaign_id, identity_id);
+
+COMMENT ON TABLE expert_network.expert_identity IS 'Cross-vendor duplicate groups of experts (see dedup.py)';
+COMMENT ON COLUMN expert_network.expert_identity.identity_id IS 'Group key: id of the earliest proposal in the group (it may since have been deleted)';
+COMMENT ON COLUMN expert_network.expert_identity.match_score IS 'Best pair score linking this expert into the group (0-1)';
+
+-- Same tenancy policy as the other campaign-scoped tables (008)
+
+DROP POLICY IF EXISTS expert_identity_tenant ON expert_network.expert_identity;
+CREATE POLICY expert_identity_tenant ON expert_network.expert_identity
+    USING (
+        campaign_id IN (
+            SELECT id FROM expert_network.campaigns
+            WHERE user_id = expert_network.current_app_user()
+        )
+    );
+
+-- Apply the current row-level security switch (008) to the new table
+SELECT expert_network.set_row_level_security(expert_network.row_level_security_enabled());
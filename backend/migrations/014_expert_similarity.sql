@@ -0,0 +1,56 @@
+-- Migration: Skill similarity index for "find more like this expert"
+--
+-- similarity.py turns each expert's skills, title and description into a
+-- set of tokens and stores a MinHash signature of that set here: one 32-bit
+-- minimum per hash function (SIGNATURE_SIZE of them). The share of equal
+-- positions in two signatures estimates the Jaccard similarity of the two
+-- token sets.
+--
+-- To avoid comparing an expert with every other one, the signature is also
+-- cut into bands of a few positions each, and each band is hashed to a
+-- 64-bit key (locality-sensitive hashing). Experts sharing at least one band
+-- key are candidates; the GIN index on `bands` finds them without a scan.
+-- Changing the band width in similarity.py changes every key: rebuild with
+-- scripts/build_similarity_index.py --full.
+--
+-- Rows are written by the application (on create, bulk upload and update,
+-- and by scripts/build_similarity_index.py for existing experts). Experts
+-- with no usable tokens have no row.
+
+CREATE TABLE IF NOT EXISTS expert_network.expert_skill_signatures (
+    expert_id UUID PRIMARY KEY,
+    campaign_id UUID NOT NULL,
+    signature INTEGER[] NOT NULL,
+    bands BIGINT[] NOT NULL,
+    source_updated_at TIMESTAMPTZ NOT NULL,
+    indexed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT fk_expert_skill_signatures_expert FOREIGN KEY (expert_id)
+        REFERENCES expert_network.experts(id) ON DELETE CASCADE,
+    CONSTRAINT fk_expert_skill_signatures_campaign FOREIGN KEY (campaign_id)
+        REFERENCES expert_network.campaigns(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_expert_skill_signatures_bands
+    ON expert_network.expert_skill_signatures USING gin (bands);
+
+CREATE INDEX IF NOT EXISTS idx_expert_skill_signatures_campaign
+    ON expert_network.expert_skill_signatures(campaign_id);
+
+COMMENT ON TABLE expert_network.expert_skill_signatures IS 'MinHash signatures of expert skills/title/description (see similarity.py)';
+COMMENT ON COLUMN expert_network.expert_skill_signatures.bands IS 'LSH band keys of the signature; experts sharing a key are similarity candidates';
+COMMENT ON COLUMN expert_network.expert_skill_signatures.source_updated_at IS 'experts.updated_at of the row the signature was computed from';
+
+-- Same tenancy policy as the other campaign-scoped tables (008)
+
+DROP POLICY IF EXISTS expert_skill_signatures_tenant ON expert_network.expert_skill_signatures;
+CREATE POLICY expert_skill_signatures_tenant ON expert_network.expert_skill_signatures
+    USING (
+        campaign_id IN (
+            SELECT id FROM expert_network.campaigns
+            WHERE user_id = expert_network.current_app_user()
+        )
+    );
+
+-- Apply the current row-level security switch (008) to the new table
+SELECT expert_network.set_row_level_security(expert_network.row_level_security_enabled());
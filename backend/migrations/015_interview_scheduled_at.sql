@@ -0,0 +1,45 @@
+-- Migration: Absolute interview start time for calendar range queries
+--
+-- Interviews store a local scheduled_date, scheduled_time and timezone. The
+-- calendar views (GET /api/interviews?from=&to=) need the instant they
+-- start, so it is stored as a generated column and indexed per campaign:
+--
+--   WHERE campaign_id = $1 AND scheduled_at >= $2 AND scheduled_at < $3
+--   ORDER BY scheduled_at DESC
+--
+-- is one index range scan, with no sort. Adding a stored generated column
+-- rewrites the interviews table once.
+
+-- =============================================================================
+-- REPAIR UNPARSEABLE TIMEZONES
+-- =============================================================================
+
+-- AT TIME ZONE rejects unknown zone names, which would fail the ALTER below.
+-- Any existing value Postgres cannot parse is reset to 'UTC' (the column
+-- default); new writes with an unknown zone are rejected.
+DO $$
+DECLARE
+    tz TEXT;
+BEGIN
+    FOR tz IN SELECT DISTINCT timezone FROM expert_network.interviews LOOP
+        BEGIN
+            PERFORM now() AT TIME ZONE tz;
+        EXCEPTION WHEN OTHERS THEN
+            RAISE NOTICE 'Resetting unknown interview timezone % to UTC', tz;
+            UPDATE expert_network.interviews SET timezone = 'UTC' WHERE timezone = tz;
+        END;
+    END LOOP;
+END $$;
+
+-- =============================================================================
+-- SCHEDULED_AT
+-- =============================================================================
+
+ALTER TABLE expert_network.interviews
+    ADD COLUMN IF NOT EXISTS scheduled_at TIMESTAMPTZ
+    GENERATED ALWAYS AS ((scheduled_date + scheduled_time) AT TIME ZONE timezone) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_interviews_campaign_scheduled_at
+    ON expert_network.interviews(campaign_id, scheduled_at);
+
+COMMENT ON COLUMN expert_network.interviews.scheduled_at IS 'Start instant: scheduled_date + scheduled_time in timezone (generated)';
@@ -0,0 +1,101 @@
+-- Migration: Interview time slots and double-booking detection
+--
+-- Every interview occupies [scheduled_at, scheduled_at + duration_minutes),
+-- stored as a generated tstzrange (scheduled_slot). GiST indexes on
+-- (expert_id, scheduled_slot) and (team_member_id, scheduled_slot) let
+-- scheduling.py find the interviews overlapping any number of proposed
+-- slots in one query: each proposed slot is one index probe.
+--
+-- Cancelled interviews and no-shows do not occupy their slot.
+--
+-- Interviews can now name the team member running the call
+-- (team_member_id), so calls of the same team member are checked too.
+--
+-- The API rejects conflicting creates and updates with a pre-check
+-- (INTERVIEW_CONFLICT_CHECK). Concurrent writes can still race past it. For
+-- a hard guarantee per expert, switch on the exclusion constraint:
+--
+--   SELECT expert_network.set_interview_overlap_exclusion(true);
+--
+-- It is off by default because it cannot be added while overlapping
+-- interviews exist. The call fails with the first overlapping pair found.
+
+CREATE EXTENSION IF NOT EXISTS "btree_gist";
+
+-- =============================================================================
+-- SCHEDULED_SLOT
+-- =============================================================================
+
+-- timestamptz + interval is only STABLE in general (day and month steps
+-- depend on the session time zone); a minutes-only interval is not, so this
+-- wrapper is IMMUTABLE and usable in a generated column.
+CREATE OR REPLACE FUNCTION expert_network.interview_slot(starts_at TIMESTAMPTZ, minutes INTEGER)
+RETURNS TSTZRANGE AS $$
+    SELECT tstzrange(starts_at, starts_at + make_interval(mins => minutes), '[)');
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+ALTER TABLE expert_network.interviews
+    ADD COLUMN IF NOT EXISTS scheduled_slot TSTZRANGE
+    GENERATED ALWAYS AS (
+        expert_network.interview_slot((scheduled_date + scheduled_time) AT TIME ZONE timezone, duration_minutes)
+    ) STORED;
+
+COMMENT ON COLUMN expert_network.interviews.scheduled_slot IS 'Time the interview occupies: [scheduled_at, scheduled_at + duration) (generated)';
+
+-- =============================================================================
+-- TEAM MEMBER
+-- =============================================================================
+
+ALTER TABLE expert_network.interviews
+    ADD COLUMN IF NOT EXISTS team_member_id UUID;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'fk_interviews_team_member'
+    ) THEN
+        ALTER TABLE expert_network.interviews
+            ADD CONSTRAINT fk_interviews_team_member FOREIGN KEY (team_member_id)
+            REFERENCES expert_network.team_members(id) ON DELETE SET NULL;
+    END IF;
+END $$;
+
+COMMENT ON COLUMN expert_network.interviews.team_member_id IS 'Team member running the call (optional)';
+
+-- =============================================================================
+-- OVERLAP INDEXES
+-- =============================================================================
+
+-- The predicate must match scheduling.BLOCKING_CLAUSE for the planner to use them
+CREATE INDEX IF NOT EXISTS idx_interviews_expert_slot
+    ON expert_network.interviews USING gist (expert_id, scheduled_slot)
+    WHERE status NOT IN ('cancelled', 'no_show');
+
+CREATE INDEX IF NOT EXISTS idx_interviews_team_member_slot
+    ON expert_network.interviews USING gist (team_member_id, scheduled_slot)
+    WHERE team_member_id IS NOT NULL AND status NOT IN ('cancelled', 'no_show');
+
+-- =============================================================================
+-- EXCLUSION CONSTRAINT MODE
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION expert_network.set_interview_overlap_exclusion(enabled BOOLEAN)
+RETURNS VOID AS $$
+BEGIN
+    IF enabled THEN
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_constraint WHERE conname = 'interviews_expert_no_overlap'
+        ) THEN
+            ALTER TABLE expert_network.interviews
+                ADD CONSTRAINT interviews_expert_no_overlap
+                EXCLUDE USING gist (expert_id WITH =, scheduled_slot WITH &&)
+                WHERE (status NOT IN ('cancelled', 'no_show'));
+        END IF;
+    ELSE
+        ALTER TABLE expert_network.interviews
+            DROP CONSTRAINT IF EXISTS interviews_expert_no_overlap;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON FUNCTION expert_network.set_interview_overlap_exclusion(BOOLEAN) IS 'Switch the per-expert no-overlap exclusion constraint on interviews on or off';
@@ -19,6 +19,15 @@ from .expert import (
     ExpertUpdate,
     ExpertResponse,
     ExpertListResponse,
+    ExpertSearchResult,
+    ExpertSearchResponse,
+    ExpertBulkItem,
+    ExpertBulkResponse,
+    BulkRowError,
+    RankedExpert,
+    ExpertRankedResponse,
+    SimilarExpert,
+    ExpertSimilarResponse,
     ScreeningResponseCreate,
     ScreeningResponseResponse,
 )
@@ -28,8 +37,16 @@ from .interview import (
     InterviewUpdate,
     InterviewResponse,
     InterviewListResponse,
+    ProposedSlot,
+    ConflictCheckRequest,
+    SlotConflict,
+    ConflictCheckResponse,
+    SuggestSlotsRequest,
+    SuggestSlotsResponse,
 )
 from .project import ProjectCreate, ProjectUpdate, ProjectResponse
+from .sync import ChangeFeedResponse, Tombstone
+from .dedup import DuplicateGroup, DuplicateGroupListResponse, DedupRunResponse
 
 __all__ = [
     # Common
@@ -49,6 +66,15 @@ __all__ = [
     "ExpertUpdate",
     "ExpertResponse",
     "ExpertListResponse",
+    "ExpertSearchResult",
+    "ExpertSearchResponse",
+    "ExpertBulkItem",
+    "ExpertBulkResponse",
+    "BulkRowError",
+    "RankedExpert",
+    "ExpertRankedResponse",
+    "SimilarExpert",
+    "ExpertSimilarResponse",
     "ScreeningResponseCreate",
     "ScreeningResponseResponse",
     # Vendor
@@ -58,8 +84,21 @@ __all__ = [
     "InterviewUpdate",
     "InterviewResponse",
     "InterviewListResponse",
+    "ProposedSlot",
+    "ConflictCheckRequest",
+    "SlotConflict",
+    "ConflictCheckResponse",
+    "SuggestSlotsRequest",
+    "SuggestSlotsResponse",
     # Project
     "ProjectCreate",
     "ProjectUpdate",
     "ProjectResponse",
+    # Sync
+    "ChangeFeedResponse",
+    "Tombstone",
+    # Dedup
+    "DuplicateGroup",
+    "DuplicateGroupListResponse",
+    "DedupRunResponse",
 ]
@@ -4,7 +4,9 @@ Common models shared across all API endpoints.
 Includes standard responses, pagination, and shared data structures.
 """
 
-from typing import Optional, Generic, TypeVar, List, Any
+import base64
+import json
+from typing import Optional, Generic, TypeVar, List, Any, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime
 
@@ -58,6 +60,68 @@ class PaginatedResponse(BaseModel, Generic[T]):
         )
 
 
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    """
+    Encode a keyset position as an opaque, URL-safe cursor token.
+
+    Args:
+        created_at: Sort key of the last row on the page
+        row_id: Tie-breaking UUID of the last row on the page
+
+    Returns:
+        Cursor string to pass back as ?cursor=
+    """
+    payload = json.dumps({"c": created_at.isoformat(), "i": str(row_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(payload["c"]), str(payload["i"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def encode_sync_cursor(horizon: datetime) -> str:
+    """
+    Encode a delta-sync position (see api/sync.py) as an opaque cursor token.
+
+    Args:
+        horizon: Timestamp from which the next sync must look for changes
+
+    Returns:
+        Cursor string to pass back as ?since=
+    """
+    payload = json.dumps({"s": horizon.isoformat()}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_sync_cursor(cursor: str) -> datetime:
+    """
+    Decode a cursor produced by encode_sync_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        horizon = datetime.fromisoformat(payload["s"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if horizon.tzinfo is None:
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return horizon
+
+
 class TimestampMixin(BaseModel):
     """Mixin for models with created_at and updated_at timestamps."""
     created_at: datetime
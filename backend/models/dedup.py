@@ -0,0 +1,41 @@
+"""
+Expert deduplication models.
+
+Cross-vendor duplicate groups of a campaign's experts (see dedup.py).
+"""
+
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class DuplicateMember(BaseModel):
+    """One vendor's proposal within a duplicate group."""
+    expert_id: str = Field(..., description="Expert UUID")
+    expert_name: str
+    current_title: Optional[str] = None
+    current_company: Optional[str] = None
+    vendor_platform_id: str
+    vendor_name: Optional[str] = Field(None, description="Vendor platform name")
+    match_score: float = Field(..., ge=0, le=1, description="Best pair score linking this expert into the group")
+
+
+class DuplicateGroup(BaseModel):
+    """Proposals of the same person by different vendors."""
+    identity_id: str = Field(..., description="Group key (the earliest proposal's expert UUID)")
+    members: List[DuplicateMember] = Field(..., description="Proposals, earliest first")
+
+
+class DuplicateGroupListResponse(BaseModel):
+    """Duplicate groups of a campaign."""
+    campaign_id: str
+    groups: List[DuplicateGroup]
+
+
+class DedupRunResponse(BaseModel):
+    """Outcome of a full dedup pass over a campaign."""
+    campaign_id: str
+    experts: int = Field(..., description="Experts considered")
+    compared_pairs: int = Field(..., description="Candidate pairs scored after blocking")
+    matched_pairs: int = Field(..., description="Pairs at or above the match threshold")
+    identities: int = Field(..., description="Duplicate groups")
+    duplicates: int = Field(..., description="Proposals beyond the first in each group")
@@ -162,6 +162,100 @@ class ExpertResponse(UUIDIdentifier, ExpertBase, TimestampMixin):
 
 
 class ExpertListResponse(BaseModel):
-    """Response model for list of experts."""
+    """Response model for a page of experts (keyset-paginated)."""
     experts: List[ExpertResponse]
-    total: int = Field(..., description="Total number of experts")
+    total: Optional[int] = Field(None, description="Total matching experts (only when include_total=true)")
+    limit: int = Field(..., description="Page size used for this response")
+    has_more: bool = Field(False, description="Whether more experts follow this page")
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page")
+
+
+class ExpertSearchResult(ExpertResponse):
+    """Expert search hit with ranking score and highlighted snippets."""
+    score: float = Field(..., description="Combined full-text rank and trigram similarity")
+    highlights: Dict[str, str] = Field(
+        default_factory=dict,
+        description=(
+            "Matched fragments per field as escaped HTML: the field text is "
+            "HTML-escaped and only the <mark></mark> tags around matches are markup"
+        )
+    )
+
+
+class ExpertSearchResponse(BaseModel):
+    """Response model for expert search."""
+    query: str = Field(..., description="Search query as submitted")
+    results: List[ExpertSearchResult]
+    page: int = Field(..., description="Page number (1-indexed)")
+    limit: int = Field(..., description="Results per page")
+    has_more: bool = Field(False, description="Whether another page of results exists")
+
+
+class ExpertBulkItem(ExpertBase):
+    """One expert in a bulk upload (the campaign is given once, on the request)."""
+    vendor_platform_id: str = Field(..., description="Vendor platform UUID that proposed this expert")
+    vendor_expert_id: Optional[str] = Field(None, description="Vendor's internal expert ID")
+    current_title: str = Field(..., min_length=1, max_length=255, description="Current job title")
+    status: str = Field("proposed", description="Expert status (proposed, reviewed, approved, rejected, scheduled)")
+
+
+class BulkRowError(BaseModel):
+    """Validation errors for one rejected row of a bulk upload."""
+    row: int = Field(..., description="0-based position in the JSON array / NDJSON stream")
+    errors: List[str]
+
+
+class ExpertBulkResponse(BaseModel):
+    """Outcome of a bulk expert upload."""
+    campaign_id: str
+    received: int = Field(..., description="Rows in the request")
+    inserted: int = Field(..., description="Rows added to the campaign")
+    duplicates: List[int] = Field(
+        default_factory=list,
+        description="Rows skipped because the vendor already proposed that expert (same name and company)"
+    )
+    errors: List[BulkRowError] = Field(default_factory=list, description="Rows rejected by validation")
+    expert_ids: Optional[List[Optional[str]]] = Field(
+        None,
+        description="Per row, the new expert's UUID or null (only when return_ids=true)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "campaign_id": "campaign-uuid-123",
+                "received": 3,
+                "inserted": 1,
+                "duplicates": [2],
+                "errors": [{"row": 1, "errors": ["current_title: Field required"]}],
+            }
+        }
+
+
+class RankedExpert(ExpertResponse):
+    """Expert in a ranked shortlist."""
+    score: float = Field(..., description="Weighted score (0-1)")
+    score_components: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-signal scores (0-1) before weighting: fit, rating, vendor, cost, skills, screening"
+    )
+
+
+class ExpertRankedResponse(BaseModel):
+    """Top-ranked experts of a campaign."""
+    campaign_id: str
+    weights: Dict[str, float] = Field(..., description="Normalized weights used for this ranking")
+    total: int = Field(..., description="Experts that passed the filters")
+    limit: int
+    results: List[RankedExpert]
+
+
+class SimilarExpert(ExpertResponse):
+    """Expert in a "more like this" result."""
+    similarity: float = Field(..., description="Estimated skills/title/description overlap (Jaccard, 0-1)")
+
+
+class ExpertSimilarResponse(BaseModel):
+    """Experts most similar to one expert, across the user's campaigns."""
+    expert_id: str
+    results: List[SimilarExpert]
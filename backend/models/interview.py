@@ -6,7 +6,7 @@ Interviews represent scheduled calls with experts, including notes and transcrip
 
 from typing import Optional, List
 from pydantic import BaseModel, Field, HttpUrl
-from datetime import datetime
+from datetime import datetime, time
 from .common import UUIDIdentifier, TimestampMixin
 
 
@@ -29,6 +29,7 @@ class InterviewCreate(InterviewBase):
     campaign_id: str = Field(..., description="Campaign UUID")
     expert_id: str = Field(..., description="Expert UUID")
     interviewer_name: Optional[str] = Field(None, description="Name of interviewer")
+    team_member_id: Optional[str] = Field(None, description="Team member running the call")
 
     class Config:
         json_schema_extra = {
@@ -53,6 +54,7 @@ class InterviewUpdate(BaseModel):
     recording_url: Optional[HttpUrl] = None
     transcript_text: Optional[str] = None
     interviewer_name: Optional[str] = None
+    team_member_id: Optional[str] = None
 
 
 class InterviewResponse(UUIDIdentifier, InterviewBase, TimestampMixin):
@@ -72,6 +74,7 @@ class InterviewResponse(UUIDIdentifier, InterviewBase, TimestampMixin):
     vendor_name: Optional[str] = Field(None, description="Vendor platform name")
 
     interviewer_name: Optional[str] = None
+    team_member_id: Optional[str] = Field(None, description="Team member running the call")
 
     class Config:
         json_schema_extra = {
@@ -103,3 +106,124 @@ class InterviewListResponse(BaseModel):
     """Response model for list of interviews."""
     interviews: List[InterviewResponse]
     total: int = Field(..., description="Total number of interviews")
+
+
+class ProposedSlot(BaseModel):
+    """A time slot to check for double-booking."""
+    expert_id: Optional[str] = Field(None, description="Expert UUID")
+    team_member_id: Optional[str] = Field(None, description="Team member UUID")
+    starts_at: datetime = Field(..., description="Slot start (UTC if no offset is given)")
+    duration_minutes: int = Field(60, ge=15, le=240, description="Slot length in minutes")
+
+
+class ConflictCheckRequest(BaseModel):
+    """Request model for checking proposed slots against booked interviews."""
+    slots: List[ProposedSlot] = Field(..., min_length=1, description="Slots to check; each needs an expert or team member")
+    exclude_interview_ids: List[str] = Field(
+        default_factory=list,
+        description="Interviews to ignore, e.g. ones being rescheduled"
+    )
+    check_within_batch: bool = Field(True, description="Also report overlaps between the proposed slots")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "slots": [
+                    {"expert_id": "expert-uuid-123", "starts_at": "2025-02-17T14:00:00Z", "duration_minutes": 60},
+                    {"team_member_id": "member-uuid-456", "starts_at": "2025-02-17T14:30:00Z"}
+                ]
+            }
+        }
+
+
+class SlotConflict(BaseModel):
+    """A booked interview or another proposed slot overlapping a slot."""
+    slot: int = Field(..., description="Position of the conflicting slot in the request")
+    kind: str = Field(..., description="What is double-booked: expert or team_member")
+    interview_id: Optional[str] = Field(None, description="Overlapping interview")
+    other_slot: Optional[int] = Field(None, description="Overlapping proposed slot, for overlaps within the request")
+    starts_at: datetime
+    ends_at: datetime
+
+
+class ConflictCheckResponse(BaseModel):
+    """Response model for a conflict check."""
+    checked: int = Field(..., description="Number of slots checked")
+    conflicting_slots: List[int] = Field(..., description="Positions of slots with at least one conflict")
+    conflicts: List[SlotConflict]
+
+
+class AvailabilityWindow(BaseModel):
+    """A time range in which an expert can take a call."""
+    starts_at: datetime
+    ends_at: datetime
+
+
+class ExpertAvailability(BaseModel):
+    """An expert's availability for slot suggestions."""
+    expert_id: str = Field(..., description="Expert UUID")
+    timezone: str = Field("UTC", description="IANA time zone for window times given without an offset")
+    windows: List[AvailabilityWindow] = Field(
+        default_factory=list,
+        description="Availability windows (none: available throughout the horizon)"
+    )
+
+
+class WorkingHours(BaseModel):
+    """Daily hours in which calls can be scheduled."""
+    timezone: str = Field("UTC", description="IANA time zone of the hours")
+    day_start: time = Field(time(9, 0), description="Local start of the working day")
+    day_end: time = Field(time(18, 0), description="Local end of the working day (at or before day_start: next day)")
+    weekdays: List[int] = Field([0, 1, 2, 3, 4], description="Working weekdays (0 = Monday)")
+
+
+class SuggestSlotsRequest(BaseModel):
+    """Request model for interview slot suggestions."""
+    experts: List[ExpertAvailability] = Field(..., min_length=1)
+    team_member_ids: List[str] = Field(default_factory=list, description="Team members who must all be free")
+    duration_minutes: int = Field(60, ge=15, le=240, description="Interview duration in minutes")
+    horizon_start: Optional[datetime] = Field(None, description="Earliest slot start (default: now)")
+    horizon_end: Optional[datetime] = Field(None, description="Latest slot end (default: 14 days after horizon_start)")
+    count: int = Field(3, ge=1, le=20, description="Slots to suggest per expert (or in total when together)")
+    step_minutes: int = Field(15, ge=5, le=60, description="Slot starts are multiples of this many minutes")
+    buffer_minutes: int = Field(0, ge=0, le=120, description="Free time to keep around booked interviews")
+    working_hours: Optional[WorkingHours] = Field(None, description="Restrict slots to the team's working hours")
+    together: bool = Field(False, description="Suggest slots where all experts are free at once (group call)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "experts": [
+                    {
+                        "expert_id": "expert-uuid-123",
+                        "timezone": "America/New_York",
+                        "windows": [{"starts_at": "2025-02-17T09:00:00", "ends_at": "2025-02-17T12:00:00"}]
+                    }
+                ],
+                "team_member_ids": ["member-uuid-456"],
+                "duration_minutes": 60,
+                "count": 3,
+                "working_hours": {"timezone": "Europe/London", "day_start": "08:00", "day_end": "18:00"}
+            }
+        }
+
+
+class SuggestedSlot(BaseModel):
+    """A free interview slot."""
+    starts_at: datetime
+    ends_at: datetime
+
+
+class ExpertSlotSuggestions(BaseModel):
+    """Suggested slots for one expert."""
+    expert_id: str
+    slots: List[SuggestedSlot]
+
+
+class SuggestSlotsResponse(BaseModel):
+    """Response model for interview slot suggestions."""
+    duration_minutes: int
+    horizon_start: datetime
+    horizon_end: datetime
+    experts: List[ExpertSlotSuggestions] = Field(..., description="Earliest slots per expert (empty when together)")
+    common_slots: Optional[List[SuggestedSlot]] = Field(None, description="Slots where all experts are free (when together)")
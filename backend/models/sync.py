@@ -0,0 +1,53 @@
+"""
+Delta-sync models.
+
+Response shape for GET /api/campaigns/{campaign_id}/changes: rows changed
+since a cursor, grouped by table, plus tombstones for deleted rows.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from .common import UUIDIdentifier, TimestampMixin
+from .expert import ExpertResponse
+from .interview import InterviewResponse
+from .screening_question import ScreeningQuestionResponse
+from .team_member import TeamMemberResponse
+
+
+class VendorEnrollmentChange(UUIDIdentifier, TimestampMixin):
+    """Changed vendor enrollment (derived expert/interview counts are not included)."""
+    campaign_id: str = Field(..., description="Campaign UUID")
+    vendor_platform_id: str = Field(..., description="Vendor platform UUID")
+    vendor_name: Optional[str] = Field(None, description="Vendor platform name")
+    vendor_logo_url: Optional[str] = Field(None, description="Vendor logo URL")
+    status: str = Field(..., description="Enrollment status (pending, active, paused, completed)")
+    enrolled_at: Optional[datetime] = Field(None, description="When the vendor was enrolled")
+    account_manager_name: Optional[str] = Field(None, description="Vendor account manager")
+    account_manager_email: Optional[str] = Field(None, description="Vendor account manager email")
+    notes: Optional[str] = Field(None, description="Enrollment notes")
+
+
+class TeamAssignmentChange(TeamMemberResponse):
+    """Team member newly assigned to the campaign."""
+    assigned_at: datetime = Field(..., description="When the member was assigned")
+
+
+class Tombstone(BaseModel):
+    """A row deleted since the cursor."""
+    table: str = Field(..., description="Source table (experts, interviews, screening_questions, campaign_vendor_enrollments, campaign_team_assignments)")
+    id: str = Field(..., description="Deleted row ID (team member ID for campaign_team_assignments)")
+    deleted_at: datetime = Field(..., description="Deletion timestamp")
+
+
+class ChangeFeedResponse(BaseModel):
+    """Changes to one campaign since a cursor."""
+    campaign_id: str = Field(..., description="Campaign UUID")
+    full: bool = Field(..., description="True when no cursor was given and every row is included")
+    next_cursor: str = Field(..., description="Pass as ?since= on the next sync")
+    experts: List[ExpertResponse] = Field(default_factory=list)
+    interviews: List[InterviewResponse] = Field(default_factory=list)
+    screening_questions: List[ScreeningQuestionResponse] = Field(default_factory=list)
+    vendor_enrollments: List[VendorEnrollmentChange] = Field(default_factory=list)
+    team_assignments: List[TeamAssignmentChange] = Field(default_factory=list)
+    deleted: List[Tombstone] = Field(default_factory=list, description="Rows deleted since the cursor")
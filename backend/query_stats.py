@@ -0,0 +1,250 @@
+"""
+Per-statement query instrumentation and slow-query log.
+
+Every pooled connection gets an asyncpg query logger (see db._init_connection)
+when instrumentation is enabled, so statements from execute_query and the
+other helpers, as well as raw `get_db()` connections, are all covered.
+
+- Statements are grouped by a normalized fingerprint (whitespace collapsed,
+  literals replaced with `?`).
+- A sampled fraction (`QUERY_STATS_SAMPLE_RATE`) feeds per-fingerprint
+  latency histograms. The db helpers add rows returned and pool-wait time.
+- Any statement slower than `SLOW_QUERY_MS` is logged with its EXPLAIN plan
+  (at most once per fingerprint per `SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS`).
+
+With both knobs at 0 (the default) no logger is attached, and the helpers
+only pay for one boolean check per statement.
+
+Usage:
+    from query_stats import get_query_stats
+
+    stats = get_query_stats()
+    top = stats.snapshot(sort="total_ms", limit=20)
+"""
+
+import asyncio
+import os
+import random
+import re
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+
+QUERY_STATS_SAMPLE_RATE = float(os.getenv('QUERY_STATS_SAMPLE_RATE', '0'))
+SLOW_QUERY_MS = float(os.getenv('SLOW_QUERY_MS', '0'))
+SLOW_QUERY_EXPLAIN = os.getenv('SLOW_QUERY_EXPLAIN', 'true').lower() == 'true'
+SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS = float(os.getenv('SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS', '60'))
+QUERY_STATS_MAX_FINGERPRINTS = int(os.getenv('QUERY_STATS_MAX_FINGERPRINTS', '500'))
+
+# Attach the asyncpg query logger at all?
+QUERY_STATS_ENABLED = QUERY_STATS_SAMPLE_RATE > 0 or SLOW_QUERY_MS > 0
+
+# Latency histogram bucket upper bounds in milliseconds (last bucket is +Inf)
+LATENCY_BUCKETS_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Fingerprint overflow bucket once QUERY_STATS_MAX_FINGERPRINTS is reached
+OTHER_FINGERPRINT = "<other>"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(query: str) -> str:
+    """Normalize a statement: literals become `?`, whitespace is collapsed."""
+    normalized = _STRING_LITERAL.sub("?", query)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class _FingerprintStats:
+    """Aggregates for one statement fingerprint."""
+
+    __slots__ = (
+        "calls", "errors", "total_ms", "max_ms", "buckets",
+        "row_samples", "rows_total", "pool_wait_samples", "pool_wait_total_ms",
+        "slow_calls", "last_explained",
+    )
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.row_samples = 0
+        self.rows_total = 0
+        self.pool_wait_samples = 0
+        self.pool_wait_total_ms = 0.0
+        self.slow_calls = 0
+        self.last_explained = 0.0
+
+    def observe(self, elapsed_ms: float, failed: bool):
+        self.calls += 1
+        if failed:
+            self.errors += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile_ms(self, fraction: float) -> Optional[float]:
+        """Upper bound of the bucket holding the given percentile."""
+        if self.calls == 0:
+            return None
+        target = self.calls * fraction
+        seen = 0
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self, query: str) -> Dict[str, Any]:
+        histogram = {f"le_{bound}": count for bound, count in zip(LATENCY_BUCKETS_MS, self.buckets)}
+        histogram["le_inf"] = self.buckets[-1]
+        return {
+            "fingerprint": query,
+            "calls": self.calls,
+            "errors": self.errors,
+            "slow_calls": self.slow_calls,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.calls, 3) if self.calls else None,
+            "p50_ms": self.percentile_ms(0.50),
+            "p95_ms": self.percentile_ms(0.95),
+            "max_ms": round(self.max_ms, 3),
+            "mean_rows": round(self.rows_total / self.row_samples, 2) if self.row_samples else None,
+            "mean_pool_wait_ms": (
+                round(self.pool_wait_total_ms / self.pool_wait_samples, 3)
+                if self.pool_wait_samples else None
+            ),
+            "histogram": histogram,
+        }
+
+
+class QueryStats:
+    """Per-fingerprint statement statistics for this worker process."""
+
+    def __init__(
+        self,
+        sample_rate: float = QUERY_STATS_SAMPLE_RATE,
+        slow_query_ms: float = SLOW_QUERY_MS,
+        max_fingerprints: int = QUERY_STATS_MAX_FINGERPRINTS,
+    ):
+        self.sample_rate = sample_rate
+        self.slow_query_ms = slow_query_ms
+        self.max_fingerprints = max_fingerprints
+        self._stats: Dict[str, _FingerprintStats] = {}
+        self.pool_waits = _FingerprintStats()
+        self.started_at = time.time()
+
+    def _entry(self, query: str) -> _FingerprintStats:
+        key = fingerprint(query)
+        entry = self._stats.get(key)
+        if entry is None:
+            if len(self._stats) >= self.max_fingerprints:
+                key = OTHER_FINGERPRINT
+                entry = self._stats.get(key)
+            if entry is None:
+                entry = self._stats[key] = _FingerprintStats()
+        return entry
+
+    def sampled(self) -> bool:
+        """Sampling decision for one statement."""
+        return self.sample_rate >= 1 or (self.sample_rate > 0 and random.random() < self.sample_rate)
+
+    def log_query(self, record):
+        """asyncpg query logger callback (runs via loop.call_soon after each statement)."""
+        query = record.query
+        if query.lstrip()[:7].upper() == "EXPLAIN":
+            return
+        elapsed_ms = record.elapsed * 1000
+        slow = self.slow_query_ms > 0 and elapsed_ms >= self.slow_query_ms
+
+        if not slow and not self.sampled():
+            return
+
+        entry = self._entry(query)
+        entry.observe(elapsed_ms, record.exception is not None)
+        if slow:
+            entry.slow_calls += 1
+            self._log_slow(query, record.args, elapsed_ms, entry)
+
+    def record_result(self, query: str, rows: Optional[int], pool_wait: Optional[float]):
+        """Rows returned / pool checkout time for a statement run by the db helpers."""
+        if not self.sampled():
+            return
+        entry = self._entry(query)
+        if rows is not None:
+            entry.row_samples += 1
+            entry.rows_total += rows
+        if pool_wait is not None:
+            entry.pool_wait_samples += 1
+            entry.pool_wait_total_ms += pool_wait * 1000
+
+    def record_pool_wait(self, seconds: float):
+        """Time spent checking a connection out of the pool (any get_db() caller)."""
+        if self.sampled():
+            self.pool_waits.observe(seconds * 1000, False)
+
+    def _log_slow(self, query: str, args, elapsed_ms: float, entry: _FingerprintStats):
+        print(f"[DB] SLOW QUERY ({elapsed_ms:.1f} ms): {fingerprint(query)[:500]}")
+        now = time.monotonic()
+        if (
+            SLOW_QUERY_EXPLAIN
+            and query.lstrip()[:6].upper() in _EXPLAINABLE
+            and now - entry.last_explained >= SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS
+        ):
+            entry.last_explained = now
+            asyncio.get_running_loop().create_task(_explain(query, args))
+
+    def snapshot(self, sort: str = "total_ms", limit: int = 50) -> Dict[str, Any]:
+        """Aggregates sorted by `sort` (total_ms, mean_ms, max_ms, calls, slow_calls)."""
+        rows = [entry.to_dict(query) for query, entry in self._stats.items()]
+        rows.sort(key=lambda r: r.get(sort) or 0, reverse=True)
+        return {
+            "enabled": QUERY_STATS_ENABLED,
+            "sample_rate": self.sample_rate,
+            "slow_query_ms": self.slow_query_ms,
+            "since": self.started_at,
+            "fingerprints": len(self._stats),
+            "pool_wait": self.pool_waits.to_dict("pool.acquire"),
+            "statements": rows[:limit],
+        }
+
+    def reset(self):
+        """Drop all aggregates."""
+        self._stats.clear()
+        self.pool_waits = _FingerprintStats()
+        self.started_at = time.time()
+
+
+async def _explain(query: str, args) -> None:
+    """Log the plan of a slow statement (plain EXPLAIN; nothing is executed)."""
+    from db import get_db
+
+    try:
+        async with get_db() as conn:
+            plan = await conn.fetch(f"EXPLAIN {query}", *(args or ()))
+        print("[DB] SLOW QUERY PLAN:\n" + "\n".join(row[0] for row in plan))
+    except Exception as e:
+        print(f"[DB] WARNING: Could not EXPLAIN slow query: {e}")
+
+
+# Singleton stats
+_stats: Optional[QueryStats] = None
+
+
+def get_query_stats() -> QueryStats:
+    """Get the process-wide query statistics."""
+    global _stats
+    if _stats is None:
+        _stats = QueryStats()
+    return _stats
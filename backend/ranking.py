@@ -0,0 +1,278 @@
+"""
+Vectorized expert ranking for campaign shortlists.
+
+A campaign's experts are loaded once into a NumPy feature matrix (one row
+per expert, one column per signal, each scaled to 0-1):
+
+- fit:       ai_fit_score / 10
+- rating:    rating / 5
+- vendor:    the vendor's overall_score / 5
+- cost:      the vendor's average cost per call, cheapest vendor = 1
+- skills:    share of campaign keywords (industry vertical, target regions)
+             found in the expert's skills, title, company and description
+- screening: share of the campaign's screening questions answered, blended
+             with answer length
+
+Missing values score a neutral 0.5. Ranking is then one matrix-vector
+product with the requested weights and an `argpartition` top-K, so changing
+weights never touches the database.
+
+Matrices are cached per campaign (LRU, RANKING_CACHE_SIZE campaigns per
+worker) and rebuilt when the campaign's change validator (see db.py) or the
+vendor catalog changes, or after RANKING_CACHE_TTL_SECONDS (screening
+responses and campaign keywords are not covered by the validator).
+
+Usage:
+    from ranking import get_campaign_candidates, parse_weights
+
+    candidates = await get_campaign_candidates(campaign_id, validator)
+    indices, scores, total = candidates.top_k(parse_weights(overrides), k=50)
+"""
+
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import asyncpg
+import numpy as np
+
+from db import execute_query
+from vendor_cache import get_vendor_catalog
+
+
+RANKING_CACHE_SIZE = int(os.getenv('RANKING_CACHE_SIZE', '32'))
+RANKING_CACHE_TTL_SECONDS = float(os.getenv('RANKING_CACHE_TTL_SECONDS', '60'))
+
+# Answer length (characters) that counts as a complete screening response
+RANKING_SCREENING_FULL_LENGTH = 300
+
+FEATURES = ("fit", "rating", "vendor", "cost", "skills", "screening")
+
+DEFAULT_WEIGHTS = {
+    "fit": 0.3,
+    "rating": 0.2,
+    "vendor": 0.1,
+    "cost": 0.1,
+    "skills": 0.2,
+    "screening": 0.1,
+}
+
+# Score for a signal an expert (or campaign) has no data for
+NEUTRAL = 0.5
+
+_TOKEN = re.compile(r"[0-9a-z]+")
+_KEYWORD_STOPWORDS = {"and", "the", "for", "other", "with", "services", "global"}
+
+RANKING_CAMPAIGN_QUERY = """
+    SELECT
+        c.industry_vertical,
+        c.custom_industry,
+        c.target_regions,
+        c.custom_regions,
+        (
+            SELECT COUNT(*)
+            FROM expert_network.screening_questions sq
+            WHERE sq.campaign_id = c.id
+        ) as question_count
+    FROM expert_network.campaigns c
+    WHERE c.id = $1
+"""
+
+RANKING_CANDIDATES_QUERY = """
+    SELECT
+        e.id,
+        e.vendor_platform_id,
+        e.status,
+        e.ai_fit_score,
+        e.rating,
+        e.skills,
+        e.title,
+        e.company,
+        e.description,
+        COALESCE(r.answered, 0) as answered,
+        COALESCE(r.avg_length, 0) as avg_length
+    FROM expert_network.experts e
+    LEFT JOIN (
+        SELECT
+            esr.expert_id,
+            COUNT(DISTINCT esr.screening_question_id) as answered,
+            AVG(length(esr.response_text))::float8 as avg_length
+        FROM expert_network.expert_screening_responses esr
+        JOIN expert_network.experts x ON x.id = esr.expert_id
+        WHERE x.campaign_id = $1
+        GROUP BY esr.expert_id
+    ) r ON r.expert_id = e.id
+    WHERE e.campaign_id = $1
+"""
+
+
+def parse_weights(overrides: Dict[str, Optional[float]]) -> np.ndarray:
+    """Weight vector in FEATURES order: DEFAULT_WEIGHTS with overrides, summing to 1."""
+    weights = np.array(
+        [overrides.get(name) if overrides.get(name) is not None else DEFAULT_WEIGHTS[name] for name in FEATURES],
+        dtype=np.float32,
+    )
+    if (weights < 0).any():
+        raise ValueError("Ranking weights must be non-negative")
+    total = weights.sum()
+    if total <= 0:
+        raise ValueError("At least one ranking weight must be positive")
+    return weights / total
+
+
+def _tokens(*texts: Optional[str]) -> set:
+    tokens = set()
+    for text in texts:
+        if text:
+            tokens.update(_TOKEN.findall(text.lower()))
+    return tokens
+
+
+def _campaign_keywords(campaign: Dict[str, Any]) -> set:
+    keywords = _tokens(
+        campaign["industry_vertical"],
+        campaign["custom_industry"],
+        campaign["custom_regions"],
+        *(campaign["target_regions"] or ()),
+    )
+    return {word for word in keywords if len(word) > 2 and word not in _KEYWORD_STOPWORDS}
+
+
+def _vendor_columns(vendor_ids: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-expert vendor quality and cost signals from the in-memory catalog."""
+    catalog = get_vendor_catalog()
+    costs = {}
+    for vendor in catalog.active():
+        low, high = vendor.get("avg_cost_per_call_min"), vendor.get("avg_cost_per_call_max")
+        if low is not None and high is not None:
+            costs[vendor["id"]] = (low + high) / 2
+    cheapest = min(costs.values(), default=0.0)
+    spread = max(costs.values(), default=0.0) - cheapest
+
+    quality = {}
+    value = {}
+    for vendor_id in set(vendor_ids):
+        vendor = catalog.get(vendor_id) or {}
+        score = vendor.get("overall_score")
+        quality[vendor_id] = score / 5 if score is not None else np.nan
+        cost = costs.get(vendor_id)
+        value[vendor_id] = 1 - (cost - cheapest) / spread if cost is not None and spread > 0 else np.nan
+    return (
+        np.array([quality[vendor_id] for vendor_id in vendor_ids], dtype=np.float32),
+        np.array([value[vendor_id] for vendor_id in vendor_ids], dtype=np.float32),
+    )
+
+
+class CampaignCandidates:
+    """A campaign's experts as a feature matrix, ready to score."""
+
+    def __init__(self, rows: List[Dict[str, Any]], campaign: Dict[str, Any]):
+        count = len(rows)
+        self.ids = [row["id"] for row in rows]
+        self.status = np.array([row["status"] for row in rows], dtype=object)
+        self.vendor_ids = np.array([row["vendor_platform_id"] for row in rows], dtype=object)
+
+        def column(key: str) -> np.ndarray:
+            return np.array([np.nan if row[key] is None else row[key] for row in rows], dtype=np.float32)
+
+        fit = column("ai_fit_score") / 10
+        rating = column("rating") / 5
+        vendor, cost = _vendor_columns(list(self.vendor_ids))
+
+        keywords = _campaign_keywords(campaign)
+        if keywords:
+            skills = np.array([
+                len(keywords & _tokens(*(row["skills"] or ()), row["title"], row["company"], row["description"]))
+                for row in rows
+            ], dtype=np.float32) / len(keywords)
+        else:
+            skills = np.full(count, np.nan, dtype=np.float32)
+
+        question_count = campaign["question_count"]
+        if question_count:
+            answered = np.minimum(column("answered") / question_count, 1)
+            length = np.minimum(column("avg_length") / RANKING_SCREENING_FULL_LENGTH, 1)
+            screening = 0.7 * answered + 0.3 * length
+        else:
+            screening = np.full(count, np.nan, dtype=np.float32)
+
+        if count:
+            features = np.column_stack([fit, rating, vendor, cost, skills, screening])
+        else:
+            features = np.empty((0, len(FEATURES)), dtype=np.float32)
+        self.features = np.nan_to_num(features.astype(np.float32), nan=NEUTRAL)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def top_k(
+        self,
+        weights: np.ndarray,
+        k: int,
+        status: Optional[str] = None,
+        vendor_id: Optional[str] = None
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        The k best experts passing the filters.
+
+        Returns:
+            (row indices into ids/features, best first; their scores;
+            number of experts that passed the filters)
+        """
+        scores = self.features @ weights
+        candidates = np.arange(len(self.ids))
+        if status is not None or vendor_id is not None:
+            mask = np.ones(len(self.ids), dtype=bool)
+            if status is not None:
+                mask &= self.status == status
+            if vendor_id is not None:
+                mask &= self.vendor_ids == vendor_id
+            candidates = np.flatnonzero(mask)
+        filtered = scores[candidates]
+        k = min(k, len(filtered))
+        if k == 0:
+            return candidates[:0], filtered[:0], len(filtered)
+        top = np.argpartition(-filtered, k - 1)[:k]
+        top = top[np.argsort(-filtered[top], kind="stable")]
+        return candidates[top], filtered[top], len(filtered)
+
+
+# campaign_id -> (fingerprint, built_at, CampaignCandidates), least recently used first
+_cache: "OrderedDict[str, Tuple[Any, float, CampaignCandidates]]" = OrderedDict()
+
+
+async def get_campaign_candidates(
+    campaign_id: str,
+    validator: Dict[str, Any],
+    conn: Optional[asyncpg.Connection] = None
+) -> CampaignCandidates:
+    """
+    Cached feature matrix for a campaign, rebuilt when stale.
+
+    Args:
+        campaign_id: Campaign UUID (ownership already verified)
+        validator: The campaign's change validator (db.campaign_contents_validator)
+        conn: Optional connection to run on
+    """
+    catalog = get_vendor_catalog()
+    await catalog.ensure_fresh()
+    fingerprint = (tuple(sorted(validator.items())), catalog.etag)
+
+    cached = _cache.get(campaign_id)
+    if cached is not None:
+        cached_fingerprint, built_at, candidates = cached
+        if cached_fingerprint == fingerprint and time.monotonic() - built_at < RANKING_CACHE_TTL_SECONDS:
+            _cache.move_to_end(campaign_id)
+            return candidates
+
+    campaign = await execute_query(RANKING_CAMPAIGN_QUERY, campaign_id, fetch_one=True, conn=conn)
+    rows = await execute_query(RANKING_CANDIDATES_QUERY, campaign_id, fetch_all=True, conn=conn)
+    candidates = CampaignCandidates(rows, campaign)
+
+    _cache[campaign_id] = (fingerprint, time.monotonic(), candidates)
+    _cache.move_to_end(campaign_id)
+    while len(_cache) > RANKING_CACHE_SIZE:
+        _cache.popitem(last=False)
+    return candidates
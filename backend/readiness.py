@@ -0,0 +1,134 @@
+"""
+Deep readiness probe for load balancers.
+
+`/health` only proves the process is up. `/ready` checks that this worker can
+actually serve requests:
+
+- database: time a `SELECT 1` through the pool (checkout included) under
+  `READY_DB_TIMEOUT_MS`; fail when it times out, errors or is slower than
+  `READY_MAX_DB_LATENCY_MS`
+- auth: run the Better Auth session lookup with a token that cannot match,
+  so the session/user tables and their index are exercised end to end
+- pool: fail when the share of max_size checked out reaches
+  `READY_MAX_POOL_UTILIZATION` (default 1.0: every connection busy) or more
+  than `READY_MAX_POOL_WAITING` callers are queued in pool.acquire()
+
+The result is cached for `READY_CACHE_SECONDS` and concurrent probes share a
+single in-flight check, so aggressive probe intervals add at most one pair
+of trivial statements per second per worker.
+
+Usage:
+    from readiness import check_readiness
+
+    report = await check_readiness()
+    status_code = 200 if report["ready"] else 503
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, Optional
+
+from auth.better_auth import SESSION_LOOKUP_QUERY, get_auth_config
+from db import get_db, get_pool_stats
+
+
+READY_DB_TIMEOUT_MS = float(os.getenv('READY_DB_TIMEOUT_MS', '500'))
+READY_MAX_DB_LATENCY_MS = float(os.getenv('READY_MAX_DB_LATENCY_MS', '250'))
+READY_MAX_AUTH_LATENCY_MS = float(os.getenv('READY_MAX_AUTH_LATENCY_MS', '250'))
+READY_MAX_POOL_UTILIZATION = float(os.getenv('READY_MAX_POOL_UTILIZATION', '1.0'))
+READY_MAX_POOL_WAITING = int(os.getenv('READY_MAX_POOL_WAITING', '10'))
+READY_CACHE_SECONDS = float(os.getenv('READY_CACHE_SECONDS', '1'))
+
+# Token that no Better Auth session can have (tokens are non-empty)
+_PROBE_TOKEN = ""
+
+
+async def _timed(query: str, *args) -> Dict[str, Any]:
+    """Run one statement through the pool with the probe timeout."""
+    started = time.perf_counter()
+
+    async def run():
+        async with get_db() as conn:
+            await conn.fetchrow(query, *args)
+
+    try:
+        await asyncio.wait_for(run(), timeout=READY_DB_TIMEOUT_MS / 1000)
+    except asyncio.TimeoutError:
+        return {"ok": False, "latency_ms": None, "error": f"timed out after {READY_DB_TIMEOUT_MS:g} ms"}
+    except Exception as e:
+        return {"ok": False, "latency_ms": None, "error": str(e)}
+    return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+
+
+async def _check_database() -> Dict[str, Any]:
+    result = await _timed("SELECT 1")
+    if result["ok"] and result["latency_ms"] > READY_MAX_DB_LATENCY_MS:
+        result["ok"] = False
+        result["error"] = f"latency above {READY_MAX_DB_LATENCY_MS:g} ms"
+    return result
+
+
+async def _check_auth() -> Dict[str, Any]:
+    if not get_auth_config().enabled:
+        return {"ok": True, "enabled": False}
+    result = await _timed(SESSION_LOOKUP_QUERY, _PROBE_TOKEN)
+    if result["ok"] and result["latency_ms"] > READY_MAX_AUTH_LATENCY_MS:
+        result["ok"] = False
+        result["error"] = f"latency above {READY_MAX_AUTH_LATENCY_MS:g} ms"
+    return result
+
+
+def _check_pool() -> Dict[str, Any]:
+    stats = get_pool_stats()
+    if stats is None:
+        return {"ok": False, "error": "pool not initialized"}
+    in_use = stats["size"] - stats["idle"]
+    utilization = in_use / stats["max_size"] if stats["max_size"] else 0.0
+    result = {
+        "ok": True,
+        "in_use": in_use,
+        "utilization": round(utilization, 3),
+        **stats,
+    }
+    if utilization >= READY_MAX_POOL_UTILIZATION:
+        result["ok"] = False
+        result["error"] = f"pool saturated ({in_use}/{stats['max_size']} connections in use)"
+    elif stats["waiting"] > READY_MAX_POOL_WAITING:
+        result["ok"] = False
+        result["error"] = f"{stats['waiting']} callers waiting for a connection"
+    return result
+
+
+async def _run_checks() -> Dict[str, Any]:
+    # Pool occupancy first, before the probe's own checkouts skew it
+    pool = _check_pool()
+    database = await _check_database()
+    auth = await _check_auth() if database["ok"] else {"ok": False, "error": "database unavailable"}
+    return {
+        "ready": pool["ok"] and database["ok"] and auth["ok"],
+        "checked_at": time.time(),
+        "checks": {"database": database, "auth": auth, "pool": pool},
+    }
+
+
+# Cached report and in-flight check shared by concurrent probes
+_cached: Optional[Dict[str, Any]] = None
+_cached_at = 0.0
+_in_flight: Optional[asyncio.Task] = None
+
+
+async def check_readiness() -> Dict[str, Any]:
+    """Readiness report, re-checked at most once per READY_CACHE_SECONDS."""
+    global _cached, _cached_at, _in_flight
+
+    if _cached is not None and time.monotonic() - _cached_at < READY_CACHE_SECONDS:
+        return _cached
+
+    if _in_flight is None or _in_flight.done():
+        _in_flight = asyncio.get_running_loop().create_task(_run_checks())
+    # shield: a probe that disconnects mid-check must not cancel it for the others
+    report = await asyncio.shield(_in_flight)
+
+    _cached, _cached_at = report, time.monotonic()
+    return report
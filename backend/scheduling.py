@@ -0,0 +1,402 @@
+"""
+Interview scheduling: double-booking detection and slot suggestions.
+
+Interviews occupy a tstzrange (scheduled_slot, migration 016). A proposed
+slot conflicts with an interview of the same expert or the same team member
+whose slot overlaps it, unless that interview was cancelled or a no-show.
+
+`find_conflicts` checks any number of proposed slots in one query: the
+slots are passed as parallel arrays, unnested, and each probes the GiST
+indexes on (expert_id, scheduled_slot) and (team_member_id,
+scheduled_slot). Overlaps between the proposed slots themselves are found
+in the same statement.
+
+`suggest_slots` finds the earliest free slots for many experts at once. It
+reads every relevant booked interview in one query, then works on sorted
+interval lists with a sweep line: all window endpoints are sorted once and
+scanned left to right, tracking how many availability layers cover the
+current instant and how many busy intervals block it. Time is free where
+every layer covers it and nothing blocks it. The team's free time (working
+hours minus the team members' interviews) is swept once and shared by all
+experts. Each expert then costs one sweep over their own windows and
+interviews, O(n log n) in the number of intervals, not in minutes of horizon.
+
+Usage:
+    from scheduling import find_conflicts, suggest_slots
+
+    conflicts = await find_conflicts(
+        [{"expert_id": expert_id, "team_member_id": None, "starts_at": start, "ends_at": end}],
+        user_id,
+    )
+    suggestions = await suggest_slots(experts, team_member_ids, user_id, horizon_start,
+                                      horizon_end, duration_minutes=60)
+"""
+
+import math
+import os
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import asyncpg
+
+from db import execute_query
+
+
+INTERVIEW_CONFLICT_CHECK = os.getenv('INTERVIEW_CONFLICT_CHECK', 'true').lower() == 'true'
+INTERVIEW_CONFLICT_MAX_SLOTS = int(os.getenv('INTERVIEW_CONFLICT_MAX_SLOTS', '1000'))
+SUGGEST_MAX_EXPERTS = int(os.getenv('SUGGEST_MAX_EXPERTS', '500'))
+SUGGEST_MAX_HORIZON_DAYS = int(os.getenv('SUGGEST_MAX_HORIZON_DAYS', '62'))
+
+# Statuses that free an interview's slot
+NON_BLOCKING_STATUSES = ("cancelled", "no_show")
+
+# Same predicate as the partial GiST indexes of migration 016
+BLOCKING_CLAUSE = "i.status NOT IN ('cancelled', 'no_show')"
+
+CONFLICTS_QUERY = f"""
+    WITH slots AS (
+        SELECT
+            s.slot,
+            s.expert_id::uuid AS expert_id,
+            s.team_member_id::uuid AS team_member_id,
+            tstzrange(s.starts_at, s.ends_at, '[)') AS slot_range
+        FROM unnest($1::int[], $2::text[], $3::text[], $4::timestamptz[], $5::timestamptz[])
+            AS s(slot, expert_id, team_member_id, starts_at, ends_at)
+    )
+    SELECT
+        s.slot,
+        'expert' AS kind,
+        i.id AS interview_id,
+        NULL::int AS other_slot,
+        lower(i.scheduled_slot) AS starts_at,
+        upper(i.scheduled_slot) AS ends_at
+    FROM slots s
+    JOIN expert_network.interviews i
+        ON i.expert_id = s.expert_id AND i.scheduled_slot && s.slot_range AND {BLOCKING_CLAUSE}
+    JOIN expert_network.campaigns c ON c.id = i.campaign_id AND c.user_id = $6
+    WHERE i.id <> ALL($7::text[]::uuid[])
+
+    UNION ALL
+
+    SELECT
+        s.slot,
+        'team_member' AS kind,
+        i.id AS interview_id,
+        NULL::int AS other_slot,
+        lower(i.scheduled_slot) AS starts_at,
+        upper(i.scheduled_slot) AS ends_at
+    FROM slots s
+    JOIN expert_network.interviews i
+        ON i.team_member_id = s.team_member_id AND i.scheduled_slot && s.slot_range AND {BLOCKING_CLAUSE}
+    JOIN expert_network.campaigns c ON c.id = i.campaign_id AND c.user_id = $6
+    WHERE i.id <> ALL($7::text[]::uuid[])
+
+    UNION ALL
+
+    SELECT
+        a.slot,
+        CASE WHEN a.expert_id = b.expert_id THEN 'expert' ELSE 'team_member' END AS kind,
+        NULL AS interview_id,
+        b.slot AS other_slot,
+        lower(b.slot_range) AS starts_at,
+        upper(b.slot_range) AS ends_at
+    FROM slots a
+    JOIN slots b
+        ON a.slot <> b.slot
+        AND a.slot_range && b.slot_range
+        AND (a.expert_id = b.expert_id OR a.team_member_id = b.team_member_id)
+    WHERE $8
+
+    ORDER BY slot, starts_at
+"""
+
+
+async def find_conflicts(
+    slots: Sequence[Dict[str, Any]],
+    user_id: str,
+    exclude_interview_ids: Sequence[str] = (),
+    within_batch: bool = True,
+    conn: Optional[asyncpg.Connection] = None
+) -> List[Dict[str, Any]]:
+    """
+    Existing interviews (and other proposed slots) overlapping each slot.
+
+    Only the user's own interviews are considered.
+
+    Args:
+        slots: Proposed slots (expert_id, team_member_id, starts_at,
+            ends_at; either id may be None); conflicts refer to them by position
+        user_id: Authenticated user
+        exclude_interview_ids: Interviews to ignore (e.g. the one being moved)
+        within_batch: Also report overlaps between the proposed slots
+        conn: Optional connection to run on
+
+    Returns:
+        One dict per conflict, ordered by slot: slot, kind ("expert" or
+        "team_member"), interview_id or other_slot, starts_at, ends_at
+    """
+    if not slots:
+        return []
+    return await execute_query(
+        CONFLICTS_QUERY,
+        list(range(len(slots))),
+        [slot["expert_id"] for slot in slots],
+        [slot["team_member_id"] for slot in slots],
+        [slot["starts_at"] for slot in slots],
+        [slot["ends_at"] for slot in slots],
+        user_id,
+        list(exclude_interview_ids),
+        within_batch,
+        fetch_all=True,
+        conn=conn
+    )
+
+
+# Booked interviews of the given experts ($2) and team members ($3) overlapping
+# the horizon; one GiST index probe per id
+BUSY_INTERVALS_QUERY = f"""
+    SELECT
+        'expert' AS kind,
+        x.id AS owner_id,
+        lower(i.scheduled_slot) AS starts_at,
+        upper(i.scheduled_slot) AS ends_at
+    FROM unnest($2::text[]) AS x(id)
+    JOIN expert_network.interviews i
+        ON i.expert_id = x.id::uuid AND i.scheduled_slot && tstzrange($4, $5) AND {BLOCKING_CLAUSE}
+    JOIN expert_network.campaigns c ON c.id = i.campaign_id AND c.user_id = $1
+
+    UNION ALL
+
+    SELECT
+        'team_member' AS kind,
+        x.id AS owner_id,
+        lower(i.scheduled_slot) AS starts_at,
+        upper(i.scheduled_slot) AS ends_at
+    FROM unnest($3::text[]) AS x(id)
+    JOIN expert_network.interviews i
+        ON i.team_member_id = x.id::uuid AND i.scheduled_slot && tstzrange($4, $5) AND {BLOCKING_CLAUSE}
+    JOIN expert_network.campaigns c ON c.id = i.campaign_id AND c.user_id = $1
+"""
+
+# Intervals are (start, end) pairs of epoch seconds, end exclusive
+Interval = Tuple[float, float]
+
+
+def free_intervals(required: Sequence[Iterable[Interval]], blocked: Iterable[Interval]) -> List[Interval]:
+    """
+    Sweep line: the maximal intervals covered by every required layer and by no blocked interval.
+
+    Intervals within a layer (and blocked intervals) may overlap and need not
+    be sorted.
+    """
+    events = []
+    for layer, intervals in enumerate(required):
+        for start, end in intervals:
+            if end > start:
+                events.append((start, 1, layer))
+                events.append((end, -1, layer))
+    for start, end in blocked:
+        if end > start:
+            events.append((start, 1, -1))
+            events.append((end, -1, -1))
+    events.sort()
+
+    coverage = [0] * len(required)
+    uncovered = len(required)
+    blocking = 0
+    free = []
+    open_at = None
+    index, count = 0, len(events)
+    while index < count:
+        at = events[index][0]
+        # Apply every event at this instant before judging it
+        while index < count and events[index][0] == at:
+            _, delta, layer = events[index]
+            if layer < 0:
+                blocking += delta
+            else:
+                before = coverage[layer]
+                coverage[layer] += delta
+                if before == 0:
+                    uncovered -= 1
+                elif coverage[layer] == 0:
+                    uncovered += 1
+            index += 1
+        if uncovered == 0 and blocking == 0:
+            if open_at is None:
+                open_at = at
+        elif open_at is not None:
+            free.append((open_at, at))
+            open_at = None
+    return free
+
+
+def pick_slots(free: Iterable[Interval], duration: float, step: float, count: int) -> List[Interval]:
+    """The earliest `count` non-overlapping slots of `duration` starting on the `step` grid."""
+    slots = []
+    for start, end in free:
+        at = math.ceil(start / step) * step
+        while at + duration <= end:
+            slots.append((at, at + duration))
+            if len(slots) == count:
+                return slots
+            at = math.ceil((at + duration) / step) * step
+    return slots
+
+
+def working_intervals(
+    horizon: Interval,
+    tz_name: str,
+    day_start: time,
+    day_end: time,
+    weekdays: Iterable[int]
+) -> List[Interval]:
+    """
+    Daily working hours in a time zone, as intervals covering the horizon.
+
+    A day_end at or before day_start ends on the next day. Raises
+    ZoneInfoNotFoundError for an unknown zone.
+    """
+    tz = ZoneInfo(tz_name)
+    weekdays = set(weekdays)
+    first = datetime.fromtimestamp(horizon[0], tz).date() - timedelta(days=1)
+    last = datetime.fromtimestamp(horizon[1], tz).date()
+    intervals = []
+    day = first
+    while day <= last:
+        if day.weekday() in weekdays:
+            end_day = day if day_end > day_start else day + timedelta(days=1)
+            intervals.append((
+                datetime.combine(day, day_start, tzinfo=tz).timestamp(),
+                datetime.combine(end_day, day_end, tzinfo=tz).timestamp(),
+            ))
+        day += timedelta(days=1)
+    return intervals
+
+
+def _to_intervals(windows: Iterable[Tuple[datetime, datetime]]) -> List[Interval]:
+    return [(start.timestamp(), end.timestamp()) for start, end in windows]
+
+
+def _to_datetimes(slots: Iterable[Interval]) -> List[Tuple[datetime, datetime]]:
+    return [
+        (datetime.fromtimestamp(start, timezone.utc), datetime.fromtimestamp(end, timezone.utc))
+        for start, end in slots
+    ]
+
+
+async def _busy_intervals(
+    expert_ids: Sequence[str],
+    team_member_ids: Sequence[str],
+    user_id: str,
+    horizon_start: datetime,
+    horizon_end: datetime,
+    buffer_minutes: int,
+    conn: Optional[asyncpg.Connection]
+) -> Tuple[Dict[str, List[Interval]], List[Interval]]:
+    """Booked time per expert, and of the team as a whole, padded by buffer_minutes."""
+    rows = await execute_query(
+        BUSY_INTERVALS_QUERY,
+        user_id,
+        list(expert_ids),
+        list(team_member_ids),
+        horizon_start,
+        horizon_end,
+        fetch_all=True,
+        conn=conn
+    )
+    pad = buffer_minutes * 60
+    by_expert: Dict[str, List[Interval]] = {}
+    team: List[Interval] = []
+    for row in rows:
+        interval = (row["starts_at"].timestamp() - pad, row["ends_at"].timestamp() + pad)
+        if row["kind"] == "expert":
+            by_expert.setdefault(row["owner_id"], []).append(interval)
+        else:
+            team.append(interval)
+    return by_expert, team
+
+
+async def suggest_slots(
+    experts: Sequence[Dict[str, Any]],
+    team_member_ids: Sequence[str],
+    user_id: str,
+    horizon_start: datetime,
+    horizon_end: datetime,
+    duration_minutes: int,
+    count: int = 3,
+    step_minutes: int = 15,
+    buffer_minutes: int = 0,
+    working_hours: Optional[Dict[str, Any]] = None,
+    together: bool = False,
+    conn: Optional[asyncpg.Connection] = None
+) -> List[List[Tuple[datetime, datetime]]]:
+    """
+    Earliest free interview slots.
+
+    A slot is free when it lies in the horizon, within working hours (if
+    given), inside the expert's availability windows (an expert without
+    windows is available throughout), and overlaps no booked interview of
+    the expert or of any listed team member.
+
+    Args:
+        experts: {"expert_id", "windows": [(start, end), ...]} with
+            timezone-aware datetimes
+        team_member_ids: Team members who must all be free
+        user_id: Authenticated user (only their interviews count as busy)
+        horizon_start: Earliest slot start
+        horizon_end: Latest slot end
+        duration_minutes: Slot length
+        count: Slots to return per expert (or in total when together)
+        step_minutes: Slot starts are multiples of this many minutes (UTC)
+        buffer_minutes: Free time to keep around booked interviews
+        working_hours: Optional {"timezone", "day_start", "day_end", "weekdays"}
+            (weekdays: 0 = Monday)
+        together: Find slots where all experts are free at the same time
+            (a group call) instead of slots per expert
+        conn: Optional connection to run on
+
+    Returns:
+        Per expert, in input order, its earliest slots as (start, end) UTC
+        datetimes; when together, a single list of common slots
+    """
+    horizon = (horizon_start.timestamp(), horizon_end.timestamp())
+    by_expert, team_busy = await _busy_intervals(
+        [expert["expert_id"] for expert in experts],
+        team_member_ids,
+        user_id,
+        horizon_start,
+        horizon_end,
+        buffer_minutes,
+        conn
+    )
+
+    # Team availability, shared by every expert
+    team_layers = [[horizon]]
+    if working_hours:
+        team_layers.append(working_intervals(
+            horizon,
+            working_hours["timezone"],
+            working_hours["day_start"],
+            working_hours["day_end"],
+            working_hours["weekdays"],
+        ))
+    team_free = free_intervals(team_layers, team_busy)
+
+    duration, step = duration_minutes * 60, step_minutes * 60
+    if together:
+        layers = [team_free] + [
+            _to_intervals(expert["windows"]) for expert in experts if expert["windows"]
+        ]
+        blocked = [interval for expert in experts for interval in by_expert.get(expert["expert_id"], ())]
+        return [_to_datetimes(pick_slots(free_intervals(layers, blocked), duration, step, count))]
+
+    suggestions = []
+    for expert in experts:
+        layers = [team_free]
+        if expert["windows"]:
+            layers.append(_to_intervals(expert["windows"]))
+        free = free_intervals(layers, by_expert.get(expert["expert_id"], ()))
+        suggestions.append(_to_datetimes(pick_slots(free, duration, step, count)))
+    return suggestions
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark response serialization for /api/campaigns and /api/experts payloads.
+
+Mounts the real response models on two routers - one using FastAPI's default
+route/response classes, one using fast_json.FastJSONRoute - with endpoints
+that return synthetic rows shaped exactly like execute_query output. No
+database is needed, so the numbers isolate validation + serialization cost.
+
+Usage:
+    python scripts/bench_json_response.py
+    python scripts/bench_json_response.py --campaigns 200 --experts 2000 --requests 200
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from datetime import date, datetime, timezone
+
+import httpx
+from fastapi import APIRouter, FastAPI
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from fast_json import FastJSONResponse, FastJSONRoute, fast_json  # noqa: E402
+from models.campaign import CampaignListResponse  # noqa: E402
+from models.expert import ExpertListResponse  # noqa: E402
+
+
+def make_campaigns(n: int):
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": "demo-user-123",
+            "project_id": str(uuid.uuid4()),
+            "project_name": "TechCo Acquisition Due Diligence",
+            "project_code": "DEAL-2025-001",
+            "campaign_name": f"Campaign {i}",
+            "industry_vertical": "Healthcare Technology",
+            "custom_industry": None,
+            "brief_description": "Understanding AI adoption in clinical workflows",
+            "start_date": date(2025, 2, 1),
+            "target_completion_date": date(2025, 3, 15),
+            "target_regions": ["North America", "Europe"],
+            "custom_regions": None,
+            "min_calls": 15,
+            "max_calls": 20,
+            "display_order": i,
+            "expert_count": 24,
+            "interview_count": 8,
+            "vendor_enrollment_count": 3,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(n)
+    ]
+
+
+def make_experts(n: int):
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "campaign_id": str(uuid.uuid4()),
+            "vendor_platform_id": str(uuid.uuid4()),
+            "expert_name": f"Expert {i}",
+            "current_title": "Director of Clinical AI",
+            "current_company": "Memorial Hospital",
+            "avatar_url": None,
+            "bio": "15+ years experience implementing AI in clinical settings. " * 4,
+            "work_history": "Previously at several large health systems.",
+            "expertise_areas": ["Clinical AI", "Healthcare IT", "EHR Integration"],
+            "rating": 4.8,
+            "relevance_score": 9,
+            "status": "proposed",
+            "is_new": True,
+            "created_at": now,
+            "updated_at": now,
+            "reviewed_at": None,
+            "vendor_name": "GLG",
+            "vendor_logo_url": "/images/vendor-logos/GLG.png",
+            "interview_count": 1,
+        }
+        for i in range(n)
+    ]
+
+
+def build_app(campaigns, experts) -> FastAPI:
+    app = FastAPI()
+    default_router = APIRouter(prefix="/default")
+    fast_router = APIRouter(prefix="/fast", route_class=FastJSONRoute, default_response_class=FastJSONResponse)
+
+    for router in (default_router, fast_router):
+        @router.get("/api/campaigns", response_model=CampaignListResponse)
+        @fast_json
+        async def list_campaigns():
+            return {"campaigns": campaigns, "total": len(campaigns)}
+
+        @router.get("/api/experts", response_model=ExpertListResponse)
+        @fast_json
+        async def list_experts():
+            return {"experts": experts, "total": len(experts), "limit": len(experts), "has_more": False}
+
+        app.include_router(router)
+    return app
+
+
+async def measure(app: FastAPI, path: str, requests: int) -> float:
+    """Sequential requests/sec for one path."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.get(path)
+        assert response.status_code == 200, response.text
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.get(path)
+        return requests / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--campaigns', type=int, default=200, help='Campaigns per response')
+    parser.add_argument('--experts', type=int, default=1000, help='Experts per response')
+    parser.add_argument('--requests', type=int, default=100, help='Requests per measurement')
+    args = parser.parse_args()
+
+    app = build_app(make_campaigns(args.campaigns), make_experts(args.experts))
+
+    print("=" * 60)
+    print(f"Serialization benchmark: {args.campaigns} campaigns / {args.experts} experts per response")
+    print("=" * 60)
+    for endpoint in ("/api/campaigns", "/api/experts"):
+        before = await measure(app, f"/default{endpoint}", args.requests)
+        after = await measure(app, f"/fast{endpoint}", args.requests)
+        print(f"  {endpoint:<16} default {before:>8.1f} req/s   orjson {after:>8.1f} req/s   ({after / before:.2f}x)")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
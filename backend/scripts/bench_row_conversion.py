@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: row-to-dict conversion with and without type codecs.
+
+Compares the old result path (asyncpg decodes UUID/NUMERIC to uuid.UUID and
+Decimal, then convert_uuids_to_strings walks every value a second time) with
+the codec path from db._init_connection (the driver decodes straight to
+str/float, and rows only need dict()).
+
+Offline mode (default) simulates expert-list rows in memory, so it runs
+without a database. --live fetches real experts twice: once on a plain
+connection, once on a connection with the codecs registered.
+
+Usage:
+    python scripts/bench_row_conversion.py
+    python scripts/bench_row_conversion.py --rows 5000 --repeat 50
+    python scripts/bench_row_conversion.py --live --limit 5000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import asyncpg
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from db import ASYNCPG_URL, _init_connection, convert_uuids_to_strings  # noqa: E402
+
+EXPERT_QUERY = """
+    SELECT e.id, e.campaign_id, e.vendor_platform_id, e.name, e.title, e.company,
+           e.description, e.skills, e.rating, e.ai_fit_score, e.status,
+           e.created_at, e.updated_at, v.name as vendor_name, v.overall_score
+    FROM expert_network.experts e
+    JOIN expert_network.vendor_platforms v ON e.vendor_platform_id = v.id
+    LIMIT $1
+"""
+
+
+def make_raw_values(rows: int):
+    """Wire-level values as the driver would see them (bytes/str before decoding)."""
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": uuid.uuid4().bytes,
+            "campaign_id": uuid.uuid4().bytes,
+            "vendor_platform_id": uuid.uuid4().bytes,
+            "name": f"Expert {i}",
+            "title": "Director",
+            "company": "Company",
+            "description": "Long description " * 10,
+            "skills": ["Clinical AI", "Healthcare IT"],
+            "rating": "4.7",
+            "ai_fit_score": 8,
+            "status": "proposed",
+            "created_at": now,
+            "updated_at": now,
+            "vendor_name": "GLG",
+            "overall_score": "4.8",
+        }
+        for i in range(rows)
+    ]
+
+
+UUID_COLUMNS = ("id", "campaign_id", "vendor_platform_id")
+NUMERIC_COLUMNS = ("rating", "overall_score")
+
+
+def old_path(raw_rows):
+    """Decode to UUID/Decimal, build dicts, then recursively convert."""
+    results = []
+    for raw in raw_rows:
+        row = dict(raw)
+        for col in UUID_COLUMNS:
+            row[col] = uuid.UUID(bytes=raw[col])
+        for col in NUMERIC_COLUMNS:
+            row[col] = Decimal(raw[col])
+        results.append(row)
+    return convert_uuids_to_strings(results)
+
+
+def codec_path(raw_rows):
+    """Decode straight to str/float while building dicts (single pass)."""
+    results = []
+    for raw in raw_rows:
+        row = dict(raw)
+        for col in UUID_COLUMNS:
+            row[col] = str(uuid.UUID(bytes=raw[col]))
+        for col in NUMERIC_COLUMNS:
+            row[col] = float(raw[col])
+        results.append(row)
+    return results
+
+
+def time_it(fn, *args, repeat: int) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def time_live(limit: int, repeat: int, with_codecs: bool) -> float:
+    """Best-of-N fetch + conversion time against a real database, in milliseconds."""
+    conn = await asyncpg.connect(ASYNCPG_URL)
+    try:
+        if with_codecs:
+            await _init_connection(conn)
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            rows = await conn.fetch(EXPERT_QUERY, limit)
+            if with_codecs:
+                [dict(row) for row in rows]
+            else:
+                convert_uuids_to_strings([dict(row) for row in rows])
+            best = min(best, time.perf_counter() - start)
+        return best * 1000
+    finally:
+        await conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=5000, help='Simulated rows (offline mode)')
+    parser.add_argument('--repeat', type=int, default=20, help='Repetitions (best time is reported)')
+    parser.add_argument('--live', action='store_true', help='Benchmark against DATABASE_URL')
+    parser.add_argument('--limit', type=int, default=5000, help='Rows to fetch in live mode')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    if args.live:
+        print(f"Live benchmark: {args.limit} experts, best of {args.repeat}")
+        before = asyncio.run(time_live(args.limit, args.repeat, with_codecs=False))
+        after = asyncio.run(time_live(args.limit, args.repeat, with_codecs=True))
+    else:
+        print(f"Offline benchmark: {args.rows} simulated rows, best of {args.repeat}")
+        raw_rows = make_raw_values(args.rows)
+        assert old_path(raw_rows) == codec_path(raw_rows)
+        before = time_it(old_path, raw_rows, repeat=args.repeat)
+        after = time_it(codec_path, raw_rows, repeat=args.repeat)
+    print("=" * 60)
+    print(f"  before (decode + recursive convert)  {before:>8.2f} ms")
+    print(f"  after  (codec, single pass)          {after:>8.2f} ms")
+    print(f"\n✓ Speedup: {before / after:.2f}x")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Benchmark: similarity lookup candidate counts and recall at scale.
+
+Simulates a skill similarity index of --experts experts spread over --users
+users and probes it the way SIMILAR_EXPERTS_QUERY does, for each band width
+in --band-rows:
+
+- band hits: experts (of every user) sharing a band key with the probe,
+  i.e. what the GIN probe on expert_skill_signatures.bands reads
+- own hits: the probe user's share of those, before and after the
+  SIMILARITY_MAX_CANDIDATES cap (the rows that get scored)
+- recall: share of the probe's true neighbours (signature agreement of
+  at least 0.5 and 0.7 over the whole index) that are band hits
+- lookup: time to find and score the candidates in memory (sorted band
+  columns stand in for the GIN index)
+
+Experts draw skill tokens from a shared Zipf vocabulary plus one topic, so
+experts on the same topic overlap and the rest mostly do not; a tenth are
+near-copies of another expert (re-proposals of the same person). Signatures use
+the hash functions from similarity.py; band keys use its band hashing for
+the configured width. Runs without a database. Needs about 2 GB of memory at
+the default 1M experts.
+
+Usage:
+    python scripts/bench_similarity.py
+    python scripts/bench_similarity.py --experts 200000 --band-rows 3,4,6,8
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import similarity  # noqa: E402
+from similarity import SIGNATURE_SIZE, SIMILARITY_MAX_CANDIDATES, band_keys, signature  # noqa: E402
+
+VOCABULARY = 20000
+TOPICS = 5000
+TOPIC_TOKENS = 12
+DUPLICATE_SHARE = 0.1
+CHUNK = 20000
+
+
+def token_values(tokens):
+    """Per-token hash columns (SIGNATURE_SIZE x tokens), as signature() computes them."""
+    hashes = np.array([similarity._token_hash(token) for token in tokens], dtype=np.uint64)
+    mixed = (similarity._HASH_A[:, None] * hashes[None, :] + similarity._HASH_B[:, None]) >> np.uint64(32)
+    return mixed.astype(np.uint32)
+
+
+def make_index(experts: int, users: int, rng: np.random.Generator):
+    """Signatures (experts x SIGNATURE_SIZE) and owning users of a simulated index."""
+    vocabulary = [f"word{i}" for i in range(VOCABULARY)]
+    topic_words = [f"topic{t}:{i}" for t in range(TOPICS) for i in range(TOPIC_TOKENS)]
+    values = token_values(vocabulary + topic_words)
+
+    # Zipf-like popularity for the shared vocabulary
+    weights = 1.0 / np.arange(1, VOCABULARY + 1)
+    weights /= weights.sum()
+
+    signatures = np.empty((experts, SIGNATURE_SIZE), dtype=np.uint32)
+    topics = rng.integers(0, TOPICS, size=experts)
+    owners = rng.integers(0, users, size=experts)
+    for start in range(0, experts, CHUNK):
+        count = min(CHUNK, experts - start)
+        shared = rng.choice(VOCABULARY, size=(count, 6), p=weights)
+        # Most of a topic's tokens, so same-topic experts overlap strongly
+        picks = rng.random((count, TOPIC_TOKENS)).argsort(axis=1)[:, :9]
+        own = VOCABULARY + topics[start:start + count, None] * TOPIC_TOKENS + picks
+        tokens = np.concatenate([shared, own], axis=1)
+        # Re-proposals of the same person, for the same user: a copy with one
+        # to three tokens swapped
+        copies = rng.random(count) < DUPLICATE_SHARE
+        sources = rng.integers(0, count, size=int(copies.sum()))
+        tokens[copies] = tokens[sources]
+        owners[start:start + count][copies] = owners[start + sources]
+        for swapped in range(3):
+            changed = copies & (rng.random(count) < 1 / (swapped + 1))
+            tokens[changed, swapped] = rng.integers(0, VOCABULARY, size=int(changed.sum()))
+        signatures[start:start + count] = values[:, tokens].min(axis=2).T
+    return signatures, owners
+
+
+def band_matrix(signatures: np.ndarray, rows: int) -> np.ndarray:
+    """Band keys (experts x bands) for a band width, hashed like similarity.band_keys."""
+    bands = SIGNATURE_SIZE // rows
+    if rows == similarity.BAND_ROWS:
+        seeds = similarity._BAND_SEEDS
+    else:
+        seeds = np.random.default_rng(rows).integers(1, 2**63, size=bands, dtype=np.uint64)
+    cut = signatures[:, :bands * rows].astype(np.uint64).reshape(len(signatures), bands, rows)
+    keys = np.broadcast_to(seeds, (len(signatures), bands)).copy()
+    for column in range(rows):
+        keys = (keys ^ cut[:, :, column]) * similarity._FNV_PRIME
+    return keys.view(np.int64)
+
+
+def percentile(values, q):
+    return float(np.percentile(values, q)) if len(values) else 0.0
+
+
+def run(signatures, owners, probes, rows: int, cap: int):
+    keys = band_matrix(signatures, rows)
+    order = np.argsort(keys, axis=0, kind="stable")
+    sorted_keys = np.take_along_axis(keys, order, axis=0)
+
+    band_hits, own_hits, scored, lookups = [], [], [], []
+    found = {0.5: [0, 0], 0.7: [0, 0]}
+    for probe in probes:
+        started = time.perf_counter()
+        hits = []
+        for band in range(keys.shape[1]):
+            low, high = np.searchsorted(sorted_keys[:, band], keys[probe, band], side="left"), \
+                np.searchsorted(sorted_keys[:, band], keys[probe, band], side="right")
+            hits.append(order[low:high, band])
+        hits = np.unique(np.concatenate(hits))
+        hits = hits[hits != probe]
+        own = hits[owners[hits] == owners[probe]][:cap]
+        (signatures[own] == signatures[probe]).sum(axis=1)
+        lookups.append(time.perf_counter() - started)
+
+        band_hits.append(len(hits))
+        own_hits.append(int((owners[hits] == owners[probe]).sum()))
+        scored.append(len(own))
+
+        agreement = (signatures == signatures[probe]).mean(axis=1)
+        agreement[probe] = 0
+        hit = np.zeros(len(signatures), dtype=bool)
+        hit[hits] = True
+        for threshold, counts in found.items():
+            neighbours = agreement >= threshold
+            counts[0] += int(neighbours.sum())
+            counts[1] += int((neighbours & hit).sum())
+
+    print(f"  {rows} rows x {keys.shape[1]} bands")
+    print(f"    band hits (all users)   mean {np.mean(band_hits):>9.1f}   p99 {percentile(band_hits, 99):>9.1f}")
+    print(f"    own hits                mean {np.mean(own_hits):>9.1f}   p99 {percentile(own_hits, 99):>9.1f}")
+    print(f"    scored (cap {cap:>5})      mean {np.mean(scored):>9.1f}   p99 {percentile(scored, 99):>9.1f}")
+    for threshold, (total, hit) in found.items():
+        recall = hit / total if total else float("nan")
+        print(f"    recall at {threshold:.1f}           {recall:>9.1%}   ({total} neighbours)")
+    print(f"    lookup (in memory)      mean {np.mean(lookups) * 1000:>7.2f} ms   p99 {percentile(lookups, 99) * 1000:>7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--experts', type=int, default=1_000_000, help='Indexed experts')
+    parser.add_argument('--users', type=int, default=1000, help='Users the experts are spread over')
+    parser.add_argument('--probes', type=int, default=200, help='Lookups to sample')
+    parser.add_argument('--band-rows', default=f"3,{similarity.BAND_ROWS}", help='Comma-separated band widths')
+    parser.add_argument('--cap', type=int, default=SIMILARITY_MAX_CANDIDATES, help='Candidates scored per lookup')
+    args = parser.parse_args()
+
+    # The simulated token hashing must match similarity.signature()
+    sample = {"word1", "word2", "topic3:4"}
+    assert np.array_equal(signature(sample), token_values(sorted(sample)).min(axis=1))
+    assert np.array_equal(band_keys(signature(sample)), band_matrix(signature(sample)[None, :], similarity.BAND_ROWS)[0])
+
+    rng = np.random.default_rng(20260601)
+    print("=" * 60)
+    print(f"Similarity lookup: {args.experts} experts, {args.users} users, {args.probes} probes")
+    print("=" * 60)
+    started = time.perf_counter()
+    signatures, owners = make_index(args.experts, args.users, rng)
+    print(f"  index simulated in {time.perf_counter() - started:.1f} s")
+    probes = rng.choice(args.experts, size=args.probes, replace=False)
+    for rows in sorted({int(rows) for rows in args.band_rows.split(",")}):
+        run(signatures, owners, probes, rows, args.cap)
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Load test for the live update stream (GET /api/events).
+
+Opens N concurrent SSE streams against the real app and measures what idle
+streams cost and how fast a notification reaches all of them:
+
+- memory: process RSS before and after the streams are open, per stream
+- idle CPU: process CPU time over an idle window (heartbeats only)
+- fan-out: time from `pg_notify('campaign_changes', ...)` on a separate
+  connection until every subscribed stream has the `change` event
+
+Streams are driven as raw ASGI calls in-process (like bench_auth.py, no
+sockets), so the numbers are the server side's cost per stream. The
+listener connection is real, so DATABASE_URL must point at a database; no
+schema data is needed.
+
+Usage:
+    python scripts/bench_sse_streams.py
+    python scripts/bench_sse_streams.py --streams 10000 --users 500 --events 20
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--streams", type=int, default=5000, help="Concurrent streams to open")
+parser.add_argument("--users", type=int, default=100, help="Distinct users the streams belong to")
+parser.add_argument("--events", type=int, default=10, help="Notification rounds to time")
+parser.add_argument("--idle", type=float, default=10.0, help="Idle window in seconds")
+parser.add_argument("--heartbeat", type=float, default=2.0, help="LIVE_HEARTBEAT_SECONDS for the run")
+args = parser.parse_args()
+
+# Must be set before live_updates is imported
+os.environ["LIVE_HEARTBEAT_SECONDS"] = str(args.heartbeat)
+os.environ["LIVE_MAX_SUBSCRIBERS"] = str(max(args.streams, 10000))
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import asyncpg  # noqa: E402
+from fastapi import Header  # noqa: E402
+
+from db import ASYNCPG_URL  # noqa: E402
+from auth.better_auth import get_current_user, User  # noqa: E402
+from live_updates import LIVE_CHANNEL, get_live_hub  # noqa: E402
+from main import app  # noqa: E402
+
+
+def rss_kb() -> int:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+async def bench_user(x_user_id: str = Header(...)) -> User:
+    return User(user_id=x_user_id, email=None, name=x_user_id)
+
+
+class Stream:
+    """One in-process SSE client: an ASGI call that runs until disconnect."""
+
+    def __init__(self, user_id: str, disconnect: asyncio.Event):
+        self.user_id = user_id
+        self.disconnect = disconnect
+        self.ready = asyncio.Event()
+        self.status = None
+        self.heartbeats = 0
+        self.received = {}  # round -> perf_counter() at delivery
+
+    async def receive(self):
+        await self.disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(self, message):
+        if message["type"] == "http.response.start":
+            self.status = message["status"]
+            if self.status != 200:
+                self.ready.set()
+            return
+        chunk = message.get("body", b"")
+        if chunk.startswith(b": ping"):
+            self.heartbeats += 1
+        elif b"event: ready" in chunk:
+            self.ready.set()
+        elif b"event: change" in chunk:
+            data = json.loads(chunk.split(b"data: ", 1)[1])
+            self.received[data["ids"][0]] = time.perf_counter()
+
+    async def run(self):
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/events",
+            "raw_path": b"/api/events",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"x-user-id", self.user_id.encode()), (b"accept", b"text/event-stream")],
+            "client": ("127.0.0.1", 0),
+            "server": ("127.0.0.1", 8000),
+            "app": app,
+        }
+        await app(scope, self.receive, self.send)
+
+
+async def main():
+    app.dependency_overrides[get_current_user] = bench_user
+    hub = get_live_hub()
+    await hub.start()
+    if not hub.available:
+        print("Live update listener did not start; check DATABASE_URL")
+        return
+
+    users = [f"bench-user-{i}" for i in range(args.users)]
+    disconnect = asyncio.Event()
+    streams = [Stream(users[i % args.users], disconnect) for i in range(args.streams)]
+
+    print(f"Opening {args.streams} streams for {args.users} users...")
+    rss_before = rss_kb()
+    started = time.perf_counter()
+    tasks = [asyncio.create_task(stream.run()) for stream in streams]
+    await asyncio.gather(*(stream.ready.wait() for stream in streams))
+    open_seconds = time.perf_counter() - started
+    rejected = sum(1 for stream in streams if stream.status != 200)
+    rss_after = rss_kb()
+
+    print(f"  opened in {open_seconds:.2f}s ({rejected} rejected), subscribers={hub.subscriber_count}")
+    print(f"  RSS {rss_before / 1024:.1f} MB -> {rss_after / 1024:.1f} MB "
+          f"({(rss_after - rss_before) / max(args.streams, 1):.2f} KB per stream)")
+
+    # Idle: only heartbeats
+    cpu_before = time.process_time()
+    await asyncio.sleep(args.idle)
+    cpu_idle = time.process_time() - cpu_before
+    heartbeats = sum(stream.heartbeats for stream in streams)
+    print(f"Idle {args.idle:.0f}s: {heartbeats} heartbeats, CPU {cpu_idle:.3f}s "
+          f"({100 * cpu_idle / args.idle:.1f}% of one core)")
+
+    # Fan-out: one notification per user per round
+    notifier = await asyncpg.connect(ASYNCPG_URL)
+    latencies = []
+    try:
+        for round_no in range(args.events):
+            sent_at = time.perf_counter()
+            async with notifier.transaction():
+                for user_id in users:
+                    payload = json.dumps({
+                        "table": "experts",
+                        "op": "update",
+                        "campaign_id": None,
+                        "user_id": user_id,
+                        "ids": [round_no],
+                        "n": 1,
+                    })
+                    await notifier.execute("SELECT pg_notify($1, $2)", LIVE_CHANNEL, payload)
+            # NOTIFY is delivered on commit; wait until every stream has it
+            while not all(round_no in stream.received for stream in streams if stream.status == 200):
+                await asyncio.sleep(0.001)
+            last = max(stream.received[round_no] for stream in streams if stream.status == 200)
+            latencies.append((last - sent_at) * 1000)
+    finally:
+        await notifier.close()
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"Fan-out to {args.streams - rejected} streams ({args.users} notifications per round, "
+          f"{args.events} rounds): median {statistics.median(latencies):.1f} ms, "
+          f"p99 {p99:.1f} ms, max {latencies[-1]:.1f} ms")
+
+    disconnect.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    print(f"Closed; subscribers={hub.subscriber_count}")
+    await hub.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
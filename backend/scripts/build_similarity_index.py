@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Build or refresh the expert skill similarity index (migration 014).
+
+New and updated experts are indexed by the API as they are written; run this
+once after applying the migration to index existing experts, and again with
+--full after changing the signature parameters or tokenizer in
+similarity.py. Without --full, only experts whose signature is missing or
+older than the expert row are processed. With row-level security switched
+on, a session without a user sees no rows, so connect as a superuser or set
+DB_MAINTENANCE_ROLE (migrations/008_row_level_security.sql).
+
+Usage:
+    python scripts/build_similarity_index.py
+    python scripts/build_similarity_index.py --full --batch-size 5000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from db import init_db_pool, close_db_pool  # noqa: E402
+from similarity import SIMILARITY_REINDEX_BATCH, rebuild_similarity_index  # noqa: E402
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--full', action='store_true', help='Re-index every expert, not only stale ones')
+    parser.add_argument('--batch-size', type=int, default=SIMILARITY_REINDEX_BATCH,
+                        help=f'Experts per batch (default: {SIMILARITY_REINDEX_BATCH})')
+    args = parser.parse_args()
+
+    await init_db_pool()
+    try:
+        start = time.perf_counter()
+        stats = await rebuild_similarity_index(full=args.full, batch_size=args.batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"Scanned {stats['scanned']} experts, indexed {stats['indexed']} in {elapsed:.1f}s")
+    finally:
+        await close_db_pool()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
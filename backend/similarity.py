@@ -0,0 +1,366 @@
+"""
+Skill similarity index for "find more like this expert".
+
+Each expert is reduced to a set of tokens: normalized skill phrases plus the
+words of their skills, title and description (stopwords dropped). Similarity
+is the Jaccard overlap of two token sets, estimated with MinHash:
+
+1. Signature: SIGNATURE_SIZE universal hash functions (multiply-shift over a
+   64-bit BLAKE2 token hash) are applied to every token, and the minimum of
+   each is kept. The share of equal positions in two signatures estimates
+   the Jaccard similarity of their token sets.
+2. Bands: the signature is cut into NUM_BANDS bands of BAND_ROWS positions,
+   each hashed to a 64-bit key. Two experts with Jaccard similarity s share
+   at least one key with probability 1 - (1 - s^BAND_ROWS)^NUM_BANDS: about
+   2e-5 at 0.1, 1% at 0.3, 22% at 0.5, 53% at 0.6, 87% at 0.7 and 99% at
+   0.8. The index is built for close matches: loosely related experts are
+   rarely candidates.
+
+Signatures live in expert_skill_signatures (migration 014) with a GIN index
+on the band keys. A lookup reads the experts sharing a band with the query
+expert, keeps those in the user's campaigns, and ranks at most
+SIMILARITY_MAX_CANDIDATES of them in SQL by signature agreement. The band
+probe itself is not scoped to the user: its cost grows with the number of
+indexed experts (of every user) that collide with the query expert, which
+is why the bands are this narrow. scripts/bench_similarity.py measures the
+candidate counts and recall at 1M experts.
+
+The hash functions are seeded with a constant, so every worker and the
+backfill script compute identical signatures. Changing SIGNATURE_SIZE,
+BAND_ROWS or the tokenizer requires rebuilding the index
+(scripts/build_similarity_index.py --full).
+
+Usage:
+    from similarity import similar_experts, schedule_similarity_index
+
+    neighbours = await similar_experts(expert_id, user_id, limit=20)
+    background_tasks.add_task(schedule_similarity_index, [expert["id"]])
+"""
+
+import asyncio
+import hashlib
+import math
+import os
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import asyncpg
+import numpy as np
+
+from db import execute_query, get_db, get_maintenance_db
+
+
+SIMILARITY_INDEX_ON_WRITE = os.getenv('SIMILARITY_INDEX_ON_WRITE', 'true').lower() == 'true'
+SIMILARITY_REINDEX_BATCH = int(os.getenv('SIMILARITY_REINDEX_BATCH', '2000'))
+
+# Band candidates scored per lookup; past this, an arbitrary subset is scored
+SIMILARITY_MAX_CANDIDATES = int(os.getenv('SIMILARITY_MAX_CANDIDATES', '2000'))
+
+SIGNATURE_SIZE = 96
+BAND_ROWS = 6
+NUM_BANDS = SIGNATURE_SIZE // BAND_ROWS
+
+_rng = np.random.default_rng(0x5EED5EED)
+_HASH_A = _rng.integers(1, 2**63, size=SIGNATURE_SIZE, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_HASH_B = _rng.integers(0, 2**63, size=SIGNATURE_SIZE, dtype=np.uint64)
+_BAND_SEEDS = _rng.integers(1, 2**63, size=NUM_BANDS, dtype=np.uint64)
+_FNV_PRIME = np.uint64(0x100000001B3)
+
+_WORD = re.compile(r"[^\W_]+")
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have",
+    "in", "into", "is", "it", "its", "of", "on", "or", "over", "the", "their", "to",
+    "with", "within", "years", "year", "experience", "experienced", "expert",
+    "expertise", "including", "extensive", "senior", "various", "across",
+}
+
+SIGNATURE_SOURCE_COLUMNS = """
+    e.id,
+    e.campaign_id,
+    e.skills,
+    e.title,
+    e.description,
+    e.updated_at
+"""
+
+SIGNATURE_UPSERT_QUERY = """
+    INSERT INTO expert_network.expert_skill_signatures
+        (expert_id, campaign_id, signature, bands, source_updated_at)
+    VALUES ($1, $2, $3, $4, $5)
+    ON CONFLICT (expert_id) DO UPDATE
+    SET campaign_id = EXCLUDED.campaign_id,
+        signature = EXCLUDED.signature,
+        bands = EXCLUDED.bands,
+        source_updated_at = EXCLUDED.source_updated_at,
+        indexed_at = NOW()
+    WHERE expert_network.expert_skill_signatures.source_updated_at <= EXCLUDED.source_updated_at
+"""
+
+# The user's experts sharing a band key with the probe (at most $7 of them),
+# then scored by signature agreement. The campaign filter lets the planner
+# start from the user's campaigns instead of the band index when that is
+# the smaller side.
+SIMILAR_EXPERTS_QUERY = """
+    WITH hits AS (
+        SELECT s.expert_id, s.signature
+        FROM expert_network.expert_skill_signatures s
+        WHERE s.bands && $4::bigint[]
+          AND s.campaign_id IN (
+              SELECT id FROM expert_network.campaigns WHERE user_id = $2
+          )
+          AND s.expert_id <> $1
+        LIMIT $7
+    ),
+    candidates AS (
+        SELECT
+            h.expert_id,
+            (
+                SELECT COUNT(*)
+                FROM unnest(h.signature, $3::integer[]) AS p(a, b)
+                WHERE p.a = p.b
+            ) as matches
+        FROM hits h
+    )
+    SELECT expert_id, matches
+    FROM candidates
+    WHERE matches >= $5
+    ORDER BY matches DESC, expert_id
+    LIMIT $6
+"""
+
+
+def _words(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    return [word for word in _WORD.findall(text.lower()) if not word.isdigit()]
+
+
+def _keywords(text: Optional[str]) -> List[str]:
+    return [word for word in _words(text) if len(word) > 1 and word not in _STOPWORDS]
+
+
+def expert_tokens(
+    skills: Optional[Iterable[str]],
+    title: Optional[str],
+    description: Optional[str]
+) -> Set[str]:
+    """Token set of an expert: whole skill phrases plus individual words."""
+    tokens = set()
+    for skill in skills or ():
+        words = _words(skill)
+        if words:
+            tokens.add("skill:" + " ".join(words))
+            tokens.update(_keywords(skill))
+    tokens.update(_keywords(title))
+    tokens.update(_keywords(description))
+    return tokens
+
+
+@lru_cache(maxsize=65536)
+def _token_hash(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+
+
+def signature(tokens: Set[str]) -> Optional[np.ndarray]:
+    """MinHash signature (SIGNATURE_SIZE uint32 values), or None for an empty set."""
+    if not tokens:
+        return None
+    hashes = np.fromiter((_token_hash(token) for token in tokens), dtype=np.uint64, count=len(tokens))
+    # Multiply-shift hashing: uint64 arithmetic wraps modulo 2^64 by design
+    mixed = (_HASH_A[:, None] * hashes[None, :] + _HASH_B[:, None]) >> np.uint64(32)
+    return mixed.min(axis=1).astype(np.uint32)
+
+
+def band_keys(values: np.ndarray) -> np.ndarray:
+    """LSH band keys (NUM_BANDS int64 values) of a signature."""
+    bands = values.astype(np.uint64).reshape(NUM_BANDS, BAND_ROWS)
+    keys = _BAND_SEEDS.copy()
+    for column in range(BAND_ROWS):
+        keys = (keys ^ bands[:, column]) * _FNV_PRIME
+    return keys.view(np.int64)
+
+
+def _signature_record(row: Dict[str, Any]) -> Optional[tuple]:
+    """Upsert arguments for an expert row, or None when it has no tokens."""
+    values = signature(expert_tokens(row["skills"], row["title"], row["description"]))
+    if values is None:
+        return None
+    return (
+        row["id"],
+        row["campaign_id"],
+        values.view(np.int32).tolist(),
+        band_keys(values).tolist(),
+        row["updated_at"],
+    )
+
+
+async def _store_signatures(conn: asyncpg.Connection, rows: List[Dict[str, Any]]) -> int:
+    records = []
+    empty = []
+    for row in rows:
+        record = _signature_record(row)
+        if record is None:
+            empty.append(row["id"])
+        else:
+            records.append(record)
+    async with conn.transaction():
+        if records:
+            await conn.executemany(SIGNATURE_UPSERT_QUERY, records)
+        if empty:
+            await conn.execute(
+                "DELETE FROM expert_network.expert_skill_signatures WHERE expert_id = ANY($1::text[]::uuid[])",
+                empty
+            )
+    return len(records)
+
+
+async def index_experts(expert_ids: List[str], conn: Optional[asyncpg.Connection] = None) -> int:
+    """
+    (Re)compute the signatures of some experts.
+
+    Returns:
+        Number of experts indexed (experts without tokens are removed instead)
+    """
+    if not expert_ids:
+        return 0
+    if conn is None:
+        async with get_db() as conn:
+            return await index_experts(expert_ids, conn=conn)
+
+    rows = await execute_query(
+        f"""
+        SELECT {SIGNATURE_SOURCE_COLUMNS}
+        FROM expert_network.experts e
+        WHERE e.id = ANY($1::text[]::uuid[])
+        """,
+        list(expert_ids),
+        fetch_all=True,
+        conn=conn
+    )
+    return await _store_signatures(conn, rows)
+
+
+async def rebuild_similarity_index(
+    full: bool = False,
+    batch_size: int = SIMILARITY_REINDEX_BATCH,
+    conn: Optional[asyncpg.Connection] = None
+) -> Dict[str, int]:
+    """
+    Index every expert whose signature is missing or stale (all when full).
+
+    Walks experts in id order, batch_size at a time, so it can run against
+    a live database.
+
+    Returns:
+        Counts: scanned experts and indexed experts
+    """
+    if conn is None:
+        # Spans every campaign, so it runs as the maintenance role
+        async with get_maintenance_db() as conn:
+            return await rebuild_similarity_index(full, batch_size, conn=conn)
+
+    scanned = indexed = 0
+    after = "00000000-0000-0000-0000-000000000000"
+    while True:
+        rows = await execute_query(
+            f"""
+            SELECT {SIGNATURE_SOURCE_COLUMNS}
+            FROM expert_network.experts e
+            LEFT JOIN expert_network.expert_skill_signatures s ON s.expert_id = e.id
+            WHERE e.id > $1::uuid
+              AND ($2 OR s.source_updated_at IS DISTINCT FROM e.updated_at)
+            ORDER BY e.id
+            LIMIT $3
+            """,
+            after, full, batch_size,
+            fetch_all=True,
+            conn=conn
+        )
+        if not rows:
+            break
+        scanned += len(rows)
+        indexed += await _store_signatures(conn, rows)
+        after = rows[-1]["id"]
+    return {"scanned": scanned, "indexed": indexed}
+
+
+async def similar_experts(
+    expert_id: str,
+    user_id: str,
+    limit: int = 20,
+    min_similarity: float = 0.0,
+    conn: Optional[asyncpg.Connection] = None
+) -> Optional[List[Tuple[str, float]]]:
+    """
+    Experts most similar to one expert, across all of the user's campaigns.
+
+    A missing or stale signature for the probe expert is computed (and
+    stored) on the spot; candidates are read from the index as it is.
+    Experts below a similarity of about 0.5 are rarely candidates (see the
+    band probabilities above), whatever min_similarity is.
+
+    Returns:
+        (expert_id, estimated Jaccard similarity) pairs, most similar
+        first, or None when the expert does not exist or is not owned
+    """
+    if conn is None:
+        async with get_db() as conn:
+            return await similar_experts(expert_id, user_id, limit, min_similarity, conn=conn)
+
+    probe = await execute_query(
+        f"""
+        SELECT {SIGNATURE_SOURCE_COLUMNS}, s.signature, s.bands, s.source_updated_at
+        FROM expert_network.experts e
+        JOIN expert_network.campaigns c ON c.id = e.campaign_id
+        LEFT JOIN expert_network.expert_skill_signatures s ON s.expert_id = e.id
+        WHERE e.id = $1 AND c.user_id = $2
+        """,
+        expert_id, user_id,
+        fetch_one=True,
+        conn=conn
+    )
+    if not probe:
+        return None
+
+    if probe["signature"] is not None and probe["source_updated_at"] == probe["updated_at"]:
+        values, bands = probe["signature"], probe["bands"]
+    else:
+        record = _signature_record(probe)
+        await _store_signatures(conn, [probe])
+        if record is None:
+            return []
+        values, bands = record[2], record[3]
+
+    rows = await execute_query(
+        SIMILAR_EXPERTS_QUERY,
+        expert_id, user_id, values, bands,
+        max(1, math.ceil(min_similarity * SIGNATURE_SIZE)), limit, SIMILARITY_MAX_CANDIDATES,
+        fetch_all=True,
+        conn=conn
+    )
+    return [(row["expert_id"], row["matches"] / SIGNATURE_SIZE) for row in rows]
+
+
+# Strong references to in-flight background runs (the loop keeps only weak ones)
+_background: Set[asyncio.Task] = set()
+
+
+async def _index_quietly(expert_ids: List[str]):
+    try:
+        await index_experts(expert_ids)
+    except Exception as e:
+        print(f"[DB] WARNING: Similarity indexing failed for {len(expert_ids)} experts: {e}")
+
+
+def schedule_similarity_index(expert_ids: List[str]):
+    """
+    Index new or changed experts in the background (no-op when SIMILARITY_INDEX_ON_WRITE is off).
+
+    Call it after the write has committed, e.g. from FastAPI BackgroundTasks:
+    the run uses its own connection and would index the old row otherwise.
+    """
+    if SIMILARITY_INDEX_ON_WRITE and expert_ids:
+        task = asyncio.get_running_loop().create_task(_index_quietly(list(expert_ids)))
+        _background.add(task)
+        task.add_done_callback(_background.discard)
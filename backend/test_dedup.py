@@ -0,0 +1,186 @@
+"""
+Unit tests for the cross-vendor expert matcher (dedup.py).
+
+Covers pair scoring, blocking and clustering; no database needed.
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+import dedup
+from dedup import Candidate, DEDUP_MATCH_THRESHOLD, candidate_pairs, cluster, score_pair
+
+T0 = datetime(2026, 1, 1)
+
+
+def make_candidate(expert_id, vendor_id, name, company=None, skills=None, keys=None, minutes=0):
+    """A Candidate from a row shaped like CANDIDATE_COLUMNS (names already normalized)."""
+    return Candidate({
+        "id": expert_id,
+        "vendor_platform_id": vendor_id,
+        "created_at": T0 + timedelta(minutes=minutes),
+        "norm_name": name,
+        "company": company,
+        "skills": skills,
+        "name_keys": keys if keys is not None else name.split(),
+    })
+
+
+def test_score_pair_same_vendor_is_zero():
+    """Proposals from one vendor are never duplicates of each other."""
+    a = make_candidate("a", "glg", "sarah chen", "Acme Inc")
+    b = make_candidate("b", "glg", "sarah chen", "Acme Inc")
+    assert score_pair(a, b) == 0.0
+    print("✓ Same-vendor pairs score 0")
+
+
+def test_score_pair_reordered_name_matches():
+    """Token order, initials and company suffixes do not matter."""
+    a = make_candidate("a", "glg", "chen sarah j", "Acme Inc.", ["Supply Chain", "Logistics"])
+    b = make_candidate("b", "alphasights", "sarah chen", "ACME Corporation", ["logistics", "supply chain"])
+    score = score_pair(a, b)
+    assert score == 1.0
+    assert score >= DEDUP_MATCH_THRESHOLD
+    print(f"✓ Reordered name matches (score {score:.2f})")
+
+
+def test_score_pair_dissimilar_names_is_zero():
+    """Names below DEDUP_MIN_NAME_SIMILARITY short-circuit, whatever the company."""
+    a = make_candidate("a", "glg", "sarah chen", "Acme")
+    b = make_candidate("b", "guidepoint", "michael okafor", "Acme")
+    assert score_pair(a, b) == 0.0
+    print("✓ Dissimilar names score 0")
+
+
+def test_score_pair_renormalizes_missing_features():
+    """Without company or skills on both sides, the score is the name similarity."""
+    a = make_candidate("a", "glg", "sarah chen", "Acme")
+    b = make_candidate("b", "guidepoint", "sarah chen")
+    assert score_pair(a, b) == 1.0
+
+    c = make_candidate("c", "third_bridge", "sarah chen", "Globex")
+    different_company = score_pair(a, c)
+    assert 0.0 < different_company < 1.0
+    assert score_pair(c, a) == different_company
+    print("✓ Missing features are left out of the weighting")
+
+
+def test_candidate_pairs_blocks_on_shared_keys():
+    """Pairs share a name key, skip same-vendor pairs and are emitted once."""
+    candidates = [
+        make_candidate("1", "glg", "sarah chen", keys=["chen", "sarah"]),
+        make_candidate("2", "guidepoint", "sarah chen", keys=["chen", "sarah"]),
+        make_candidate("3", "glg", "sara chen", keys=["chen", "sara"]),
+        make_candidate("4", "guidepoint", "tom baker", keys=["baker", "tom"]),
+    ]
+    pairs = sorted(tuple(sorted((a.id, b.id))) for a, b in candidate_pairs(candidates))
+    # 1-3 share "chen" but come from the same vendor; 4 shares no key
+    assert pairs == [("1", "2"), ("2", "3")]
+    print(f"✓ Blocking yields {len(pairs)} pairs")
+
+
+def test_candidate_pairs_probes_only():
+    """Incremental mode only pairs the probes with the rest."""
+    candidates = [
+        make_candidate("1", "glg", "sarah chen", keys=["chen"]),
+        make_candidate("2", "guidepoint", "sarah chen", keys=["chen"]),
+        make_candidate("3", "third_bridge", "sarah chen", keys=["chen"]),
+    ]
+    probe = candidates[2]
+    pairs = sorted(tuple(sorted((a.id, b.id))) for a, b in candidate_pairs(candidates, probes=[probe]))
+    assert pairs == [("1", "3"), ("2", "3")]
+    print("✓ Probes pair only with their own blocks")
+
+
+def test_candidate_pairs_windows_oversized_blocks():
+    """Blocks over DEDUP_MAX_BLOCK_SIZE are compared within a sorted window."""
+    candidates = [
+        make_candidate(f"{i:02d}", f"vendor-{i}", f"name{i:02d} smith", keys=["smith"])
+        for i in range(10)
+    ]
+    saved = dedup.DEDUP_MAX_BLOCK_SIZE, dedup.DEDUP_WINDOW
+    dedup.DEDUP_MAX_BLOCK_SIZE, dedup.DEDUP_WINDOW = 5, 2
+    try:
+        pairs = list(candidate_pairs(candidates))
+    finally:
+        dedup.DEDUP_MAX_BLOCK_SIZE, dedup.DEDUP_WINDOW = saved
+    # Each candidate against the next two in sort order: 9 + 8 pairs
+    assert len(pairs) == 17
+    print("✓ Oversized blocks use the sorted window")
+
+
+def test_candidate_pairs_windows_oversized_blocks_for_probes():
+    """Probes in an oversized block only meet their sorted neighbours."""
+    candidates = [
+        make_candidate(f"{i:02d}", f"vendor-{i}", f"name{i:02d} smith", keys=["smith"])
+        for i in range(10)
+    ]
+    probe = candidates[5]
+    saved = dedup.DEDUP_MAX_BLOCK_SIZE, dedup.DEDUP_WINDOW
+    dedup.DEDUP_MAX_BLOCK_SIZE, dedup.DEDUP_WINDOW = 5, 2
+    try:
+        pairs = sorted(other.id for _, other in candidate_pairs(candidates, probes=[probe]))
+    finally:
+        dedup.DEDUP_MAX_BLOCK_SIZE, dedup.DEDUP_WINDOW = saved
+    # Two candidates on each side of the probe's sort position
+    assert pairs == ["03", "04", "06", "07"]
+    print("✓ Probes use the sorted window in oversized blocks")
+
+
+def test_cluster_merges_transitively():
+    """a~b and b~c make one group keyed by the earliest proposal."""
+    created_at = {"a": T0 + timedelta(minutes=5), "b": T0, "c": T0 + timedelta(minutes=9), "x": T0}
+    groups = cluster([("a", "b", 0.8), ("b", "c", 0.9)], created_at)
+    assert groups == {"a": ("b", 0.8), "b": ("b", 0.9), "c": ("b", 0.9)}
+    print("✓ Matches merge transitively")
+
+
+def test_cluster_extends_existing_group():
+    """A new match joins the existing group and keeps its identity."""
+    created_at = {"a": T0, "b": T0 + timedelta(minutes=1), "n": T0 + timedelta(minutes=2)}
+    existing = {"a": ("a", 0.85), "b": ("a", 0.85)}
+    groups = cluster([("n", "b", 0.77)], created_at, existing)
+    assert groups == {"a": ("a", 0.85), "b": ("a", 0.85), "n": ("a", 0.77)}
+    print("✓ Existing groups are extended")
+
+
+def test_cluster_without_matches_is_empty():
+    """No matches, no groups (singletons are not stored)."""
+    assert cluster([], {"a": T0}) == {}
+    print("✓ No matches, no groups")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Expert Dedup - Unit Tests")
+    print("=" * 60)
+    print()
+
+    try:
+        test_score_pair_same_vendor_is_zero()
+        test_score_pair_reordered_name_matches()
+        test_score_pair_dissimilar_names_is_zero()
+        test_score_pair_renormalizes_missing_features()
+        test_candidate_pairs_blocks_on_shared_keys()
+        test_candidate_pairs_probes_only()
+        test_candidate_pairs_windows_oversized_blocks()
+        test_candidate_pairs_windows_oversized_blocks_for_probes()
+        test_cluster_merges_transitively()
+        test_cluster_extends_existing_group()
+        test_cluster_without_matches_is_empty()
+
+        print()
+        print("=" * 60)
+        print("✓ All tests passed!")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+    except Exception as e:
+        print(f"\n✗ Error: {e}")
+        import traceback
+        traceback.print_exc()
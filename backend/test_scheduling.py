@@ -0,0 +1,176 @@
+"""
+Unit tests for the interview slot finder (scheduling.py).
+
+Covers the free-interval sweep, slot picking and working hours across
+daylight-saving changes; no database needed.
+"""
+
+import sys
+import os
+import random
+from datetime import datetime, time, timezone
+from zoneinfo import ZoneInfo
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from scheduling import free_intervals, pick_slots, working_intervals
+
+HOUR = 3600.0
+WEEKDAYS = range(5)
+NEW_YORK = ZoneInfo("America/New_York")
+
+
+def utc(*args) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def brute_force_free(required, blocked, horizon):
+    """Reference for free_intervals on an integer grid."""
+    free, open_at = [], None
+    for at in range(horizon + 1):
+        ok = (
+            at < horizon
+            and all(any(start <= at < end for start, end in layer) for layer in required)
+            and not any(start <= at < end for start, end in blocked)
+        )
+        if ok and open_at is None:
+            open_at = at
+        elif not ok and open_at is not None:
+            free.append((open_at, at))
+            open_at = None
+    return free
+
+
+def test_free_intervals_intersects_layers():
+    """Free time is covered by every layer and by no blocked interval."""
+    required = [[(0, 10)], [(5, 20)]]
+    blocked = [(7, 8)]
+    assert free_intervals(required, blocked) == [(5, 7), (8, 10)]
+    print("✓ Layers intersect, blocked time is cut out")
+
+
+def test_free_intervals_merges_overlapping_and_touching():
+    """Overlapping or touching intervals within a layer form one span."""
+    required = [[(5, 10), (0, 5), (8, 12)]]
+    assert free_intervals(required, []) == [(0, 12)]
+    assert free_intervals(required, [(2, 4), (3, 6)]) == [(0, 2), (6, 12)]
+    print("✓ Overlapping and touching intervals merge")
+
+
+def test_free_intervals_empty_layer_has_no_free_time():
+    """An expert with no availability leaves nothing free."""
+    assert free_intervals([[(0, 10)], []], []) == []
+    assert free_intervals([[(0, 10)]], [(0, 10)]) == []
+    print("✓ Empty layer or fully blocked gives no free time")
+
+
+def test_free_intervals_matches_brute_force():
+    """Random cases agree with a point-by-point reference."""
+    rng = random.Random(20260301)
+    horizon = 60
+    for _ in range(300):
+        required = []
+        for _ in range(rng.randint(1, 3)):
+            layer = []
+            for _ in range(rng.randint(0, 4)):
+                start = rng.randint(0, horizon - 1)
+                layer.append((start, rng.randint(start, horizon)))
+            required.append(layer)
+        blocked = []
+        for _ in range(rng.randint(0, 4)):
+            start = rng.randint(0, horizon - 1)
+            blocked.append((start, rng.randint(start, horizon)))
+        assert free_intervals(required, blocked) == brute_force_free(required, blocked, horizon), (required, blocked)
+    print("✓ Sweep matches brute force on 300 random cases")
+
+
+def test_pick_slots_aligns_to_grid():
+    """Slots start on the step grid and fit inside the free interval."""
+    free = [(10, 100)]
+    assert pick_slots(free, 30, 15, 10) == [(15, 45), (45, 75)]
+    print("✓ Slots align to the step grid")
+
+
+def test_pick_slots_stops_at_count_and_skips_short_gaps():
+    """Short gaps are skipped; at most `count` slots are returned, earliest first."""
+    free = [(0, 20), (60, 200)]
+    assert pick_slots(free, 30, 30, 2) == [(60, 90), (90, 120)]
+    assert pick_slots(free, 30, 30, 10) == [(60, 90), (90, 120), (120, 150), (150, 180)]
+    assert pick_slots([], 30, 30, 3) == []
+    print("✓ Slot count and short gaps")
+
+
+def test_working_intervals_weekdays():
+    """Weekend days are skipped; hours are local to the zone."""
+    # Friday 2026-06-05 to Tuesday 2026-06-09 (UTC)
+    horizon = (utc(2026, 6, 5), utc(2026, 6, 9, 23))
+    intervals = working_intervals(horizon, "UTC", time(9), time(17), WEEKDAYS)
+    starts = [datetime.fromtimestamp(start, timezone.utc) for start, _ in intervals]
+    assert [start.strftime("%a %H:%M") for start in starts] == [
+        "Thu 09:00", "Fri 09:00", "Mon 09:00", "Tue 09:00"
+    ]
+    assert all(end - start == 8 * HOUR for start, end in intervals)
+    print("✓ Working hours skip weekends")
+
+
+def test_working_intervals_across_spring_forward():
+    """09:00-17:00 New York stays local across the March DST change."""
+    # DST starts Sunday 2026-03-08; Friday before and Monday after
+    horizon = (utc(2026, 3, 6), utc(2026, 3, 10))
+    intervals = working_intervals(horizon, "America/New_York", time(9), time(17), WEEKDAYS)
+    by_day = {
+        datetime.fromtimestamp(start, NEW_YORK).date().isoformat(): (start, end)
+        for start, end in intervals
+    }
+    friday, monday = by_day["2026-03-06"], by_day["2026-03-09"]
+    assert friday[0] == utc(2026, 3, 6, 14)   # EST, UTC-5
+    assert monday[0] == utc(2026, 3, 9, 13)   # EDT, UTC-4
+    assert friday[1] - friday[0] == monday[1] - monday[0] == 8 * HOUR
+    print("✓ Working hours follow the spring-forward change")
+
+
+def test_working_intervals_overnight_across_fall_back():
+    """An overnight shift spanning the November change is one hour longer."""
+    # DST ends Sunday 2026-11-01 at 02:00 local
+    horizon = (utc(2026, 10, 31, 12), utc(2026, 11, 1, 12))
+    intervals = working_intervals(horizon, "America/New_York", time(22), time(6), range(7))
+    by_day = {
+        datetime.fromtimestamp(start, NEW_YORK).date().isoformat(): (start, end)
+        for start, end in intervals
+    }
+    start, end = by_day["2026-10-31"]
+    assert start == utc(2026, 11, 1, 2)       # 22:00 EDT
+    assert end == utc(2026, 11, 1, 11)        # 06:00 EST
+    assert end - start == 9 * HOUR
+    print("✓ Overnight hours span the fall-back change")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Interview Scheduling - Unit Tests")
+    print("=" * 60)
+    print()
+
+    try:
+        test_free_intervals_intersects_layers()
+        test_free_intervals_merges_overlapping_and_touching()
+        test_free_intervals_empty_layer_has_no_free_time()
+        test_free_intervals_matches_brute_force()
+        test_pick_slots_aligns_to_grid()
+        test_pick_slots_stops_at_count_and_skips_short_gaps()
+        test_working_intervals_weekdays()
+        test_working_intervals_across_spring_forward()
+        test_working_intervals_overnight_across_fall_back()
+
+        print()
+        print("=" * 60)
+        print("✓ All tests passed!")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+    except Exception as e:
+        print(f"\n✗ Error: {e}")
+        import traceback
+        traceback.print_exc()
@@ -0,0 +1,135 @@
+"""
+Unit tests for the skill similarity index (similarity.py).
+
+Signatures and band keys are stored and compared across workers, so they
+must be deterministic: same tokens, same values, in any process. No
+database needed.
+"""
+
+import sys
+import os
+import subprocess
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from similarity import BAND_ROWS, NUM_BANDS, SIGNATURE_SIZE, band_keys, expert_tokens, signature
+
+TOKENS = expert_tokens(
+    ["Supply Chain", "Healthcare IT", "Logistics"],
+    "VP of Operations",
+    "Ran procurement and logistics for a hospital network",
+)
+
+# Prints the signature and band keys of TOKENS from a fresh interpreter
+_CHILD = """
+import sys
+sys.path.insert(0, {path!r})
+from similarity import band_keys, signature
+values = signature({tokens!r})
+print(values.tolist())
+print(band_keys(values).tolist())
+"""
+
+
+def test_expert_tokens():
+    """Whole skill phrases plus keywords; stopwords dropped, phrases kept intact."""
+    assert "skill:healthcare it" in TOKENS
+    assert "skill:supply chain" in TOKENS
+    assert {"supply", "chain", "healthcare", "logistics", "vp", "operations", "procurement"} <= TOKENS
+    assert "it" not in TOKENS and "of" not in TOKENS
+    assert expert_tokens(None, None, None) == set()
+    print(f"✓ Tokenizer yields {len(TOKENS)} tokens")
+
+
+def test_signature_shape_and_empty():
+    """SIGNATURE_SIZE uint32 values; no signature for an empty token set."""
+    values = signature(TOKENS)
+    assert values.shape == (SIGNATURE_SIZE,)
+    assert values.dtype == np.uint32
+    assert signature(set()) is None
+    print("✓ Signature shape and empty set")
+
+
+def test_signature_is_deterministic():
+    """Same token set in any order gives the same signature."""
+    first = signature(set(TOKENS))
+    second = signature(set(sorted(TOKENS, reverse=True)))
+    assert np.array_equal(first, second)
+    print("✓ Signature is order independent")
+
+
+def test_signature_is_stable_across_processes():
+    """Another interpreter (different PYTHONHASHSEED) computes identical values."""
+    values = signature(TOKENS)
+    env = dict(os.environ, PYTHONHASHSEED="12345")
+    child = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(path=os.path.dirname(os.path.abspath(__file__)), tokens=TOKENS)],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    child_values, child_keys = child.stdout.strip().splitlines()[-2:]
+    assert child_values == str(values.tolist())
+    assert child_keys == str(band_keys(values).tolist())
+    print("✓ Signature and band keys match across processes")
+
+
+def test_band_keys_shape_and_determinism():
+    """NUM_BANDS int64 keys, equal for equal signatures."""
+    values = signature(TOKENS)
+    keys = band_keys(values)
+    assert keys.shape == (NUM_BANDS,)
+    assert keys.dtype == np.int64
+    assert np.array_equal(keys, band_keys(values.copy()))
+    print("✓ Band keys shape and determinism")
+
+
+def test_band_keys_change_only_with_their_band():
+    """Changing one signature position changes exactly that band's key."""
+    values = signature(TOKENS)
+    changed = values.copy()
+    position = 7
+    changed[position] ^= np.uint32(1)
+    differs = band_keys(values) != band_keys(changed)
+    assert differs.tolist() == [band == position // BAND_ROWS for band in range(NUM_BANDS)]
+    print("✓ Band keys depend only on their own rows")
+
+
+def test_signature_agreement_estimates_jaccard():
+    """The share of equal positions tracks the Jaccard similarity of the sets."""
+    base = {f"token{i}" for i in range(100)}
+    for shared in (100, 60, 20):
+        other = {f"token{i}" for i in range(100 - shared, 200 - shared)}
+        jaccard = len(base & other) / len(base | other)
+        agreement = float(np.mean(signature(base) == signature(other)))
+        assert abs(agreement - jaccard) < 0.15, (shared, agreement, jaccard)
+    print("✓ Signature agreement estimates Jaccard similarity")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Skill Similarity - Unit Tests")
+    print("=" * 60)
+    print()
+
+    try:
+        test_expert_tokens()
+        test_signature_shape_and_empty()
+        test_signature_is_deterministic()
+        test_signature_is_stable_across_processes()
+        test_band_keys_shape_and_determinism()
+        test_band_keys_change_only_with_their_band()
+        test_signature_agreement_estimates_jaccard()
+
+        print()
+        print("=" * 60)
+        print("✓ All tests passed!")
+        print("=" * 60)
+
+    except AssertionError as e:
+        print(f"\n✗ Test failed: {e}")
+    except Exception as e:
+        print(f"\n✗ Error: {e}")
+        import traceback
+        traceback.print_exc()
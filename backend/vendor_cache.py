@@ -0,0 +1,208 @@
+"""
+Process-wide cache of the vendor platform catalog.
+
+Vendor platforms are seeded with the schema and rarely change, so every
+worker keeps the whole table in memory:
+
+- The catalog is loaded at startup and reloaded once older than
+  `VENDOR_CACHE_TTL_SECONDS`.
+- A dedicated connection LISTENs on `vendor_platforms_changed` (see
+  migrations/009_vendor_platforms_notify.sql). Any write to the table then
+  triggers a reload within milliseconds. If that connection drops, it is
+  re-established with backoff and the catalog is reloaded in full, since
+  notifications sent while disconnected are lost. It is skipped in
+  PgBouncer mode, where LISTEN does not survive transaction pooling, and
+  then the TTL alone applies.
+- The active-vendor list and each vendor are validated through
+  `VendorPlatformResponse` once per reload and pre-rendered to JSON (the
+  list with a strong ETag), so the vendor endpoints can answer from memory
+  or with a bodyless 304.
+
+Endpoints that only need a vendor's name/logo can call `get()` instead of
+querying or joining `vendor_platforms`.
+
+Usage:
+    from vendor_cache import get_vendor_catalog
+
+    catalog = get_vendor_catalog()
+    await catalog.ensure_fresh()
+    vendor = catalog.get(vendor_id)
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import asyncpg
+
+from db import ASYNCPG_URL, DB_PGBOUNCER_MODE, get_db
+from fast_json import dumps
+from http_cache import make_etag
+from models.vendor import VendorPlatformResponse
+
+
+VENDOR_CACHE_TTL_SECONDS = float(os.getenv('VENDOR_CACHE_TTL_SECONDS', '300'))
+VENDOR_CACHE_LISTEN = os.getenv('VENDOR_CACHE_LISTEN', 'true').lower() == 'true'
+
+# Cache-Control max-age for GET /api/vendors responses
+VENDOR_CACHE_MAX_AGE_SECONDS = int(os.getenv('VENDOR_CACHE_MAX_AGE_SECONDS', '60'))
+
+# NOTIFY channel raised by the vendor_platforms trigger
+VENDOR_CHANNEL = "vendor_platforms_changed"
+
+# Listener reconnect backoff bounds (seconds)
+_RECONNECT_MIN = 0.5
+_RECONNECT_MAX = 30.0
+
+# The VendorPlatformResponse fields, in response order
+VENDOR_COLUMNS = """
+    id, name, logo_url, location, overall_score, avg_cost_per_call_min,
+    avg_cost_per_call_max, description, tags, is_active, created_at, updated_at
+"""
+
+# Strong references to in-flight notify reloads (the loop keeps only weak ones)
+_background: Set[asyncio.Task] = set()
+
+
+class VendorCatalog:
+    """In-memory vendor_platforms table with a pre-rendered active list."""
+
+    def __init__(self, ttl_seconds: float = VENDOR_CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._json_by_id: Dict[str, bytes] = {}
+        self._active: List[Dict[str, Any]] = []
+        self.body = b"[]"
+        self.etag = make_etag(self.body)
+        self.loaded_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._listener: Optional[asyncpg.Connection] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def refresh(self):
+        """Reload the catalog from Postgres."""
+        async with get_db() as conn:
+            rows = await conn.fetch(
+                f"SELECT {VENDOR_COLUMNS} FROM expert_network.vendor_platforms ORDER BY name"
+            )
+
+        vendors = [dict(row) for row in rows]
+        active = [v for v in vendors if v["is_active"]]
+        # Validated here once instead of by the response model on every request
+        rendered = {
+            v["id"]: VendorPlatformResponse.model_validate(v).model_dump(mode="json")
+            for v in vendors
+        }
+        body = dumps([rendered[v["id"]] for v in active])
+
+        # Swap everything at once; readers never see a half-built catalog
+        self._by_id = {v["id"]: v for v in vendors}
+        self._json_by_id = {vendor_id: dumps(vendor) for vendor_id, vendor in rendered.items()}
+        self._active = active
+        self.body = body
+        self.etag = make_etag(body)
+        self.loaded_at = time.monotonic()
+
+    def is_stale(self) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.loaded_at >= self.ttl_seconds
+
+    async def ensure_fresh(self):
+        """Reload if the TTL has lapsed (one reload at a time)."""
+        if not self.is_stale():
+            return
+        async with self._lock:
+            if self.is_stale():
+                await self.refresh()
+
+    def get(self, vendor_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Vendor row by id (active or not), or None."""
+        return self._by_id.get(str(vendor_id)) if vendor_id is not None else None
+
+    def get_json(self, vendor_id: str) -> Optional[bytes]:
+        """Pre-rendered VendorPlatformResponse JSON by id, or None."""
+        return self._json_by_id.get(str(vendor_id))
+
+    def active(self) -> List[Dict[str, Any]]:
+        """Active vendors sorted by name."""
+        return self._active
+
+    def _on_notify(self, connection, pid, channel, payload):
+        # Force the next ensure_fresh() to reload, and reload now in the background
+        self.loaded_at = None
+        task = asyncio.get_running_loop().create_task(self._refresh_quietly())
+        _background.add(task)
+        task.add_done_callback(_background.discard)
+
+    async def _refresh_quietly(self):
+        try:
+            await self.ensure_fresh()
+        except Exception as e:
+            print(f"[DB] WARNING: Could not refresh vendor catalog: {e}")
+
+    async def _connect(self):
+        listener = await asyncpg.connect(ASYNCPG_URL)
+        await listener.add_listener(VENDOR_CHANNEL, self._on_notify)
+        listener.add_termination_listener(self._on_terminated)
+        self._listener = listener
+
+    def _on_terminated(self, connection):
+        if self._stopping or connection is not self._listener:
+            return
+        print("[DB] WARNING: Vendor catalog listener disconnected, reconnecting")
+        self._listener = None
+        self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self):
+        delay = _RECONNECT_MIN
+        while not self._stopping:
+            try:
+                await self._connect()
+            except Exception as e:
+                print(f"[DB] WARNING: Vendor catalog listener reconnect failed: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _RECONNECT_MAX)
+                continue
+            print("[DB] Vendor catalog listener reconnected")
+            # Changes made while disconnected were never notified
+            self.loaded_at = None
+            await self._refresh_quietly()
+            return
+
+    async def start(self):
+        """Load the catalog and subscribe to change notifications."""
+        try:
+            await self.refresh()
+            print(f"[DB] Vendor catalog loaded: {len(self._by_id)} vendors")
+        except Exception as e:
+            print(f"[DB] WARNING: Could not load vendor catalog: {e}")
+
+        if not VENDOR_CACHE_LISTEN or DB_PGBOUNCER_MODE:
+            return
+        try:
+            await self._connect()
+        except Exception as e:
+            self._listener = None
+            print(f"[DB] WARNING: Vendor catalog LISTEN unavailable, using TTL only: {e}")
+
+    async def stop(self):
+        """Close the LISTEN connection."""
+        self._stopping = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+        if self._listener is not None:
+            await self._listener.close()
+            self._listener = None
+
+
+# Singleton catalog
+_catalog: Optional[VendorCatalog] = None
+
+
+def get_vendor_catalog() -> VendorCatalog:
+    """Get the process-wide vendor catalog."""
+    global _catalog
+    if _catalog is None:
+        _catalog = VendorCatalog()
+    return _catalog
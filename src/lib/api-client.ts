@@ -458,6 +458,9 @@ export interface Expert {
 export interface ExpertListResponse {
   experts: Expert[];
   total: number;
+  limit?: number;
+  has_more?: boolean;
+  next_cursor?: string | null;
 }
 
 export interface ExpertScreeningResponse {
@@ -470,19 +473,72 @@ export interface ExpertScreeningResponse {
   created_at: string;
 }
 
-export async function getExperts(params: {
+export async function getExpertsPage(params: {
   campaign_id: string;
   status?: string;
   vendor_id?: string;
+  limit?: number;
+  cursor?: string;
+  include_total?: boolean;
 }): Promise<ExpertListResponse> {
   const queryParams = new URLSearchParams({
     campaign_id: params.campaign_id,
     ...(params.status && { status: params.status }),
     ...(params.vendor_id && { vendor_id: params.vendor_id }),
+    ...(params.limit && { limit: String(params.limit) }),
+    ...(params.cursor && { cursor: params.cursor }),
+    ...(params.include_total && { include_total: 'true' }),
   });
   return apiRequest<ExpertListResponse>(`/api/experts?${queryParams}`);
 }
 
+// Fetches every page of experts (follows next_cursor) for callers that need the full list
+export async function getExperts(params: {
+  campaign_id: string;
+  status?: string;
+  vendor_id?: string;
+}): Promise<ExpertListResponse> {
+  const first = await getExpertsPage({ ...params, include_total: true });
+  const experts = [...first.experts];
+  let cursor = first.next_cursor;
+  while (cursor) {
+    const page = await getExpertsPage({ ...params, cursor });
+    experts.push(...page.experts);
+    cursor = page.next_cursor;
+  }
+  return { ...first, experts, total: first.total ?? experts.length, has_more: false, next_cursor: null };
+}
+
+export interface ExpertSearchResult extends Expert {
+  score: number;
+  highlights: Record<string, string>;
+}
+
+export interface ExpertSearchResponse {
+  query: string;
+  results: ExpertSearchResult[];
+  page: number;
+  limit: number;
+  has_more: boolean;
+}
+
+export async function searchExperts(params: {
+  q: string;
+  campaign_id?: string;
+  status?: string;
+  page?: number;
+  limit?: number;
+}): Promise<ExpertSearchResponse> {
+  const queryParams = new URLSearchParams({
+    q: params.q,
+    ...(params.campaign_id && { campaign_id: params.campaign_id }),
+    ...(params.status && { status: params.status }),
+    ...(params.page && { page: String(params.page) }),
+    ...(params.limit && { limit: String(params.limit) }),
+  });
+  return apiRequest<ExpertSearchResponse>(`/api/experts/search?${queryParams}`);
+}
+
 export async function getExpert(expertId: string): Promise<Expert> {
   return apiRequest<Expert>(`/api/experts/${expertId}`);
 }